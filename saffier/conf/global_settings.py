@@ -23,6 +23,7 @@ class SaffierSettings(BaseSettings):
             "backend": "saffier.core.files.storage.filesystem.FileSystemStorage",
         }
     }
+    storage_thread_limit: int = 8
 
     use_tz: bool = True
     preloads: list[str] | tuple[str, ...] = ()
@@ -51,6 +52,15 @@ class SaffierSettings(BaseSettings):
     default_related_lookup_field: str = "id"
     orm_concurrency_enabled: bool = True
     orm_concurrency_limit: int | None = None
+    prefetch_chunk_size: int | None = 1000
+    bulk_update_batch_size: int | None = None
+    statement_cache_size: int | None = 512
+    schema_table_cache_size: int | None = 4096
+    use_schema_translate_map: bool = False
+    identity_map_size: int | None = 10000
+    cross_db_lookup_chunk_size: int | None = 1000
+    permission_cache_size: int | None = 1024
+    permission_cache_ttl: float | None = 300.0
     filter_operators: ClassVar[dict[str, str]] = {
         "exact": "__eq__",
         "iexact": "ilike",
@@ -412,7 +412,8 @@ class AdminSite:
         table, however, needs total records and total pages to render its
         pagination controls. This method calculates those values from the same
         filtered queryset used for the page so the numbers match what the
-        operator is seeing.
+        operator is seeing. The paginator reads the total from the page query
+        where the database allows it and caches it for the page count.
 
         Args:
             model_name: Registry name for the model being listed.
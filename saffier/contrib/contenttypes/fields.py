@@ -17,6 +17,7 @@ class ContentTypeField(ForeignKey):
         no_constraint: bool = False,
         remove_referenced: bool = True,
         use_model_based_deletion: bool = False,
+        shared: bool = False,
         **kwargs: Any,
     ) -> None:
         for argument in ("unique", "null"):
@@ -25,8 +26,13 @@ class ContentTypeField(ForeignKey):
                     f"Declaring `{argument}` on a ContentTypeField has no effect."
                 )
 
-        kwargs["unique"] = True
+        # A shared content type identifies the model, so rows point at the same
+        # one and deleting a row must leave it alone.
+        if shared:
+            remove_referenced = False
+        kwargs["unique"] = not shared
         kwargs["null"] = False
+        self.shared = shared
         self.remove_referenced = remove_referenced
         self.use_model_based_deletion = use_model_based_deletion
         super().__init__(
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from typing import TYPE_CHECKING
 
 import saffier
+from saffier.core.connection.replicas import track_writes
+from saffier.core.connection.timeouts import query_deadline
+from saffier.core.db.identity import identity_map
 
 if TYPE_CHECKING:
     from saffier.conf.global_settings import SaffierSettings
@@ -17,6 +22,18 @@ class SaffierMiddleware:
     Lilya dispatch. The middleware is intentionally small: Lilya owns the ASGI
     route stack, Saffier owns registry and settings context, and SQLAlchemy
     remains the only database runtime.
+
+    By default the registry is entered and left around every request. With
+    ``lifespan=True`` it is entered once, on ASGI lifespan startup (or on the
+    first request when the server sends no lifespan events), and left on
+    lifespan shutdown; requests then only install the context variables.
+
+    With ``identity_map`` enabled, every request also gets its own
+    ``IdentityMap``, so the rows it loads resolve to one instance each.
+    Handlers persist the tracked changes with ``get_identity_map().flush()``.
+    With ``query_deadline`` set, all the queries of a request share that many
+    seconds. Every request tracks its writes for the read-your-writes window
+    of read replicas, including the writes of tasks it spawns.
     """
 
     def __init__(
@@ -25,6 +42,9 @@ class SaffierMiddleware:
         registry: Registry | None = None,
         settings: SaffierSettings | None = None,
         wrap_asgi_app: bool = True,
+        identity_map: bool | int = False,
+        lifespan: bool = False,
+        query_deadline: float | None = None,
     ) -> None:
         """Configure request-time registry and settings binding.
 
@@ -38,8 +58,21 @@ class SaffierMiddleware:
                 context. Set this to ``False`` when an outer layer already owns
                 registry lifecycle but request-local Monkay state is still
                 desired.
+            identity_map: Whether to scope an identity map to each request. An
+                integer enables it with that many tracked instances at most
+                instead of the ``identity_map_size`` setting.
+            lifespan: Whether to keep the registry connected from lifespan
+                startup to shutdown instead of entering it per request.
+            query_deadline: Seconds every request may spend running queries,
+                in total. Statements still running at the deadline are
+                cancelled.
         """
         self.app = app
+        self.identity_map = identity_map
+        self.lifespan = lifespan
+        self.query_deadline = query_deadline
+        self._lifespan_stack: contextlib.AsyncExitStack | None = None
+        self._startup_lock = asyncio.Lock()
         self.registry = registry if registry is not None and wrap_asgi_app else None
         self.overwrite: dict[str, object] = {}
 
@@ -60,11 +93,84 @@ class SaffierMiddleware:
             await self._call_with_overwrite(scope, receive, send)
             return
 
+        if self.lifespan:
+            if scope["type"] == "lifespan":
+                await self._handle_lifespan(scope, receive, send)
+                return
+            if self._lifespan_stack is None:
+                await self.startup()
+            await self._call_with_overwrite(scope, receive, send)
+            return
+
         async with self.registry:
             await self._call_with_overwrite(scope, receive, send)
 
+    async def startup(self) -> None:
+        """Enter the registry for the lifetime of the application.
+
+        Calling it again while the registry is entered does nothing.
+        """
+        async with self._startup_lock:
+            if self._lifespan_stack is not None or self.registry is None:
+                return
+            stack = contextlib.AsyncExitStack()
+            await stack.enter_async_context(self.registry)
+            self._lifespan_stack = stack
+
+    async def shutdown(self) -> None:
+        """Leave the registry entered by `startup()`."""
+        stack, self._lifespan_stack = self._lifespan_stack, None
+        if stack is not None:
+            await stack.aclose()
+
+    async def _handle_lifespan(self, scope, receive, send) -> None:
+        """Forward lifespan events, connecting on startup and closing on shutdown.
+
+        Args:
+            scope: ASGI lifespan scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
+        """
+
+        async def receive_lifespan():
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self.startup()
+            return message
+
+        async def send_lifespan(message) -> None:
+            if message["type"] in {
+                "lifespan.startup.failed",
+                "lifespan.shutdown.complete",
+                "lifespan.shutdown.failed",
+            }:
+                await self.shutdown()
+            await send(message)
+
+        try:
+            await self._dispatch(scope, receive_lifespan, send_lifespan)
+        finally:
+            await self.shutdown()
+
     async def _call_with_overwrite(self, scope, receive, send) -> None:
-        """Dispatch downstream with optional Monkay overrides.
+        """Dispatch downstream with the request state and Monkay overrides.
+
+        Args:
+            scope: ASGI connection scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
+        """
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(track_writes())
+            if self.identity_map is not False:
+                maxsize = None if self.identity_map is True else self.identity_map
+                stack.enter_context(identity_map(maxsize))
+            if self.query_deadline is not None:
+                stack.enter_context(query_deadline(self.query_deadline))
+            await self._dispatch(scope, receive, send)
+
+    async def _dispatch(self, scope, receive, send) -> None:
+        """Call the downstream app inside the Monkay overrides, if any.
 
         Args:
             scope: ASGI connection scope.
@@ -1,9 +1,9 @@
 import logging
-import weakref
 from typing import TYPE_CHECKING
 
 import sqlalchemy
 
+from saffier.core.connection.table_cache import SchemaTableCache
 from saffier.core.terminal import Terminal
 
 terminal = Terminal()
@@ -13,24 +13,19 @@ if TYPE_CHECKING:
     from saffier.contrib.multi_tenancy import TenantModel, TenantRegistry
 
 
-_SCHEMA_TABLE_CACHE: "weakref.WeakKeyDictionary[TenantRegistry, dict[str, dict[str, sqlalchemy.Table]]]" = weakref.WeakKeyDictionary()
-
-
 def _build_schema_tables(
     registry: "TenantRegistry", schema: str, target_model: type["TenantModel"]
-) -> dict[str, sqlalchemy.Table]:
-    metadata = sqlalchemy.MetaData(schema=schema)
-    schema_tables: dict[str, sqlalchemy.Table] = {}
+) -> sqlalchemy.MetaData:
+    schema_tables = SchemaTableCache.of(registry)
+    metadata = schema_tables.metadata(schema)
 
-    for model in registry.tenant_models.values():
-        schema_tables[model.table.name] = model.table.to_metadata(metadata, schema=schema)
+    for model in (*registry.tenant_models.values(), target_model):
+        # Ensure non-registered tenant models still get a table clone for this schema.
+        if f"{schema}.{model.table.name}" not in metadata.tables:
+            model.table.to_metadata(metadata, schema=schema)
 
-    # Ensure non-registered tenant models still get a table clone for this schema.
-    schema_tables.setdefault(
-        target_model.table.name,
-        target_model.table.to_metadata(metadata, schema=schema),
-    )
-    return schema_tables
+    schema_tables.track(schema)
+    return metadata
 
 
 def table_schema(model_class: type["TenantModel"], schema: str) -> sqlalchemy.Table:
@@ -38,31 +33,21 @@ def table_schema(model_class: type["TenantModel"], schema: str) -> sqlalchemy.Ta
     Making sure the tables on inheritance state, creates the new
     one properly.
 
-    The use of context vars instead of using the lru_cache comes from
-    a warning from `ruff` where lru can lead to memory leaks.
+    The tables are kept in the registry `schema_table_cache`, shared with
+    `Model.table_schema` and bounded by the `schema_table_cache_size` setting,
+    so every tenant model is cloned at most once per cached schema.
     """
     registry = model_class.meta.registry
-    if registry not in _SCHEMA_TABLE_CACHE:
-        _SCHEMA_TABLE_CACHE[registry] = {}
-
-    table_name = model_class.table.name
-    registry_cache = _SCHEMA_TABLE_CACHE[registry]
-    if schema not in registry_cache:
-        registry_cache[schema] = _build_schema_tables(
+    table_key = f"{schema}.{model_class.table.name}"
+    table = SchemaTableCache.of(registry).get_table(schema, table_key)
+    if table is None:
+        metadata = _build_schema_tables(
             registry=registry,
             schema=schema,
             target_model=model_class,
         )
-    cached_tables = registry_cache[schema]
-    if table_name not in cached_tables:
-        registry_cache[schema] = _build_schema_tables(
-            registry=registry,
-            schema=schema,
-            target_model=model_class,
-        )
-        cached_tables = registry_cache[schema]
-
-    return cached_tables[table_name]
+        table = metadata.tables[table_key]
+    return table
 
 
 async def create_tables(
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import sys
+from collections import OrderedDict
 from collections.abc import AsyncGenerator, Hashable, Iterable
 from dataclasses import asdict, dataclass
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
+import sqlalchemy
+
+from saffier.core.utils.concurrency import run_concurrently
+from saffier.core.utils.db import check_db_connection
+
 if TYPE_CHECKING:
     from saffier.core.db.querysets.base import QuerySet
 
@@ -37,6 +43,25 @@ class Page(BasePage):
 PageType = TypeVar("PageType", bound=BasePage)
 
 
+class PageCache(OrderedDict[Hashable, PageType]):
+    """Page cache keeping the `maxsize` most recently used pages."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key: Hashable) -> PageType:
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: PageType) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
 class BasePaginator(Generic[PageType]):
     order_by: tuple[str, ...]
 
@@ -46,6 +71,8 @@ class BasePaginator(Generic[PageType]):
         page_size: int,
         next_item_attr: str = "",
         previous_item_attr: str = "",
+        approximate_count: bool = False,
+        cache_size: int = 128,
     ) -> None:
         self._reverse_paginator: Self | None = None
         self.page_size = int(page_size)
@@ -56,14 +83,18 @@ class BasePaginator(Generic[PageType]):
 
         self.next_item_attr = next_item_attr
         self.previous_item_attr = previous_item_attr
+        self.approximate_count = approximate_count
         self.queryset = (
             queryset.all() if (self.previous_item_attr or self.next_item_attr) else queryset
         )
         self.order_by = tuple(queryset._order_by)
-        self._page_cache: dict[Hashable, PageType] = {}
+        self.cache_size = cache_size
+        self._page_cache: PageCache[PageType] = PageCache(cache_size)
+        self._total: int | None = None
 
     def clear_caches(self) -> None:
         self._page_cache.clear()
+        self._total = None
         if self._reverse_paginator:
             self._reverse_paginator = None
 
@@ -74,7 +105,51 @@ class BasePaginator(Generic[PageType]):
         return count + (1 if remainder else 0)
 
     async def get_total(self) -> int:
-        return await self.queryset.count()
+        if self._total is None:
+            total = await self.get_estimated_total() if self.approximate_count else None
+            self._total = await self.queryset.count() if total is None else total
+        return self._total
+
+    async def get_estimated_total(self) -> int | None:
+        # Planner estimates describe whole tables, so only unfiltered querysets use them.
+        queryset = self.queryset
+        if (
+            queryset.filter_clauses
+            or queryset.or_clauses
+            or queryset._filter_related
+            or queryset._group_by
+            or queryset.distinct_on is not None
+            or queryset.limit_count
+            or queryset._offset
+        ):
+            return None
+
+        database = queryset.database
+        table = queryset.table
+        dialect = database.url.dialect
+        if dialect == "postgresql":
+            expression = sqlalchemy.text(
+                "SELECT reltuples FROM pg_class WHERE oid = to_regclass(:name)"
+            )
+        elif dialect in ("mysql", "mariadb"):
+            expression = sqlalchemy.text(
+                "SELECT table_rows FROM information_schema.tables "
+                "WHERE table_schema = COALESCE(:schema, DATABASE()) AND table_name = :name"
+            )
+        else:
+            return None
+
+        check_db_connection(database)
+        async with database as connection:
+            if dialect == "postgresql":
+                preparer = connection.engine.dialect.identifier_preparer
+                values = {"name": preparer.format_table(table)}
+            else:
+                values = {"schema": table.schema, "name": table.name}
+            estimate = await connection.fetch_val(expression, values)
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
 
     async def get_page(self) -> PageType:  # pragma: no cover
         raise NotImplementedError()
@@ -191,8 +266,11 @@ class BasePaginator(Generic[PageType]):
                 page_size=self.page_size,
                 next_item_attr=self.next_item_attr,
                 previous_item_attr=self.previous_item_attr,
+                approximate_count=self.approximate_count,
+                cache_size=self.cache_size,
             )
             self._reverse_paginator._reverse_paginator = self
+            self._reverse_paginator._total = self._total
         return self._reverse_paginator
 
 
@@ -239,12 +317,33 @@ class NumberedPaginator(BasePaginator[Page]):
             query = query.limit(self.page_size + 1)
 
         return self.convert_to_page(
-            await query,
+            await self._fetch_page(query, offset=offset),
             page=page,
             is_first=offset == 0,
             reverse=reverse,
         )
 
+    async def _fetch_page(self, query: QuerySet, offset: int) -> list[Any]:
+        if self._total is not None or self.approximate_count:
+            return cast(list[Any], await query)
+
+        # The total comes from a `count(*) OVER ()` column of the page query where possible.
+        if query._can_count_over_window():
+            results, total = await query._all_with_total()
+            if total is None and offset == 0:
+                total = 0
+            if total is not None:
+                self._total = total
+            return results
+
+        # Otherwise count concurrently, unless the database is bound to a single connection.
+        bound = query.database._current_connection() is not None
+        results, total = await run_concurrently(
+            [query._all(), self.queryset.count()], limit=1 if bound else None
+        )
+        self._total = cast(int, total)
+        return cast(list[Any], results)
+
     async def get_page(self, page: int = 1) -> Page:
         if page == 0 or not isinstance(page, int):
             raise ValueError(f"Invalid page parameter value: {page!r}")
@@ -1,13 +1,65 @@
 from __future__ import annotations
 
+import base64
+import datetime
+import decimal
+import hashlib
+import hmac
+import uuid
 from collections.abc import AsyncGenerator, Hashable, Iterable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from .base import BasePage, BasePaginator
+import orjson
+import sqlalchemy
+
+from saffier.core.db.querysets.clauses import Q
+
+from .base import BasePage, BasePaginator, PageCache
 
 if TYPE_CHECKING:
     from saffier.core.db.models.base import SaffierBaseModel
+    from saffier.core.db.querysets.base import QuerySet
+
+# Dialects able to compare `(a, b, id) > (:a, :b, :id)` as row values.
+_ROW_VALUE_DIALECTS = {"postgresql", "mysql", "mariadb", "sqlite"}
+
+_CURSOR_TYPES: dict[str, Any] = {
+    "dt": datetime.datetime.fromisoformat,
+    "d": datetime.date.fromisoformat,
+    "t": datetime.time.fromisoformat,
+    "u": uuid.UUID,
+    "n": decimal.Decimal,
+}
+
+
+def _b64encode(value: bytes) -> str:
+    return base64.urlsafe_b64encode(value).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def _dump_cursor_value(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"d": value.isoformat()}
+    if isinstance(value, datetime.time):
+        return {"t": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {"u": str(value)}
+    if isinstance(value, decimal.Decimal):
+        return {"n": str(value)}
+    return value
+
+
+def _load_cursor_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        ((tag, raw),) = value.items()
+        return _CURSOR_TYPES[tag](raw)
+    return value
 
 
 @dataclass
@@ -17,20 +69,37 @@ class CursorPage(BasePage):
 
 
 class CursorPaginator(BasePaginator[CursorPage]):
+    """Keyset paginator seeking from the last seen `order_by` values.
+
+    Pages are read with `WHERE (a, b, id) > (:a, :b, :id)` (or the expanded
+    `OR` form when the directions are mixed) and one look-ahead row, so no
+    page needs an offset, a count or a separate existence query. With
+    `cursor_secret`, cursors are opaque HMAC-signed tokens instead of the raw
+    values.
+    """
+
     def __init__(
         self,
         queryset: Any,
         page_size: int,
         next_item_attr: str = "",
         previous_item_attr: str = "",
+        approximate_count: bool = False,
+        cache_size: int = 128,
+        cursor_secret: str | bytes | None = None,
     ) -> None:
         super().__init__(
             queryset=queryset,
             page_size=page_size,
             next_item_attr=next_item_attr,
             previous_item_attr=previous_item_attr,
+            approximate_count=approximate_count,
+            cache_size=cache_size,
         )
-        self._reverse_page_cache: dict[Hashable, CursorPage] = {}
+        if isinstance(cursor_secret, str):
+            cursor_secret = cursor_secret.encode("utf-8")
+        self.cursor_secret = cursor_secret
+        self._reverse_page_cache: PageCache[CursorPage] = PageCache(cache_size)
         self.search_vector = self.calculate_search_vector()
 
     def calculate_search_vector(self) -> tuple[str, ...]:
@@ -42,7 +111,29 @@ class CursorPaginator(BasePaginator[CursorPage]):
         vector.append(f"{criteria[1:]}__lt" if criteria.startswith("-") else f"{criteria}__gt")
         return tuple(vector)
 
+    def encode_cursor(self, vector: tuple[Hashable, ...]) -> str:
+        payload = orjson.dumps([_dump_cursor_value(value) for value in vector])
+        signature = hmac.new(self.cursor_secret or b"", payload, hashlib.sha256).digest()
+        return f"{_b64encode(payload)}.{_b64encode(signature[:16])}"
+
+    def decode_cursor(self, token: str) -> tuple[Hashable, ...]:
+        try:
+            payload_part, signature_part = token.split(".")
+            payload = _b64decode(payload_part)
+            signature = _b64decode(signature_part)
+        except (AttributeError, ValueError) as exc:
+            raise ValueError(f"Invalid cursor: {token!r}") from exc
+        expected = hmac.new(self.cursor_secret or b"", payload, hashlib.sha256).digest()
+        if not hmac.compare_digest(signature, expected[:16]):
+            raise ValueError(f"Invalid cursor: {token!r}")
+        values = orjson.loads(payload)
+        if not isinstance(values, list) or len(values) != len(self.order_by):
+            raise ValueError(f"Invalid cursor: {token!r}")
+        return tuple(_load_cursor_value(value) for value in values)
+
     def cursor_to_vector(self, cursor: Hashable) -> tuple[Hashable, ...]:
+        if self.cursor_secret is not None:
+            return self.decode_cursor(cursor)  # type: ignore[arg-type]
         if isinstance(cursor, tuple):
             return cursor
         assert len(self.order_by) == 1, (
@@ -52,6 +143,8 @@ class CursorPaginator(BasePaginator[CursorPage]):
         return (cursor,)
 
     def vector_to_cursor(self, vector: tuple[Hashable, ...]) -> Hashable:
+        if self.cursor_secret is not None:
+            return self.encode_cursor(vector)
         if len(self.order_by) > 1:
             return vector
         return vector[0]
@@ -66,6 +159,66 @@ class CursorPaginator(BasePaginator[CursorPage]):
         super().clear_caches()
         self._reverse_page_cache.clear()
 
+    def get_reverse_paginator(self) -> CursorPaginator:
+        if self._reverse_paginator is None:
+            reverse_paginator = super().get_reverse_paginator()
+            reverse_paginator.cursor_secret = self.cursor_secret
+        return self._reverse_paginator  # type: ignore[return-value]
+
+    def seek(
+        self,
+        queryset: QuerySet,
+        vector: tuple[Hashable, ...],
+        *,
+        backward: bool = False,
+        inclusive: bool = False,
+    ) -> QuerySet:
+        """Filter `queryset` to the rows after `vector` in the paginator order.
+
+        `backward` selects the rows before it instead and `inclusive` keeps the
+        row matching `vector` itself.
+        """
+        names = [criteria.lstrip("-") for criteria in self.order_by]
+        descending = [criteria.startswith("-") is not backward for criteria in self.order_by]
+
+        def operator(position: int) -> str:
+            strict = "lt" if descending[position] else "gt"
+            return f"{strict}e" if inclusive and position == len(names) - 1 else strict
+
+        if len(names) == 1:
+            return queryset.filter(**{f"{names[0]}__{operator(0)}": vector[0]})
+
+        # Uniform directions compare as one row value, which a composite index on
+        # the ordering columns serves as a single range scan.
+        columns = [queryset.table.c.get(name) for name in names]
+        if (
+            len(set(descending)) == 1
+            and all(column is not None for column in columns)
+            and queryset.database.url.dialect in _ROW_VALUE_DIALECTS
+        ):
+            left = sqlalchemy.tuple_(*columns)
+            right = sqlalchemy.tuple_(
+                *(
+                    sqlalchemy.bindparam(None, value, type_=column.type)
+                    for column, value in zip(columns, vector, strict=False)
+                )
+            )
+            clause = {
+                "gt": left > right,
+                "gte": left >= right,
+                "lt": left < right,
+                "lte": left <= right,
+            }[operator(len(names) - 1)]
+            return queryset.filter(clause)
+
+        # Mixed directions: (a > x) OR (a = x AND b < y) OR (a = x AND b = y AND id > z).
+        condition: Q | None = None
+        for position, name in enumerate(names):
+            lookups: dict[str, Any] = dict(zip(names[:position], vector[:position], strict=False))
+            lookups[f"{name}__{operator(position)}"] = vector[position]
+            condition = Q(**lookups) if condition is None else condition | Q(**lookups)
+        return queryset.filter(condition)
+
     def convert_to_page(
         self,
         inp: Iterable[Any],
@@ -98,45 +251,30 @@ class CursorPaginator(BasePaginator[CursorPage]):
             **dict(zip(rpaginator.search_vector, vector, strict=False))
         ).exists()
 
-    async def _get_page_after(
-        self,
-        vector: tuple[Hashable, ...] | None,
-        injected_extra: list[SaffierBaseModel] | None = None,
-        reverse: bool = False,
-    ) -> tuple[CursorPage, list[SaffierBaseModel]]:
-        query = self.queryset.limit(self.page_size + 1) if self.page_size else self.queryset
-        if vector is not None:
-            query = query.filter(**dict(zip(self.search_vector, vector, strict=False)))
-
-        is_first = vector is None
-
-        resultarr: list[SaffierBaseModel]
-        if not is_first and self.previous_item_attr:
-            resultarr = (
-                await self.get_extra_before(self.vector_to_cursor(vector))
-                if injected_extra is None
-                else injected_extra
+    async def _get_page_after(self, vector: tuple[Hashable, ...] | None) -> CursorPage:
+        cursor = None if vector is None else self.vector_to_cursor(vector)
+        if vector is None:
+            query = self.queryset.limit(self.page_size + 1) if self.page_size else self.queryset
+            return self.convert_to_page(await query, cursor=cursor, is_first=True)
+
+        # The row at the cursor itself is the previous item of the page, so it is
+        # read by the same query instead of a separate lookup.
+        with_previous = bool(self.previous_item_attr)
+        query = self.seek(self.queryset, vector, inclusive=with_previous)
+        if self.page_size:
+            query = query.limit(self.page_size + 1 + with_previous)
+        resultarr: list[Any] = list(await query)
+
+        if with_previous and (not resultarr or self.obj_to_vector(resultarr[0]) != vector):
+            # The cursor row is gone, so the page starts without a previous item.
+            page_obj = self.convert_to_page(
+                resultarr[: self.page_size + 1] if self.page_size else resultarr,
+                cursor=cursor,
+                is_first=True,
             )
-            if not resultarr:
-                is_first = True
-            resultarr.extend(await query)
-        elif injected_extra is not None:
-            if injected_extra:
-                is_first = False
-            injected_extra.extend(await query)
-            resultarr = injected_extra
-        else:
-            if not is_first and not await self.exists_extra_before(self.vector_to_cursor(vector)):
-                is_first = True
-            resultarr = await query
-
-        page_obj = self.convert_to_page(
-            resultarr,
-            cursor=None if vector is None else self.vector_to_cursor(vector),
-            is_first=is_first,
-            reverse=reverse,
-        )
-        return page_obj, resultarr
+            page_obj.is_first = False
+            return page_obj
+        return self.convert_to_page(resultarr, cursor=cursor, is_first=False)
 
     async def get_page_after(self, cursor: Hashable | None = None) -> CursorPage:
         vector: tuple[Hashable, ...] | None = None
@@ -146,7 +284,7 @@ class CursorPaginator(BasePaginator[CursorPage]):
         if vector in self._page_cache:
             return self._page_cache[vector]
 
-        page_obj = (await self._get_page_after(vector=vector))[0]
+        page_obj = await self._get_page_after(vector=vector)
         self._page_cache[vector] = page_obj
         return page_obj
 
@@ -158,20 +296,23 @@ class CursorPaginator(BasePaginator[CursorPage]):
         if vector in self._reverse_page_cache:
             return self._reverse_page_cache[vector]
 
-        reverse_paginator = self.get_reverse_paginator()
-        new_vector: tuple[Hashable, ...] | None = None
-
-        injected_reverse = (
-            await reverse_paginator.get_extra_before(vector) if vector is not None else []
-        )
-        if injected_reverse:
-            new_vector = self.obj_to_vector(injected_reverse[0])
-
-        reverse_page, raw_array = await reverse_paginator._get_page_after(
-            new_vector,
-            injected_extra=injected_reverse,
-            reverse=True,
+        query = self.queryset.reverse()
+        following: list[Any] = []
+        if vector is not None:
+            query = self.seek(query, vector, backward=True, inclusive=True)
+            if self.next_item_attr:
+                # Only needed to link the last item to the row after the cursor.
+                following = list(await self.seek(self.queryset, vector).limit(1))
+        if self.page_size:
+            query = query.limit(self.page_size + 1)
+
+        raw_array = [*following, *(await query)]
+        reverse_page = self.convert_to_page(
+            raw_array, cursor=None, is_first=not following, reverse=True
         )
+        if vector is not None and not self.next_item_attr:
+            # Rows after the cursor were not read; the cursor marks that they exist.
+            reverse_page.is_last = False
 
         page_obj = CursorPage(
             content=reverse_page.content,
@@ -199,15 +340,16 @@ class CursorPaginator(BasePaginator[CursorPage]):
 
         if start_cursor is not None:
             start_vector = self.cursor_to_vector(start_cursor)
-            query = query.filter(**dict(zip(self.search_vector, start_vector, strict=False)))
+            query = self.seek(query, start_vector)
             if self.previous_item_attr:
-                prefill_container = await self.get_extra_before(start_cursor)
+                prefill_container = list(
+                    await self.seek(
+                        self.queryset.reverse(), start_vector, backward=True, inclusive=True
+                    ).limit(1)
+                )
 
         if stop_cursor is not None:
-            stop_vector = self.cursor_to_vector(stop_cursor)
-            query = query.filter(
-                **dict(zip(self.get_reverse_paginator().search_vector, stop_vector, strict=False))
-            )
+            query = self.seek(query, self.cursor_to_vector(stop_cursor), backward=True)
 
         current_cursor: Hashable | None = (
             None if start_vector is None else self.vector_to_cursor(start_vector)
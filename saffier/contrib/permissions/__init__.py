@@ -1,4 +1,5 @@
+from .cache import PermissionCache, permission_cache
 from .managers import PermissionManager
 from .models import BasePermission
 
-__all__ = ["PermissionManager", "BasePermission"]
+__all__ = ["PermissionCache", "PermissionManager", "BasePermission", "permission_cache"]
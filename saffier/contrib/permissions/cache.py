@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from saffier.conf import settings
+
+PermissionSet = dict[str, frozenset[Any]]
+
+
+class PermissionCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class PermissionCache:
+    """Bounded LRU of the effective permissions of users, with expiry.
+
+    Entries are keyed by permission model, user primary key and the
+    generation of the permission model. `invalidate()` bumps the generation,
+    so sets loaded before a permission, group or membership change are never
+    served afterwards, even when the load finishes after the change.
+
+    The size comes from the `permission_cache_size` setting and the lifetime
+    in seconds from `permission_cache_ttl`, unless `maxsize` or `ttl` are
+    given. A size of `0` disables the cache and a lifetime of `None` keeps
+    entries until they are evicted or invalidated.
+    """
+
+    def __init__(self, maxsize: int | None = None, ttl: float | None = None) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[tuple[Any, Any, int], tuple[float, PermissionSet]] = (
+            OrderedDict()
+        )
+        self._generations: dict[Any, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is not None:
+            return self._maxsize
+        return settings.permission_cache_size or 0
+
+    @property
+    def ttl(self) -> float | None:
+        if self._ttl is not None:
+            return self._ttl
+        return settings.permission_cache_ttl
+
+    def generation(self, model: Any) -> int:
+        return self._generations.get(model, 0)
+
+    def get(self, model: Any, user_pk: Any, generation: int) -> PermissionSet | None:
+        key = (model, user_pk, generation)
+        entry = self._entries.get(key)
+        if entry is None or (entry[0] and entry[0] < time.monotonic()):
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, model: Any, user_pk: Any, generation: int, permissions: PermissionSet) -> None:
+        maxsize = self.maxsize
+        if maxsize <= 0 or generation != self.generation(model):
+            return
+        ttl = self.ttl
+        expires = time.monotonic() + ttl if ttl else 0.0
+        key = (model, user_pk, generation)
+        self._entries[key] = (expires, permissions)
+        self._entries.move_to_end(key)
+        while len(self._entries) > maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, model: Any = None) -> None:
+        """Drop the cached sets of `model`, or of every permission model."""
+        models = (
+            [model]
+            if model is not None
+            else {*self._generations, *(key[0] for key in self._entries)}
+        )
+        for item in models:
+            self._generations[item] = self.generation(item) + 1
+        for key in [key for key in self._entries if model is None or key[0] is model]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached set and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> PermissionCacheInfo:
+        return PermissionCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._entries),
+        )
+
+
+permission_cache = PermissionCache()
+
+
+__all__ = ["PermissionCache", "PermissionCacheInfo", "permission_cache"]
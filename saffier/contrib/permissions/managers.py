@@ -4,10 +4,13 @@ from collections.abc import Sequence
 from typing import Any
 
 import sqlalchemy
+from sqlalchemy.engine import Engine
 
 from saffier.core.db.models.managers import Manager
 from saffier.core.db.querysets.clauses import Q, and_
 
+from .cache import PermissionSet, permission_cache
+
 
 def _apply_or_clauses(base_queryset: Any, clauses: list[dict[str, Any]]) -> Any:
     if not clauses:
@@ -26,6 +29,38 @@ def _normalize_model_values(values: Sequence[Any | None] | Any | None) -> list[A
     return [values]
 
 
+# Permission models to invalidate, keyed by the names of the tables they read.
+_watched_tables: dict[str, set[Any]] = {}
+
+
+def _invalidate_on_write(
+    connection: Any,
+    clauseelement: Any,
+    multiparams: Any,
+    params: Any,
+    execution_options: Any,
+    result: Any,
+) -> None:
+    """Drop the cached permissions reading a table an `INSERT`/`UPDATE`/`DELETE` wrote."""
+    if not getattr(clauseelement, "is_dml", False):
+        return
+    table = getattr(clauseelement, "table", None)
+    for owner in _watched_tables.get(getattr(table, "name", None), ()):
+        permission_cache.invalidate(owner)
+
+
+def _object_key(value: Any) -> Any:
+    """Reduce an object, or the primary key of one, to a hashable key."""
+    if hasattr(value, "pk"):
+        value = value.pk
+    if isinstance(value, dict):
+        values = tuple(value.values())
+        if all(item is None for item in values):
+            return None
+        return values[0] if len(values) == 1 else values
+    return value
+
+
 def _in_or_null(column: Any, values: list[Any | None]) -> Any:
     has_null = any(value is None for value in values)
     non_null_values = [value for value in values if value is not None]
@@ -53,6 +88,76 @@ def _matches_model_instance(source: Any, model_class: type[Any]) -> bool:
 class PermissionManager(Manager):
     inherit_query = True
 
+    def _watch_permission_models(self) -> None:
+        """Invalidate the cached permissions of the owner when its data changes.
+
+        Any `INSERT`, `UPDATE` or `DELETE` on the tables of the permission
+        model, the group model and the through models linking permissions to
+        users and groups, and groups to users, drops the sets cached for the
+        permission model. Watching statements rather than model signals also
+        covers bulk queryset writes and the set-based relation methods.
+        """
+        owner = self.owner
+        if any(owner in owners for owners in _watched_tables.values()):
+            return
+        user_field = owner.meta.fields["users"]
+        group_field = owner.meta.fields.get("groups")
+        models = [owner, user_field.through]
+        if group_field is not None:
+            group_user_field = group_field.target.meta.fields[owner.users_field_group]
+            models.extend([group_field.target, group_field.through, group_user_field.through])
+
+        if not _watched_tables:
+            sqlalchemy.event.listen(Engine, "after_execute", _invalidate_on_write)
+        for model in models:
+            _watched_tables.setdefault(model.meta.tablename, set()).add(owner)
+
+    async def effective_permissions(self, user: Any) -> PermissionSet:
+        """Return the permissions a user holds directly or through its groups.
+
+        The set is read with one query and cached in `permission_cache` until
+        it expires or a permission, group or membership changes.
+
+        Args:
+            user: User instance.
+
+        Returns:
+            PermissionSet: The objects each permission name applies to, with
+            `None` standing for permissions without an object.
+        """
+        owner = self.owner
+        self._watch_permission_models()
+        generation = permission_cache.generation(owner)
+        permissions = permission_cache.get(owner, user.pk, generation)
+        if permissions is not None:
+            return permissions
+
+        fields = ["name", "obj"] if "obj" in owner.table.c else ["name"]
+        objects: dict[str, set[Any]] = {}
+        for row in await self.permissions_of(user).values_list(fields=fields):
+            objects.setdefault(row[0], set()).add(_object_key(row[1]) if len(row) > 1 else None)
+        permissions = {name: frozenset(values) for name, values in objects.items()}
+        permission_cache.set(owner, user.pk, generation, permissions)
+        return permissions
+
+    async def has_perm(self, user: Any, name: str, obj: Any = None) -> bool:
+        """Return whether a user holds a permission, answered from the cached set.
+
+        Like `users()`, permissions stored without an object apply to every
+        object, and leaving `obj` out matches the permission on any object.
+
+        Args:
+            user: User instance.
+            name: Permission name.
+            obj: Optional object, or its primary key, the permission must cover.
+        """
+        objects = (await self.effective_permissions(user)).get(name)
+        if objects is None:
+            return False
+        if obj is None or None in objects:
+            return True
+        return _object_key(obj) in objects
+
     def _permission_pk_subquery(
         self,
         permissions: Sequence[str],
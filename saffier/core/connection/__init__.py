@@ -1,4 +1,6 @@
 from .database import Database, DatabaseURL
 from .registry import Registry
+from .replicas import track_writes
+from .timeouts import query_deadline
 
-__all__ = ["Database", "DatabaseURL", "Registry"]
+__all__ = ["Database", "DatabaseURL", "Registry", "query_deadline", "track_writes"]
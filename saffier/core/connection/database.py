@@ -9,7 +9,9 @@ client without delegating database work outside SQLAlchemy.
 from __future__ import annotations
 
 import asyncio
+import collections
 import contextlib
+import copy
 import os
 import re
 import weakref
@@ -26,11 +28,18 @@ from sqlalchemy.exc import OperationalError, ProgrammingError
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
     AsyncEngine,
+    AsyncResult,
     AsyncSession,
     AsyncTransaction,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import _label_reference
+
+from saffier.conf import settings
+from saffier.core.connection.replicas import ReplicaRouter, ReplicaStrategy, replication_lag
+from saffier.core.connection.timeouts import limit_statement, resolve_timeout
 
 try:
     from monkay.asgi import ASGIApp, LifespanHook
@@ -53,6 +62,61 @@ def _coerce_statement(query: sqlalchemy.ClauseElement | str) -> sqlalchemy.Claus
     return sqlalchemy.text(query) if isinstance(query, str) else query
 
 
+def _reverse_ordering(statement: sqlalchemy.ClauseElement) -> sqlalchemy.Select[Any] | None:
+    """Return ``statement`` with its ordering reversed, when that is well defined.
+
+    Only ordered ``Select`` statements without ``LIMIT``/``OFFSET`` or
+    ``DISTINCT``/``DISTINCT ON`` qualify: which row ``DISTINCT ON`` keeps per
+    group depends on the ordering. Explicit ``NULLS FIRST``/``NULLS LAST``
+    modifiers are left alone because flipping them is not portable.
+
+    Rows tied on every ordering column come back in no defined order, so with
+    ties the reversed statement may pick a different one of the tied rows than
+    reading the original result to its end.
+    """
+    if (
+        not isinstance(statement, sqlalchemy.Select)
+        or not statement._order_by_clauses
+        or statement._limit_clause is not None
+        or statement._offset_clause is not None
+        or statement._distinct
+        or statement._distinct_on
+    ):
+        return None
+    clauses = []
+    for clause in statement._order_by_clauses:
+        if isinstance(clause, _label_reference):
+            clause = clause.element
+        if not isinstance(clause, sqlalchemy.ColumnElement):
+            return None
+        modifier = getattr(clause, "modifier", None)
+        if modifier is operators.desc_op:
+            clauses.append(clause.element.asc())  # type: ignore[attr-defined]
+        elif modifier is operators.asc_op:
+            clauses.append(clause.element.desc())  # type: ignore[attr-defined]
+        elif modifier is not None:
+            return None
+        else:
+            clauses.append(clause.desc())
+    return statement.order_by(None).order_by(*clauses)
+
+
+def _translated_schema() -> str | None:
+    """Return the schema rendered for schema-less tables, when translation is on.
+
+    With the ``use_schema_translate_map`` setting enabled, querysets keep the
+    shared base tables and bind their ``using_schema`` while they execute,
+    falling back to the schema active through ``with_schema`` or
+    ``set_tenant``. SQLAlchemy's ``schema_translate_map`` renders it when the
+    statement runs.
+    """
+    if not settings.use_schema_translate_map:
+        return None
+    from saffier.core.db.context_vars import get_translated_schema
+
+    return get_translated_schema()
+
+
 def _async_url(url: DatabaseURL) -> URL:
     """Build the SQLAlchemy URL used to create the async engine.
 
@@ -743,6 +807,9 @@ class Database:
 
     force_rollback = ForceRollbackDescriptor()
     default_batch_size: int = 100
+    # ``None`` streams on every dialect but SQLite, where an open cursor locks
+    # the database file for writers on other connections.
+    stream_iterations: bool | None = None
 
     def __init__(
         self,
@@ -752,6 +819,12 @@ class Database:
         config: dict[str, Any] | None = None,
         full_isolation: bool | None = None,
         poll_interval: float | None = None,
+        replicas: Sequence[str | DatabaseURL | URL | Database] | None = None,
+        replica_strategy: ReplicaStrategy = "round_robin",
+        read_your_writes: float | None = 1.0,
+        replica_max_lag: float | None = None,
+        replica_lag_probe_interval: float = 5.0,
+        query_timeout: float | None = None,
         **options: Any,
     ) -> None:
         """Configure URL, engine options, and rollback behavior for the runtime.
@@ -760,6 +833,16 @@ class Database:
         setup remains lightweight. Copy construction preserves the source
         database's URL and options while still creating independent SQLAlchemy
         engine and transaction state.
+
+        ``replicas`` lists read replicas, each getting its own engine and pool.
+        Replicas given as URLs reuse the primary's engine options. Read-only queryset operations are
+        routed to them through a ``ReplicaRouter`` configured by the
+        ``replica_*`` and ``read_your_writes`` arguments, while writes and
+        anything inside a transaction stay on the primary.
+
+        ``query_timeout`` is the default number of seconds after which a
+        statement is cancelled. ``QuerySet.timeout()`` and the ``timeout``
+        argument of the execution helpers override it.
         """
         assert config is None or url is None, "Use either 'url' or 'config', not both."
         if isinstance(url, Database):
@@ -772,6 +855,14 @@ class Database:
                 full_isolation = url._full_isolation
             if poll_interval is None:
                 poll_interval = url.poll_interval
+            if query_timeout is None:
+                query_timeout = url.query_timeout
+            if replicas is None and url.router is not None:
+                replicas = [copy.copy(replica) for replica in url.replicas]
+                replica_strategy = url.router.strategy
+                read_your_writes = url.router.read_your_writes
+                replica_max_lag = url.router.max_lag
+                replica_lag_probe_interval = url.router.lag_probe_interval
         else:
             database_url = DatabaseURL(url)
             if config and "connection" in config:
@@ -787,6 +878,7 @@ class Database:
                 poll_interval = 0.01
 
         self.poll_interval = poll_interval
+        self.query_timeout = query_timeout
         self._full_isolation = full_isolation
         self._force_rollback = ForceRollback(force_rollback)
         self._engine: AsyncEngine | None = None
@@ -794,8 +886,29 @@ class Database:
         self._global_connection: AsyncConnection | None = None
         self._global_transaction: AsyncTransaction | None = None
         self.is_connected = False
+        # Set once `connect()` has finished setting up, unlike `is_connected`,
+        # which execution helpers need while the setup is still running.
+        self._ready = False
         self.ref_counter = 0
         self.ref_lock = asyncio.Lock()
+        self.replicas: list[Database] = [
+            replica
+            if isinstance(replica, Database)
+            else Database(replica, query_timeout=query_timeout, **options)
+            for replica in replicas or ()
+        ]
+        self.router: ReplicaRouter | None = (
+            ReplicaRouter(
+                self,
+                self.replicas,
+                strategy=replica_strategy,
+                read_your_writes=read_your_writes,
+                max_lag=replica_max_lag,
+                lag_probe_interval=replica_lag_probe_interval,
+            )
+            if self.replicas
+            else None
+        )
 
     def __copy__(self) -> Database:
         """Return a new runtime object with the same configuration.
@@ -896,7 +1009,16 @@ class Database:
         contexts may ask for the same database to connect more than once. The
         first caller creates ``AsyncEngine`` and ``async_sessionmaker``; later
         callers reuse that live SQLAlchemy runtime.
+
+        Once the first caller has finished connecting the engine, the
+        force-rollback connection and the replicas, later callers only bump the
+        counter. The update cannot be interleaved with other tasks, so
+        ``ref_lock`` is only taken while the runtime is set up or disposed, or
+        when the force-rollback connection may have to be opened.
         """
+        if self._ready and self.ref_counter > 0 and not bool(self.force_rollback):
+            self.ref_counter += 1
+            return False
         async with self.ref_lock:
             self.ref_counter += 1
             if self.ref_counter > 1:
@@ -913,11 +1035,18 @@ class Database:
                 self.is_connected = True
                 if bool(self.force_rollback):
                     await self._ensure_global_force_rollback()
+                for replica in self.replicas:
+                    await replica.connect()
+                self._ready = True
             except BaseException:
                 self.ref_counter = 0
                 self.is_connected = False
-                self._engine = None
+                engine, self._engine = self._engine, None
                 self._sessionmaker = None
+                if engine is not None:
+                    await engine.dispose()
+                for replica in self.replicas:
+                    await replica.disconnect(force=True)
                 raise
             return True
 
@@ -927,7 +1056,13 @@ class Database:
         Normal disconnect decrements the reference counter and only disposes the
         engine for the last owner. ``force=True`` is reserved for teardown paths
         that must close the pool regardless of outstanding references.
+
+        Releasing a reference that is not the last one does not take
+        ``ref_lock``.
         """
+        if not force and self.ref_counter > 1:
+            self.ref_counter -= 1
+            return False
         async with self.ref_lock:
             if force:
                 self.ref_counter = 0
@@ -937,6 +1072,7 @@ class Database:
                 return False
             if not self.is_connected:
                 return False
+            self._ready = False
             try:
                 await self._close_global_force_rollback()
             finally:
@@ -945,6 +1081,8 @@ class Database:
                 self.is_connected = False
                 if engine is not None:
                     await engine.dispose(close=True)
+                for replica in self.replicas:
+                    await replica.disconnect(force=True)
                 await self.disconnect_hook()
             return True
 
@@ -1120,21 +1258,94 @@ class Database:
             yield connection
 
     @contextlib.asynccontextmanager
-    async def _execution_connection(self) -> AsyncGenerator[AsyncConnection, None]:
+    async def _execution_connection(
+        self, timeout: float | None = None, *, cancel: bool = True, limit: bool = True
+    ) -> AsyncGenerator[AsyncConnection, None]:
         """Yield the SQLAlchemy connection for one ORM execution helper.
 
         ORM helpers should not decide whether they are inside a transaction,
         forced rollback block, or normal engine checkout. This helper centralizes
         that choice so fetch, execute, and iteration paths all share the same
         connection ownership rules.
+
+        The statements run inside the block are cancelled once ``timeout``, the
+        ``QuerySet.timeout()`` in effect or ``query_timeout`` has passed, and no
+        later than the active ``query_deadline()``. Callers that have to open a
+        transaction first pass ``limit=False`` and apply ``limit_statement()``
+        themselves.
         """
+        timeout = resolve_timeout(timeout, self.query_timeout) if limit else None
+
+        def limited(connection: AsyncConnection) -> Any:
+            if not limit:
+                return contextlib.nullcontext()
+            return limit_statement(connection, timeout, cancel=cancel)
+
         current = self._current_connection()
         if current is not None:
-            yield current
+            async with self._translate_schema(current, restore=True), limited(current):
+                yield current
             return
-        async with self.connection() as connection:
+        async with (
+            self.connection() as connection,
+            self._translate_schema(connection, restore=False),
+            limited(connection),
+        ):
             yield connection
 
+    @contextlib.asynccontextmanager
+    async def _translate_schema(
+        self, connection: AsyncConnection, *, restore: bool
+    ) -> AsyncGenerator[None, None]:
+        """Render the active schema for schema-less tables on ``connection``.
+
+        Bound transaction connections outlive the execution, so their previous
+        ``schema_translate_map`` is put back afterwards. Short-lived checkouts
+        are closed right after and keep the option.
+        """
+        schema = _translated_schema()
+        if schema is None:
+            yield
+            return
+        previous = connection.sync_connection.get_execution_options().get(  # type: ignore[union-attr]
+            "schema_translate_map"
+        )
+        await connection.execution_options(schema_translate_map={None: schema})
+        try:
+            yield
+        finally:
+            if restore:
+                await connection.execution_options(schema_translate_map=previous)
+
+    @contextlib.asynccontextmanager
+    async def reading(self) -> AsyncGenerator[Database, None]:
+        """Yield the database that should serve a read-only operation.
+
+        Without replicas this is the database itself. Otherwise the
+        ``ReplicaRouter`` picks the primary or one of the replicas, and the read
+        counts as outstanding on that replica until the block exits.
+        """
+        if self.router is None:
+            yield self
+            return
+        async with self.router.route() as database:
+            yield database
+
+    async def probe_replicas(self) -> dict[int, float | None]:
+        """Measure the replication delay of every replica, keyed by ``id(replica)``."""
+        if self.router is None:
+            return {}
+        return await self.router.probe()
+
+    async def replica_lag(self) -> float | None:
+        """Return how many seconds this database trails its primary, if measurable."""
+        return await replication_lag(self)
+
+    def _record_write(self) -> None:
+        """Open the read-your-writes window of the current context."""
+        if self.router is not None:
+            self.router.record_write()
+
     async def fetch_all(
         self,
         query: sqlalchemy.ClauseElement | str,
@@ -1148,15 +1359,35 @@ class Database:
         materialized before the cursor is closed so callers can inspect rows
         after the connection context exits.
         """
-        del timeout
         statement = _coerce_statement(query)
-        async with self._execution_connection() as connection:
+        if getattr(statement, "is_dml", False):
+            self._record_write()
+        async with self._execution_connection(timeout) as connection:
             result = await connection.execute(statement, values or {})
             try:
                 return list(result.fetchall())
             finally:
                 result.close()
 
+    async def _fetch_first(
+        self,
+        statement: sqlalchemy.ClauseElement,
+        values: dict[str, Any] | None,
+        timeout: float | None,
+        *,
+        scalar: bool = False,
+    ) -> Any:
+        """Execute ``statement`` and return its first row, or first value with ``scalar``.
+
+        The result is closed after the first row, without building a list of
+        the remaining ones.
+        """
+        if getattr(statement, "is_dml", False):
+            self._record_write()
+        async with self._execution_connection(timeout) as connection:
+            result = await connection.execute(statement, values or {})
+            return result.scalar() if scalar else result.first()
+
     async def fetch_one(
         self,
         query: sqlalchemy.ClauseElement | str,
@@ -1167,26 +1398,45 @@ class Database:
         """Execute a statement and return one row by logical position.
 
         Positive positions are translated into SQLAlchemy ``offset`` and
-        ``limit`` calls when the statement supports them. ``-1`` keeps the
-        historic "last row" behavior by materializing the result and returning
-        the final entry.
+        ``limit`` calls when the statement supports them. ``-1`` returns the
+        last row: ordered selects are run with their ordering reversed and
+        ``LIMIT 1``, and other statements keep only the final row while the
+        result is consumed.
         """
-        del timeout
-        statement = _coerce_statement(query)
-        if pos > 0 and hasattr(statement, "offset"):
-            statement = statement.offset(pos)  # type: ignore[assignment,union-attr]
-        if pos >= 0 and hasattr(statement, "limit"):
-            statement = statement.limit(1)  # type: ignore[assignment,union-attr]
-        rows = await self.fetch_all(statement, values)
-        if not rows:
-            return None
-        if pos == -1:
-            return rows[-1]
         if pos < -1:
             raise NotImplementedError(
                 f"Only positive numbers and -1 for the last result are currently supported: {pos}"
             )
-        return rows[0]
+        statement = _coerce_statement(query)
+        if pos == -1:
+            reversed_statement = _reverse_ordering(statement)
+            if reversed_statement is None:
+                return await self._fetch_last(statement, values, timeout)
+            statement, pos = reversed_statement, 0
+        if pos > 0 and hasattr(statement, "offset"):
+            statement = statement.offset(pos)  # type: ignore[assignment,union-attr]
+        if hasattr(statement, "limit"):
+            statement = statement.limit(1)  # type: ignore[assignment,union-attr]
+        return cast(
+            "sqlalchemy.Row[Any] | None", await self._fetch_first(statement, values, timeout)
+        )
+
+    async def _fetch_last(
+        self,
+        statement: sqlalchemy.ClauseElement,
+        values: dict[str, Any] | None,
+        timeout: float | None,
+    ) -> sqlalchemy.Row[Any] | None:
+        """Return the final row of a statement whose ordering cannot be reversed."""
+        if getattr(statement, "is_dml", False):
+            self._record_write()
+        async with self._execution_connection(timeout) as connection:
+            result = await connection.execute(statement, values or {})
+            try:
+                last = collections.deque(result, maxlen=1)
+            finally:
+                result.close()
+        return last[0] if last else None
 
     async def fetch_val(
         self,
@@ -1200,8 +1450,14 @@ class Database:
 
         The value can be selected by integer position or by row mapping key.
         Returning ``None`` for empty results matches the existing Saffier query
-        helper contract.
-        """
+        helper contract. The first column of the first row, as read by
+        ``exists()`` and ``count()``, is fetched as a scalar.
+        """
+        if pos == 0 and column == 0:
+            statement = _coerce_statement(query)
+            if hasattr(statement, "limit"):
+                statement = statement.limit(1)  # type: ignore[assignment,union-attr]
+            return await self._fetch_first(statement, values, timeout, scalar=True)
         row = await self.fetch_one(query, values, pos=pos, timeout=timeout)
         if row is None:
             return None
@@ -1240,9 +1496,9 @@ class Database:
         contexts. The returned value follows the legacy Saffier contract:
         insert metadata when available, otherwise affected row count.
         """
-        del timeout
         statement = _coerce_statement(query)
-        async with self._execution_connection() as connection:
+        self._record_write()
+        async with self._execution_connection(timeout) as connection:
             result = (
                 await connection.execute(statement, values)
                 if values is not None
@@ -1265,9 +1521,9 @@ class Database:
         dictionaries is passed to ``execute()``. Saffier only adapts the cursor
         metadata back into the value expected by bulk insert and update code.
         """
-        del timeout
         statement = _coerce_statement(query)
-        async with self._execution_connection() as connection:
+        self._record_write()
+        async with self._execution_connection(timeout) as connection:
             result = (
                 await connection.execute(statement, values)
                 if values is not None
@@ -1282,6 +1538,91 @@ class Database:
             finally:
                 result.close()
 
+    async def fetch_many(
+        self,
+        query: sqlalchemy.ClauseElement | str,
+        values: Sequence[dict[str, Any]],
+        timeout: float | None = None,
+    ) -> list[sqlalchemy.Row[Any]]:
+        """Execute one statement for several parameter sets and return every row.
+
+        This is the ``executemany`` counterpart of ``fetch_all`` for
+        ``INSERT ... RETURNING`` statements. SQLAlchemy batches the parameter
+        sets through its "insertmanyvalues" mode and gathers the rows returned
+        by each batch.
+        """
+        statement = _coerce_statement(query)
+        self._record_write()
+        async with self._execution_connection(timeout) as connection:
+            result = await connection.execute(statement, list(values))
+            try:
+                return list(result.fetchall())
+            finally:
+                result.close()
+
+    @contextlib.asynccontextmanager
+    async def _streaming_result(
+        self,
+        statement: sqlalchemy.ClauseElement,
+        values: dict[str, Any] | None,
+        chunk_size: int,
+        timeout: float | None = None,
+    ) -> AsyncGenerator[AsyncResult[Any] | list[sqlalchemy.Row[Any]], None]:
+        """Open a server-side cursor that fetches ``chunk_size`` rows at a time.
+
+        Inside an active transaction the statement is streamed on the bound
+        connection. Otherwise a freshly checked-out connection is switched from
+        the engine's ``AUTOCOMMIT`` level back to the dialect default and
+        wrapped in a short-lived transaction, because asyncpg only opens
+        cursors inside transactions. Dialects without server-side cursors,
+        externally bound connections outside a transaction, and databases not
+        streaming iterations (see ``stream_iterations``; SQLite by default) get
+        a materialized list of rows instead.
+        """
+        timeout = resolve_timeout(timeout, self.query_timeout)
+        owns_connection = self._current_connection() is None
+        async with self._execution_connection(cancel=False, limit=False) as connection:
+            stream_iterations = self.stream_iterations
+            if stream_iterations is None:
+                stream_iterations = connection.dialect.name != "sqlite"
+            if not connection.dialect.supports_server_side_cursors or (
+                not connection.in_transaction() and (not owns_connection or not stream_iterations)
+            ):
+                async with limit_statement(connection, timeout, cancel=False):
+                    result = await connection.execute(statement, values or {})
+                    try:
+                        rows = list(result.fetchall())
+                    finally:
+                        result.close()
+                yield rows
+                return
+
+            # The timeout is applied once the transaction has begun: a `SET`
+            # on the idle connection would autobegin it, and the stream would
+            # then run outside the transaction asyncpg needs for its cursor.
+            transaction: AsyncTransaction | None = None
+            if not connection.in_transaction():
+                await connection.execution_options(
+                    isolation_level=connection.default_isolation_level
+                )
+                transaction = await connection.begin()
+
+            await connection.execution_options(yield_per=chunk_size)
+            try:
+                async with (
+                    limit_statement(
+                        connection, timeout, cancel=False, local=transaction is not None
+                    ),
+                    connection.stream(statement, values or {}) as stream,
+                ):
+                    yield stream
+                if transaction is not None:
+                    await transaction.commit()
+            finally:
+                await connection.execution_options(yield_per=0)
+                if transaction is not None and transaction.is_active:
+                    await transaction.rollback()
+
     async def iterate(
         self,
         query: sqlalchemy.ClauseElement | str,
@@ -1292,34 +1633,25 @@ class Database:
         """Yield rows from a SQLAlchemy statement without hiding result objects.
 
         Dialects with server-side cursor support use ``AsyncConnection.stream``
-        and ``yield_per`` when a transaction is already active. Dialects without
-        streaming support, or autocommit connections where asyncpg cannot open a
-        cursor, fall back to a materialized result while preserving the async
-        generator API.
+        and ``yield_per``, inside the active transaction or in a short-lived
+        one opened for the iteration, so at most ``chunk_size`` rows are held
+        in memory at a time. Dialects without streaming support, and SQLite
+        outside transactions unless ``stream_iterations`` is set, fall back to
+        a materialized result while preserving the async generator API.
+
+        ``timeout`` bounds the whole iteration. It is enforced by the server,
+        or by interrupting the statement on SQLite, but never by cancelling the
+        consuming task.
         """
-        del timeout
         statement = _coerce_statement(query)
         chunk_size = chunk_size or self.default_batch_size
-        async with self._execution_connection() as connection:
-            if (
-                not connection.dialect.supports_server_side_cursors
-                or not connection.in_transaction()
-            ):
-                result = await connection.execute(statement, values or {})
-                try:
-                    for row in result.fetchall():
-                        yield row
-                finally:
-                    result.close()
+        async with self._streaming_result(statement, values, chunk_size, timeout) as result:
+            if isinstance(result, list):
+                for row in result:
+                    yield row
                 return
-
-            await connection.execution_options(yield_per=chunk_size)
-            try:
-                async with connection.stream(statement, values or {}) as result:
-                    async for row in result:
-                        yield row
-            finally:
-                await connection.execution_options(yield_per=0)
+            async for row in result:
+                yield row
 
     async def batched_iterate(
         self,
@@ -1331,15 +1663,20 @@ class Database:
     ) -> AsyncGenerator[Any, None]:
         """Yield result rows grouped into caller-configured batches.
 
-        This compatibility helper materializes rows with ``fetch_all`` and then
-        wraps each batch with ``batch_wrapper``. The execution itself still uses
-        SQLAlchemy async connections and participates in active transactions.
+        Batches are read from the same server-side stream used by
+        ``iterate()``, one ``batch_size`` partition at a time, and wrapped with
+        ``batch_wrapper``. Dialects that cannot stream group a materialized
+        result instead.
         """
-        del timeout
+        statement = _coerce_statement(query)
         batch_size = batch_size or self.default_batch_size
-        rows = await self.fetch_all(query, values)
-        for batch in _batch_rows(rows, batch_size):
-            yield batch_wrapper(batch)
+        async with self._streaming_result(statement, values, batch_size, timeout) as result:
+            if isinstance(result, list):
+                for batch in _batch_rows(result, batch_size):
+                    yield batch_wrapper(batch)
+                return
+            async for batch in result.partitions(batch_size):
+                yield batch_wrapper(batch)
 
     def transaction(self, *, force_rollback: bool = False, **kwargs: Any) -> Transaction:
         """Create a SQLAlchemy-backed Saffier transaction context.
@@ -1364,8 +1701,7 @@ class Database:
         Saffier forwards directly to that method so schema helpers remain
         idiomatic SQLAlchemy 2.x async code.
         """
-        del timeout
-        async with self._execution_connection() as connection:
+        async with self._execution_connection(timeout) as connection:
             return await connection.run_sync(fn, *args, **kwargs)
 
     async def create_all(
@@ -1380,8 +1716,7 @@ class Database:
         synchronous ``MetaData.create_all`` API runs on the connection paired
         with the active async engine or transaction.
         """
-        del timeout
-        await self.run_sync(meta.create_all, **kwargs)
+        await self.run_sync(meta.create_all, timeout=timeout, **kwargs)
 
     async def drop_all(
         self,
@@ -1395,8 +1730,7 @@ class Database:
         SQLAlchemy's public metadata API. Any active transaction or
         force-rollback connection is respected by the execution connection.
         """
-        del timeout
-        await self.run_sync(meta.drop_all, **kwargs)
+        await self.run_sync(meta.drop_all, timeout=timeout, **kwargs)
 
     def asgi(
         self,
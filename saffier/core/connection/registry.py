@@ -4,7 +4,8 @@ import asyncio
 import contextlib
 import copy
 import logging
-from collections.abc import Callable, Generator, Iterable, Sequence
+import weakref
+from collections.abc import AsyncIterator, Callable, Generator, Iterable, Sequence
 from functools import cached_property
 from typing import Any, ClassVar, cast
 
@@ -18,6 +19,7 @@ from saffier._instance import Instance
 from saffier.conf import _monkay, settings
 from saffier.core.connection.database import Database
 from saffier.core.connection.schemas import Schema
+from saffier.core.connection.table_cache import SchemaTableCache
 from saffier.core.db.constants import CASCADE
 from saffier.core.utils.concurrency import run_concurrently
 from saffier.core.utils.db import FORCE_FIELDS_NULLABLE
@@ -131,6 +133,7 @@ class Registry:
         database: Database | str,
         *,
         with_content_type: bool | type[Any] = False,
+        shared_content_types: bool = False,
         model_engine: Any | None = None,
         **kwargs: Any,
     ) -> None:
@@ -146,6 +149,8 @@ class Registry:
         self.reflected: dict[str, Any] = {}
         self.pattern_models: dict[str, Any] = {}
         self.content_type: Any | None = None
+        self.shared_content_types = shared_content_types
+        self.content_type_cache: dict[tuple[str, str, str | None], Any] = {}
         self.model_engine = model_engine
         self.extra: dict[str, Database] = {
             name: value if isinstance(value, Database) else Database(value)
@@ -159,6 +164,7 @@ class Registry:
         self._model_callbacks: dict[str, list[tuple[Callable[[type[Any]], None], bool]]] = {}
 
         self.schema = Schema(registry=self)
+        self.schema_table_cache = SchemaTableCache()
         self._metadata = self._make_metadata()
         self._metadata_by_name = MetaDataDict(self)
         self._metadata_by_name[None] = self._metadata
@@ -176,6 +182,7 @@ class Registry:
         model_defaults: dict[str, dict[str, Any]] | None = None,
         filter_db_url: str | None = None,
         filter_db_name: str | None = None,
+        batch_size: int | None = None,
     ) -> None:
         """Backfill defaults for fields made temporarily nullable by migrations.
 
@@ -186,12 +193,15 @@ class Registry:
         fields are still ``NULL`` and update them with the model's declared
         defaults or with explicit defaults supplied by the migration.
 
-        The method deliberately stays on Saffier's public ORM path. It filters
-        registered models, selects only primary-key data for matching rows, then
-        calls ``update()`` on each model instance with concrete default values.
-        That preserves field normalization, SQLAlchemy execution, and model
-        update signals while avoiding a second migration-specific persistence
-        layer.
+        The method deliberately stays on Saffier's public ORM path. When every
+        selected field of a model has a static default (or a migration
+        override), the model is backfilled with a single queryset ``update()``,
+        i.e. one ``UPDATE ... WHERE field IS NULL`` statement, optionally split
+        into primary-key pages of ``batch_size`` rows to keep lock times
+        bounded. Callable defaults must be evaluated per row, so those models
+        page through the primary keys of the matching rows and persist the
+        values in batches through ``bulk_update()``. Progress is reported
+        through the ``migrate_progress`` signal with the ``"backfill"`` sender.
 
         Args:
             force_fields_nullable: Iterable of ``(model_name, field_name)``
@@ -206,6 +216,10 @@ class Registry:
             filter_db_name: Optional registry database name. ``""`` targets the
                 primary database; any other value targets the matching
                 ``extra`` database and takes precedence over ``filter_db_url``.
+            batch_size: Optional number of rows per statement. Static defaults
+                are applied in primary-key pages of this size; callable
+                defaults are persisted in batches of this size, falling back to
+                the database ``default_batch_size``.
         """
         if force_fields_nullable is None:
             selected_fields = set(FORCE_FIELDS_NULLABLE.get())
@@ -254,13 +268,14 @@ class Registry:
             model_name: str,
             field_names: set[str],
         ) -> None:
-            """Backfill one model's matching rows through normal ORM updates.
+            """Backfill one model's matching rows.
 
             The closure is scheduled by ``run_concurrently`` for each model that
-            has at least one valid forced-nullable field. It keeps row selection
-            narrow by loading primary keys first, then computes default values
-            per object so callable defaults are evaluated for each updated row
-            rather than once for the whole migration.
+            has at least one valid forced-nullable field. Static defaults are
+            written by set-based updates; as soon as one field has a callable
+            default, the values are computed per object, one primary-key page
+            at a time, so the callable is evaluated for each updated row rather
+            than once for the whole migration.
 
             Args:
                 model_name: Registered model class name to process.
@@ -272,21 +287,44 @@ class Registry:
             if filter_db_url and str(model_class.database.url) != filter_db_url:
                 return
 
-            query = model_class.query.filter(**dict.fromkeys(field_names)).only(
-                *model_class.pknames
-            )
-            objects = await query
             default_overrides = effective_model_defaults.get(model_name, {})
-            for obj in objects:
+            ordered_fields = sorted(field_names)
+            queryset = model_class.query.filter(**dict.fromkeys(ordered_fields))
+            progress = self._backfill_progress(model_name, tuple(ordered_fields))
+
+            dynamic = any(
+                field_name not in default_overrides
+                and callable(getattr(model_class.fields[field_name].validator, "default", None))
+                for field_name in ordered_fields
+            )
+            if not dynamic:
                 values = {
                     field_name: (
                         default_overrides[field_name]
                         if field_name in default_overrides
                         else model_class.fields[field_name].get_default_value()
                     )
-                    for field_name in field_names
+                    for field_name in ordered_fields
                 }
-                await obj.update(**values)
+                await self._backfill_static_defaults(queryset, values, batch_size, progress)
+                return
+
+            chunk_size = batch_size or model_class.database.default_batch_size
+            async for page in self._backfill_pages(queryset, chunk_size):
+                chunk = await page.only(*model_class.pknames)
+                if not chunk:
+                    continue
+                for obj in chunk:
+                    for field_name in ordered_fields:
+                        setattr(
+                            obj,
+                            field_name,
+                            default_overrides[field_name]
+                            if field_name in default_overrides
+                            else model_class.fields[field_name].get_default_value(),
+                        )
+                await model_class.query.bulk_update(chunk, fields=ordered_fields)
+                await progress(len(chunk))
 
         await run_concurrently(
             [
@@ -295,6 +333,92 @@ class Registry:
             ]
         )
 
+    @staticmethod
+    def _backfill_progress(model_name: str, field_names: tuple[str, ...]) -> Callable[[int], Any]:
+        """Return a reporter sending ``migrate_progress`` for one backfilled model."""
+        from saffier.core.signals import migrate_progress
+
+        total = 0
+
+        async def report(rows: int) -> None:
+            nonlocal total
+            total += rows
+            await migrate_progress.send(
+                "backfill", model=model_name, fields=field_names, rows=rows, total=total
+            )
+
+        return report
+
+    @classmethod
+    async def _backfill_static_defaults(
+        cls,
+        queryset: Any,
+        values: dict[str, Any],
+        batch_size: int | None,
+        progress: Callable[[int], Any],
+    ) -> None:
+        """Apply static defaults with one update, or one update per primary-key page.
+
+        Args:
+            queryset: Queryset selecting the rows still storing ``NULL``.
+            values: Field values to write.
+            batch_size: Number of rows covered by each update.
+            progress: Reporter called with the number of updated rows.
+        """
+        if not batch_size:
+            await progress(await queryset.update(**values))
+            return
+
+        async for page in cls._backfill_pages(queryset, batch_size):
+            rows = await page.update(**values)
+            if rows:
+                await progress(rows)
+
+    @staticmethod
+    async def _backfill_pages(queryset: Any, batch_size: int) -> AsyncIterator[Any]:
+        """Split ``queryset`` into consecutive primary-key pages.
+
+        Each page ends at the ``batch_size``-th primary key after the previous
+        page, found with a keyset query (``pk > last ORDER BY pk``). Sparse and
+        non-integer keys therefore cost one boundary lookup per page and no
+        primary keys are held in memory.
+
+        Args:
+            queryset: Queryset selecting the rows to visit.
+            batch_size: Maximum number of rows per page.
+
+        Yields:
+            Any: Querysets restricted to one page each.
+        """
+        pk_columns = [queryset.table.c[name] for name in queryset.model_class.pkcolumns]
+        pk = pk_columns[0] if len(pk_columns) == 1 else sqlalchemy.tuple_(*pk_columns)
+
+        def after(key: tuple[Any, ...]) -> Any:
+            return pk > (key[0] if len(pk_columns) == 1 else sqlalchemy.tuple_(*key))
+
+        boundaries = (
+            sqlalchemy.select(*pk_columns)
+            .select_from(queryset.table)
+            .where(*queryset.filter_clauses)
+            .order_by(*pk_columns)
+            .offset(batch_size - 1)
+            .limit(1)
+        )
+        last: tuple[Any, ...] | None = None
+        while True:
+            page = queryset
+            expression = boundaries
+            if last is not None:
+                page = page.filter(after(last))
+                expression = expression.where(after(last))
+            async with queryset.database as database:
+                boundary = await database.fetch_one(expression)
+            if boundary is None:
+                yield page
+                return
+            last = tuple(boundary)
+            yield page.filter(sqlalchemy.not_(after(last)))
+
     def _make_metadata(self) -> sqlalchemy.MetaData:
         """Create a fresh SQLAlchemy metadata container for this registry.
 
@@ -550,6 +674,7 @@ class Registry:
             schema=self.db_schema,
             extra=self.extra,
             automigrate_config=self._automigrate_config,
+            shared_content_types=self.shared_content_types,
             model_engine=self.model_engine,
         )
         pending_m2m_patches: list[tuple[str, str, str]] = []
@@ -820,6 +945,7 @@ class Registry:
             to=self.content_type,
             related_name=related_name,
             on_delete=CASCADE,
+            shared=self.shared_content_types,
             no_constraint=(
                 getattr(self.content_type, "no_constraint", False)
                 or getattr(model_class.meta, "is_tenant", False)
@@ -871,14 +997,14 @@ class Registry:
             model_class: Model whose cached tables should be removed.
         """
         model_class._table = None
-        model_class._db_schemas = {}
+        model_class._db_schemas = weakref.WeakValueDictionary()
 
         table_name = cast("str | None", getattr(model_class.meta, "tablename", None))
         if table_name is None:
             return
 
         metadata_pool = [self._metadata]
-        metadata_pool.extend(getattr(self, "_schema_metadata_cache", {}).values())
+        metadata_pool.extend(self.schema_table_cache.values())
 
         for metadata in metadata_pool:
             table_keys = {table_name}
@@ -888,13 +1014,14 @@ class Registry:
                 existing_table = metadata.tables.get(table_key)
                 if existing_table is not None:
                     metadata.remove(existing_table)
+        self.schema_table_cache.recount()
 
     def _bind_content_type_pre_save(self, model_class: type[Any]) -> None:
         """Register a pre-save hook that guarantees content-type rows exist.
 
         Saffier content types are created lazily. Before a model instance is
-        saved, the bound hook inspects every content-type field on the sender and
-        creates the matching `ContentType` row when the field is missing or still
+        saved, the bound hook runs `ensure_content_types()` for it, creating
+        the matching `ContentType` rows when a field is missing or still
         points to an unsaved object.
 
         Args:
@@ -904,39 +1031,124 @@ class Registry:
             return
         if self.content_type is None:
             return
-        from saffier.contrib.contenttypes.fields import ContentTypeField
 
         async def ensure_content_type(
             sender: type[Any],
             instance: Any,
             **kwargs: Any,
         ) -> None:
-            if self.content_type is None:
-                return
-            for field_name, field in sender.fields.items():
-                if not isinstance(field, ContentTypeField):
+            await self.ensure_content_types(sender, [instance])
+
+        model_class.signals.pre_save.connect(ensure_content_type)
+        self._content_type_models_bound.add(model_class.__name__)
+
+    async def ensure_content_types(
+        self,
+        model_class: type[Any],
+        objs: Sequence[Any],
+        *,
+        schema: str | None = None,
+    ) -> None:
+        """Create the content types missing from instances or payloads of a model.
+
+        Rows for per-instance content types are inserted with one
+        `bulk_create()` per field, so saving a batch costs one extra statement
+        instead of one per object. Shared content types (see
+        `shared_content_types`) resolve to one row per model and schema,
+        inserted idempotently through `bulk_upsert()` on their `collision_key`
+        and kept in `content_type_cache` once committed.
+
+        The created content types are assigned to the objects in place.
+
+        Args:
+            model_class: Model the objects belong to.
+            objs: Model instances or field payloads about to be inserted.
+            schema: Schema of the payloads. Instances use their active schema.
+        """
+        if self.content_type is None or not objs:
+            return
+        from saffier.contrib.contenttypes.fields import ContentTypeField
+
+        for field_name, field in model_class.fields.items():
+            if not isinstance(field, ContentTypeField):
+                continue
+            per_object: list[tuple[Any, dict[str, Any]]] = []
+            shared: dict[tuple[str, str | None], list[Any]] = {}
+            for obj in objs:
+                is_payload = isinstance(obj, dict)
+                current = obj.get(field_name) if is_payload else obj.__dict__.get(field_name)
+                if current is None and field.null:
                     continue
-                current_content_type = instance.__dict__.get(field_name)
-                if current_content_type is None and field.null:
+                if current is not None and getattr(current, "pk", None) is not None:
                     continue
-                if (
-                    current_content_type is not None
-                    and getattr(current_content_type, "pk", None) is not None
-                ):
+                obj_schema = schema if is_payload else obj.get_active_instance_schema()
+                if field.shared:
+                    shared.setdefault((model_class.__name__, obj_schema), []).append(obj)
                     continue
-                payload = {}
-                if current_content_type is not None and hasattr(
-                    current_content_type, "extract_db_fields"
-                ):
-                    payload = current_content_type.extract_db_fields()
-
-                payload["name"] = sender.__name__
-                payload["schema_name"] = instance.get_active_instance_schema()
-                content_type_obj = await self.content_type.query.create(**payload)
-                setattr(instance, field_name, content_type_obj)
+                payload: dict[str, Any] = {}
+                if isinstance(current, dict):
+                    payload = dict(current)
+                elif current is not None and hasattr(current, "extract_db_fields"):
+                    payload = current.extract_db_fields()
+                payload["name"] = model_class.__name__
+                payload["schema_name"] = obj_schema
+                per_object.append((obj, payload))
+
+            if per_object:
+                created = await self.content_type.query.bulk_create(
+                    [payload for _, payload in per_object], return_instances=True
+                )
+                for (obj, _), content_type in zip(per_object, created, strict=True):
+                    self._assign_content_type(obj, field_name, content_type)
+            if shared:
+                content_types = await self._shared_content_types(list(shared))
+                for key, shared_objs in shared.items():
+                    for obj in shared_objs:
+                        self._assign_content_type(obj, field_name, content_types[key])
+
+    async def _shared_content_types(
+        self, keys: list[tuple[str, str | None]]
+    ) -> dict[tuple[str, str | None], Any]:
+        """Return the shared content types of `(model name, schema)` pairs.
+
+        The cache is keyed by the content type database, and rows are only
+        cached when resolved outside a transaction, so a rollback cannot leave
+        the cache pointing at rows that were never committed.
+        """
+        database = self.content_type.database
+        url = str(database.url)
+        found = {
+            key: self.content_type_cache[(url, *key)]
+            for key in keys
+            if (url, *key) in self.content_type_cache
+        }
+        missing = [key for key in keys if key not in found]
+        if missing:
+            rows = await self.content_type.query.bulk_upsert(
+                [
+                    {
+                        "name": name,
+                        "schema_name": schema,
+                        "collision_key": f"{schema}.{name}" if schema else name,
+                    }
+                    for name, schema in missing
+                ],
+                conflict_fields=["collision_key"],
+                update_fields=[],
+            )
+            committed = database._current_connection() is None
+            for key, content_type in zip(missing, rows, strict=True):
+                found[key] = content_type
+                if committed:
+                    self.content_type_cache[(url, *key)] = content_type
+        return found
 
-        model_class.signals.pre_save.connect(ensure_content_type)
-        self._content_type_models_bound.add(model_class.__name__)
+    @staticmethod
+    def _assign_content_type(obj: Any, field_name: str, content_type: Any) -> None:
+        if isinstance(obj, dict):
+            obj[field_name] = content_type
+        else:
+            setattr(obj, field_name, content_type)
 
     @property
     def metadata(self) -> Any:
@@ -1557,12 +1769,12 @@ class Registry:
             for name in self.extra:
                 self._metadata_by_name[name] = self._make_metadata()
             self._metadata_by_url.process()
-        self._schema_metadata_cache = {}
+        self.schema_table_cache.clear()
 
         for collection in (self.models, self.reflected):
             for model_class in collection.values():
                 model_class._table = None
-                model_class._db_schemas = {}
+                model_class._db_schemas = weakref.WeakValueDictionary()
 
         return self
 
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import logging
+import time
+from collections.abc import AsyncGenerator, Iterator, Sequence
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Literal
+
+import sqlalchemy
+
+if TYPE_CHECKING:
+    from saffier.core.connection.database import Database
+
+logger = logging.getLogger(__name__)
+
+ReplicaStrategy = Literal["round_robin", "least_outstanding"]
+
+_LAST_WRITES: ContextVar[dict[int, float] | None] = ContextVar(
+    "saffier_replica_last_writes", default=None
+)
+
+
+@contextlib.contextmanager
+def track_writes() -> Iterator[None]:
+    """Share the read-your-writes window between every task spawned in the block.
+
+    Tasks copy the context of their parent, so the writes a child task makes
+    through the primary are recorded on the holder installed here and seen by
+    the parent and its other children. Outside such a block, writes from a
+    child task only open the window of that task.
+    """
+    token = _LAST_WRITES.set({})
+    try:
+        yield
+    finally:
+        _LAST_WRITES.reset(token)
+
+
+class ReplicaRouter:
+    """Pick the database serving a read for a primary with read replicas.
+
+    Reads go to the primary while a transaction or forced-rollback connection
+    is bound to the current context, and for `read_your_writes` seconds after
+    this context last wrote through the primary. Otherwise one of the replicas
+    is chosen in turn (`"round_robin"`) or by the fewest reads in flight
+    (`"least_outstanding"`).
+
+    With `max_lag` set, the replicas are probed for their replication delay at
+    most once every `lag_probe_interval` seconds, and replicas lagging further
+    behind, or failing the probe, leave the rotation until a later probe sees
+    them catch up. Reads fall back to the primary when no replica is left.
+    """
+
+    strategies: tuple[str, ...] = ("round_robin", "least_outstanding")
+
+    def __init__(
+        self,
+        primary: Database,
+        replicas: Sequence[Database],
+        *,
+        strategy: ReplicaStrategy = "round_robin",
+        read_your_writes: float | None = 1.0,
+        max_lag: float | None = None,
+        lag_probe_interval: float = 5.0,
+    ) -> None:
+        if strategy not in self.strategies:
+            raise ValueError(
+                f"Unknown replica strategy '{strategy}', expected one of {self.strategies}."
+            )
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.strategy = strategy
+        self.read_your_writes = read_your_writes
+        self.max_lag = max_lag
+        self.lag_probe_interval = lag_probe_interval
+        self.outstanding: dict[int, int] = {id(replica): 0 for replica in self.replicas}
+        self.lags: dict[int, float | None] = {}
+        self._cycle = itertools.cycle(range(len(self.replicas)))
+        self._probed_at: float | None = None
+        self._probe_lock = asyncio.Lock()
+
+    def record_write(self) -> None:
+        """Remember that the current context just wrote through the primary."""
+        if not self.read_your_writes:
+            return
+        writes = _LAST_WRITES.get()
+        if writes is None:
+            writes = {}
+            _LAST_WRITES.set(writes)
+        writes[id(self)] = time.monotonic()
+
+    def wrote_recently(self) -> bool:
+        """Return whether the read-your-writes window of this context is open."""
+        if not self.read_your_writes:
+            return False
+        written_at = (_LAST_WRITES.get() or {}).get(id(self))
+        return written_at is not None and time.monotonic() - written_at < self.read_your_writes
+
+    def available(self) -> list[Database]:
+        """Return the replicas currently in rotation."""
+        if self.max_lag is None:
+            return self.replicas
+        max_lag = self.max_lag
+        return [
+            replica
+            for replica in self.replicas
+            if (lag := self.lags.get(id(replica))) is None or lag <= max_lag
+        ]
+
+    async def probe(self) -> dict[int, float | None]:
+        """Measure the replication delay of every replica, in seconds.
+
+        Replicas whose dialect cannot report a delay are kept in rotation, and
+        replicas failing the probe are taken out of it.
+        """
+        async with self._probe_lock:
+            lags = await asyncio.gather(*(self._probe(replica) for replica in self.replicas))
+            self.lags = {
+                id(replica): lag for replica, lag in zip(self.replicas, lags, strict=True)
+            }
+            self._probed_at = time.monotonic()
+        return self.lags
+
+    async def _probe(self, replica: Database) -> float | None:
+        try:
+            return await replica.replica_lag()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Replica %s failed its lag probe: %s", replica.url, exc)
+            return float("inf")
+
+    async def choose(self) -> Database:
+        """Return the database the next read of the current context should use."""
+        primary = self.primary
+        if not self.replicas or primary._current_connection() is not None:
+            return primary
+        if self.wrote_recently():
+            return primary
+        if self.max_lag is not None and (
+            self._probed_at is None
+            or time.monotonic() - self._probed_at >= self.lag_probe_interval
+        ):
+            await self.probe()
+        candidates = self.available()
+        if not candidates:
+            return primary
+        if self.strategy == "least_outstanding":
+            return min(candidates, key=lambda replica: self.outstanding[id(replica)])
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._cycle)]
+            if replica in candidates:
+                return replica
+        return candidates[0]
+
+    @contextlib.asynccontextmanager
+    async def route(self) -> AsyncGenerator[Database, None]:
+        """Yield the database for one read, counting it as outstanding meanwhile."""
+        database = await self.choose()
+        if database is self.primary:
+            yield database
+            return
+        self.outstanding[id(database)] += 1
+        try:
+            yield database
+        finally:
+            self.outstanding[id(database)] -= 1
+
+
+async def replication_lag(database: Database) -> float | None:
+    """Return how many seconds `database` trails its primary, when measurable.
+
+    PostgreSQL standbys report the age of the last replayed transaction, or
+    no lag once they have replayed all the WAL they received, since that age
+    keeps growing while the primary is idle. MySQL replicas report their
+    `Seconds_Behind_Source`. Other dialects, and servers that are not
+    replicating, return `None`.
+    """
+    dialect = database.url.dialect
+    if dialect in {"postgres", "postgresql"}:
+        value = await database.fetch_val(
+            sqlalchemy.text(
+                "SELECT CASE WHEN NOT pg_is_in_recovery() THEN NULL "
+                "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+                "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+                "END"
+            )
+        )
+        return None if value is None else float(value)
+    if dialect in {"mysql", "mariadb"}:
+        row = await database.fetch_one(sqlalchemy.text("SHOW REPLICA STATUS"))
+        if row is None:
+            return None
+        mapping = row._mapping
+        value = mapping.get("Seconds_Behind_Source", mapping.get("Seconds_Behind_Master"))
+        return float("inf") if value is None else float(value)
+    return None
+
+
+__all__ = ["ReplicaRouter", "ReplicaStrategy", "replication_lag", "track_writes"]
@@ -78,7 +78,9 @@ class Schema:
                 for model_class in getattr(self.registry, collection_name, {}).values():
                     if getattr(model_class, "__using_schema__", None) is not None:
                         continue
-                    table = model_class.table_schema(schema=schema, update_cache=update_cache)
+                    table = model_class.table_schema(
+                        schema=schema, update_cache=update_cache, translate=False
+                    )
                     schema_tables_by_metadata.setdefault(table.metadata, []).append(table)
 
         for database_name in databases:
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterator
+from typing import Any, NamedTuple
+
+import sqlalchemy
+
+from saffier.conf import settings
+
+
+class SchemaTableCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    schemas: int
+    tables: int
+    columns: int
+
+
+class SchemaTableCache:
+    """Bounded LRU of the per-schema `MetaData` holding schema-bound tables.
+
+    Tables built for a schema other than the registry default live in their own
+    `MetaData`, one per schema, so they never leak into the shared registry
+    metadata. Every model and the tenancy helpers share the same entry for a
+    schema, and the least recently used schemas are dropped once the cache
+    holds more than `maxsize` tables.
+
+    The size comes from the `schema_table_cache_size` setting unless `maxsize`
+    is given, and `None` keeps every schema. `info()` reports the hit, miss and
+    eviction counters together with the number of cached tables and columns.
+    """
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str | None, sqlalchemy.MetaData] = OrderedDict()
+        self._sizes: dict[str | None, tuple[int, int]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def of(cls, registry: Any) -> SchemaTableCache:
+        """Return the cache attached to `registry`, creating it when missing."""
+        cache: SchemaTableCache | None = getattr(registry, "schema_table_cache", None)
+        if cache is None:
+            cache = cls()
+            registry.schema_table_cache = cache
+        return cache
+
+    @property
+    def maxsize(self) -> int | None:
+        if self._maxsize is not None:
+            return self._maxsize
+        return settings.schema_table_cache_size
+
+    def metadata(self, schema: str | None) -> sqlalchemy.MetaData:
+        """Return the metadata for `schema`, creating an empty one on first use."""
+        metadata = self._entries.get(schema)
+        if metadata is None:
+            metadata = sqlalchemy.MetaData(schema=schema)
+            self._entries[schema] = metadata
+            self._sizes[schema] = (0, 0)
+        self._entries.move_to_end(schema)
+        return metadata
+
+    def touch(self, schema: str | None) -> sqlalchemy.MetaData | None:
+        """Mark `schema` as recently used and return its metadata, if cached."""
+        metadata = self._entries.get(schema)
+        if metadata is None:
+            return None
+        self._entries.move_to_end(schema)
+        return metadata
+
+    def get_table(self, schema: str | None, key: str) -> sqlalchemy.Table | None:
+        """Return the cached table stored under `key` for `schema`."""
+        metadata = self._entries.get(schema)
+        table = metadata.tables.get(key) if metadata is not None else None
+        if table is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(schema)
+        self.hits += 1
+        return table
+
+    def track(self, schema: str | None) -> None:
+        """Account for tables added to `schema` and evict the oldest schemas."""
+        metadata = self._entries.get(schema)
+        if metadata is None:
+            return
+        self._sizes[schema] = _measure(metadata)
+        maxsize = self.maxsize
+        if maxsize is None:
+            return
+        while len(self._entries) > 1 and self._table_count() > maxsize:
+            oldest = next(iter(self._entries))
+            if oldest == schema:
+                self._entries.move_to_end(schema)
+                continue
+            self.discard(oldest)
+            self.evictions += 1
+
+    def recount(self) -> None:
+        """Recompute the size of every cached schema after tables were removed."""
+        for schema, metadata in self._entries.items():
+            self._sizes[schema] = _measure(metadata)
+
+    def discard(self, schema: str | None) -> None:
+        """Forget the tables cached for `schema`."""
+        self._entries.pop(schema, None)
+        self._sizes.pop(schema, None)
+
+    def values(self) -> Iterator[sqlalchemy.MetaData]:
+        return iter(list(self._entries.values()))
+
+    def clear(self) -> None:
+        """Drop every cached schema and reset the counters."""
+        self._entries.clear()
+        self._sizes.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def info(self) -> SchemaTableCacheInfo:
+        return SchemaTableCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            maxsize=self.maxsize,
+            schemas=len(self._entries),
+            tables=self._table_count(),
+            columns=sum(columns for _, columns in self._sizes.values()),
+        )
+
+    def __contains__(self, schema: object) -> bool:
+        return schema in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _table_count(self) -> int:
+        return sum(tables for tables, _ in self._sizes.values())
+
+
+def _measure(metadata: sqlalchemy.MetaData) -> tuple[int, int]:
+    tables = metadata.tables.values()
+    return len(tables), sum(len(table.columns) for table in tables)
+
+
+__all__ = ["SchemaTableCache", "SchemaTableCacheInfo"]
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncGenerator, Iterator
+from contextvars import ContextVar
+from typing import Any
+
+import anyio
+import sqlalchemy
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from saffier.exceptions import QueryTimeoutError
+
+_DEADLINE: ContextVar[float | None] = ContextVar("saffier_query_deadline", default=None)
+_TIMEOUT: ContextVar[float | None] = ContextVar("saffier_query_timeout", default=None)
+
+# Extra time given to the server-side limit before the client gives up on the
+# connection, so the server can cancel the statement and report it first.
+SERVER_TIMEOUT_GRACE = 1.0
+
+# PostgreSQL `query_canceled`, MySQL `ER_QUERY_TIMEOUT` and MariaDB
+# `ER_STATEMENT_TIMEOUT`.
+_POSTGRES_TIMEOUT_CODES = {"57014"}
+_MYSQL_TIMEOUT_CODES = {3024, 1969}
+
+
+@contextlib.contextmanager
+def query_deadline(seconds: float) -> Iterator[float]:
+    """Share a budget of `seconds` between every query run inside the block.
+
+    Each statement gets the time left until the deadline, or its own timeout
+    when that is shorter, and statements starting after the deadline fail
+    without reaching the database. Nested deadlines never extend the outer one.
+
+    Yields:
+        float: The deadline, on the `time.monotonic()` clock.
+    """
+    deadline = time.monotonic() + seconds
+    outer = _DEADLINE.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+    token = _DEADLINE.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _DEADLINE.reset(token)
+
+
+def remaining_time() -> float | None:
+    """Return the seconds left until the active query deadline, if any."""
+    deadline = _DEADLINE.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+@contextlib.contextmanager
+def query_timeout(seconds: float | None) -> Iterator[None]:
+    """Apply `seconds` to the statements run inside the block.
+
+    This is how `QuerySet.timeout()` reaches the database helpers. An explicit
+    `timeout=` argument still takes precedence.
+    """
+    token = _TIMEOUT.set(seconds)
+    try:
+        yield
+    finally:
+        _TIMEOUT.reset(token)
+
+
+def resolve_timeout(timeout: float | None, default: float | None = None) -> float | None:
+    """Combine a statement timeout with the active query deadline.
+
+    Args:
+        timeout: Timeout passed to the execution helper.
+        default: Database-wide default used when neither `timeout` nor
+            `query_timeout()` set one.
+
+    Raises:
+        QueryTimeoutError: If the query deadline has already passed.
+    """
+    if timeout is None:
+        timeout = _TIMEOUT.get()
+    if timeout is None:
+        timeout = default
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise QueryTimeoutError(detail="The query deadline passed before the statement started.")
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def _is_server_timeout(exc: DBAPIError) -> bool:
+    orig = exc.orig
+    code = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    if code in _POSTGRES_TIMEOUT_CODES:
+        return True
+    args = getattr(orig, "args", ())
+    return bool(args) and args[0] in _MYSQL_TIMEOUT_CODES
+
+
+def _server_timeout_statements(
+    connection: AsyncConnection, timeout: float, *, local: bool = False
+) -> tuple[str, str | None] | None:
+    """Return the statements setting and resetting a server-side timeout.
+
+    With `local`, PostgreSQL scopes the setting to the current transaction,
+    which discards it on commit or rollback, so there is nothing to reset.
+    """
+    dialect = connection.dialect
+    milliseconds = max(1, int(timeout * 1000))
+    if dialect.name == "postgresql":
+        if local:
+            return f"SET LOCAL statement_timeout = {milliseconds}", None
+        return f"SET statement_timeout = {milliseconds}", "RESET statement_timeout"
+    if dialect.name in {"mysql", "mariadb"}:
+        if getattr(dialect, "is_mariadb", False):
+            return (
+                f"SET SESSION max_statement_time = {milliseconds / 1000}",
+                "SET SESSION max_statement_time = DEFAULT",
+            )
+        return (
+            f"SET SESSION max_execution_time = {milliseconds}",
+            "SET SESSION max_execution_time = DEFAULT",
+        )
+    return None
+
+
+@contextlib.asynccontextmanager
+async def limit_statement(
+    connection: AsyncConnection,
+    timeout: float | None,
+    *,
+    cancel: bool = True,
+    local: bool = False,
+) -> AsyncGenerator[None, None]:
+    """Cancel the statements run on `connection` inside the block after `timeout`.
+
+    PostgreSQL and MySQL enforce the limit on the server through
+    `statement_timeout` and `max_execution_time` (`max_statement_time` on
+    MariaDB), reset when the block exits. SQLite statements are interrupted
+    through the driver, which keeps the connection usable. Other dialects, and
+    servers that do not answer in time, are cancelled on the client, which
+    invalidates the connection.
+
+    Args:
+        connection: Connection the statements run on.
+        timeout: Seconds before the statements are cancelled. `None` disables
+            the limit.
+        cancel: Whether the client may cancel the block. Streams consumed
+            outside the block's task pass `False` and only get the server-side
+            and SQLite limits.
+        local: Whether the block runs inside a transaction owned by the
+            caller, so PostgreSQL can use `SET LOCAL` instead of setting and
+            resetting the session value.
+
+    Raises:
+        QueryTimeoutError: If the statements were cancelled.
+    """
+    if timeout is None:
+        yield
+        return
+    if connection.dialect.name == "sqlite":
+        async with _interrupt_after(connection, timeout):
+            yield
+        return
+
+    statements = _server_timeout_statements(connection, timeout, local=local)
+    if statements is not None:
+        await connection.execute(sqlalchemy.text(statements[0]))
+    client_timeout = timeout + SERVER_TIMEOUT_GRACE if statements is not None else timeout
+    try:
+        if cancel:
+            with anyio.fail_after(client_timeout):
+                yield
+        else:
+            yield
+    except TimeoutError:
+        if not connection.invalidated:
+            await connection.invalidate()
+        raise QueryTimeoutError(
+            detail=f"The statement was cancelled after {timeout:g} seconds."
+        ) from None
+    except DBAPIError as exc:
+        if _is_server_timeout(exc):
+            raise QueryTimeoutError(
+                detail=f"The statement was cancelled after {timeout:g} seconds."
+            ) from exc
+        raise
+    finally:
+        if statements is not None and statements[1] is not None and not connection.invalidated:
+            # An aborted transaction rejects the reset until it is rolled back,
+            # which also discards the setting.
+            with contextlib.suppress(DBAPIError):
+                await connection.execute(sqlalchemy.text(statements[1]))
+
+
+@contextlib.asynccontextmanager
+async def _interrupt_after(
+    connection: AsyncConnection, timeout: float
+) -> AsyncGenerator[None, None]:
+    """Interrupt the running SQLite statement once `timeout` has passed."""
+    driver_connection: Any = (await connection.get_raw_connection()).driver_connection
+    interrupting: list[asyncio.Task[None]] = []
+
+    def interrupt() -> None:
+        interrupting.append(asyncio.ensure_future(driver_connection.interrupt()))
+
+    handle = asyncio.get_running_loop().call_later(timeout, interrupt)
+    try:
+        yield
+    except DBAPIError as exc:
+        if interrupting and "interrupted" in str(exc.orig):
+            raise QueryTimeoutError(
+                detail=f"The statement was cancelled after {timeout:g} seconds."
+            ) from exc
+        raise
+    finally:
+        handle.cancel()
+
+
+__all__ = [
+    "limit_statement",
+    "query_deadline",
+    "query_timeout",
+    "remaining_time",
+    "resolve_timeout",
+]
@@ -4,10 +4,16 @@ from saffier.core.utils.db import with_force_fields_nullable as with_force_field
 from .context_vars import set_schema as set_schema
 from .context_vars import set_tenant as set_tenant
 from .context_vars import with_tenant as with_tenant
+from .identity import IdentityMap as IdentityMap
+from .identity import get_identity_map as get_identity_map
+from .identity import identity_map as identity_map
 from .querysets.mixins import with_schema as with_schema
 
 __all__ = [
     "FORCE_FIELDS_NULLABLE",
+    "IdentityMap",
+    "get_identity_map",
+    "identity_map",
     "set_schema",
     "set_tenant",
     "with_force_fields_nullable",
@@ -12,6 +12,9 @@ CURRENT_FIELD_CONTEXT: ContextVar[dict[str, Any]] = ContextVar("CURRENT_FIELD_CO
 CURRENT_INSTANCE: ContextVar[Any | None] = ContextVar("CURRENT_INSTANCE", default=None)
 CURRENT_MODEL_INSTANCE: ContextVar[Any | None] = ContextVar("CURRENT_MODEL_INSTANCE", default=None)
 CURRENT_PHASE: ContextVar[str] = ContextVar("CURRENT_PHASE", default="")
+TRANSLATED_SCHEMA: ContextVar[tuple[str | None] | None] = ContextVar(
+    "TRANSLATED_SCHEMA", default=None
+)
 EXPLICIT_SPECIFIED_VALUES: ContextVar[set[str] | None] = ContextVar(
     "EXPLICIT_SPECIFIED_VALUES",
     default=None,
@@ -73,6 +76,38 @@ def get_schema() -> str | None:
     return TENANT.get() or SHEMA.get()
 
 
+def get_translated_schema() -> str | None:
+    """Return the schema rendered for schema-less tables by the running statement.
+
+    Querysets executing under the ``use_schema_translate_map`` setting bind
+    their own ``using_schema`` through ``with_translated_schema``, which wins
+    over the tenant and plain schema contexts. Outside those executions the
+    effective context schema is used.
+    """
+    bound = TRANSLATED_SCHEMA.get()
+    if bound is None:
+        return get_schema()
+    return bound[0]
+
+
+@contextmanager
+def with_translated_schema(schema: str | None) -> Generator[None, None, None]:
+    """Render ``schema`` for schema-less tables while the block executes.
+
+    Args:
+        schema: Schema to translate the base tables to, or ``None`` to run
+            against the default schema even when a tenant is active.
+
+    Yields:
+        None: Control while the translation is bound.
+    """
+    token = TRANSLATED_SCHEMA.set((schema,))
+    try:
+        yield
+    finally:
+        TRANSLATED_SCHEMA.reset(token)
+
+
 def set_schema(value: str | None) -> None:
     """Set the plain schema context for subsequent queryset construction.
 
@@ -36,7 +36,7 @@ from saffier.core.db.fields._internal import (
 )
 from saffier.core.db.fields._internal import IPAddress as CoreIPAddress
 from saffier.core.files.base import FieldFile, File, ImageFieldFile
-from saffier.core.files.storage import Storage, storages
+from saffier.core.files.storage import Storage, run_in_storage_thread, storages
 from saffier.core.terminal import Print
 from saffier.core.utils.db import FORCE_FIELDS_NULLABLE
 from saffier.exceptions import (
@@ -2384,6 +2384,15 @@ class FileField(Field):
             metadata["mime"] = mime
         return metadata
 
+    async def aextract_metadata(self, field_file: FieldFile) -> dict[str, typing.Any]:
+        """
+        Run ``extract_metadata()`` in a storage worker thread.
+
+        MIME sniffing and image decoding read file content, so the async save
+        path keeps them off the event loop.
+        """
+        return await run_in_storage_thread(self.extract_metadata, field_file)
+
     def _file_size(self, field_file: FieldFile | None) -> int | None:
         """
         Return the persisted size value for a file wrapper.
@@ -2426,6 +2435,43 @@ class FileField(Field):
             payload[f"{field_name}_approved"] = bool(field_file.approved) if field_file else False
         return payload
 
+    async def pre_save_callback(
+        self,
+        value: typing.Any,
+        original_value: typing.Any,
+        is_update: bool,
+    ) -> dict[str, typing.Any]:
+        """
+        Store pending uploads and refresh metadata before a model save.
+
+        ``Model.save()`` and ``Model.update()`` await this hook, so storage
+        writes, MIME detection, image decoding and size lookups run in storage
+        worker threads. The prepared wrapper is then consumed by ``clean()``
+        without touching storage again, and released by
+        ``post_save_callback()`` if the save fails first.
+        """
+        del original_value, is_update
+        if not isinstance(value, FieldFile) or value.field is not self:
+            return {}
+        if not value.committed:
+            await value.asave(value, delete_old=False, instance=CURRENT_INSTANCE.get())
+        elif self.with_metadata:
+            value.metadata = await self.aextract_metadata(value)
+        if self.with_size and "size" not in value.__dict__:
+            await run_in_storage_thread(self._file_size, value)
+        value._prepared = True
+        return {}
+
+    def post_save_callback(self, value: typing.Any) -> None:
+        """
+        Drop the preparation made by ``pre_save_callback()`` once the save is over.
+
+        ``clean()`` normally consumes it, but a save failing in between would
+        otherwise leave it set and make a later ``clean()`` skip its storage work.
+        """
+        if isinstance(value, FieldFile):
+            value._prepared = False
+
     def clean(
         self, name: str, value: typing.Any, *, for_query: bool = False
     ) -> dict[str, typing.Any]:
@@ -2444,7 +2490,9 @@ class FileField(Field):
             return {name: field_file.name}
 
         current_instance = CURRENT_INSTANCE.get()
-        if field_file is not None and not field_file.committed:
+        if field_file is not None and field_file._prepared:
+            field_file._prepared = False
+        elif field_file is not None and not field_file.committed:
             field_file.save(field_file, delete_old=False, instance=current_instance)
         elif field_file is not None and self.with_metadata:
             field_file.metadata = self.extract_metadata(field_file)
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import copy
+from collections import OrderedDict
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from saffier.conf import settings
+
+if TYPE_CHECKING:
+    from saffier.core.db.models.model import Model
+
+IdentityKey = tuple[Any, str | None, tuple[Any, ...]]
+
+IDENTITY_MAP: ContextVar[IdentityMap | None] = ContextVar("IDENTITY_MAP", default=None)
+
+
+class IdentityMapInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    pending: int
+
+
+def _snapshot_value(value: Any) -> Any:
+    if hasattr(value, "pk") and hasattr(value, "meta"):
+        return value.pk
+    if isinstance(value, (dict, list, set)):
+        return copy.copy(value)
+    return value
+
+
+class IdentityMap:
+    """Bounded map of the model instances loaded in one unit of work.
+
+    Rows loaded while the map is active resolve to the instance already held
+    for their model, schema and primary key, so every part of a request works
+    on the same object. `QuerySet.get()` by primary key and foreign key
+    placeholders are answered from the map without touching the database.
+
+    Loaded instances are snapshotted, and `flush()` writes the changes made to
+    them since, together with the instances registered through `add()`, with
+    one `bulk_create()` per model and one `bulk_update()` per set of changed
+    fields.
+
+    The size comes from the `identity_map_size` setting unless `maxsize` is
+    given. Past that size the least recently used clean instances are dropped;
+    instances with unflushed changes are kept until the next `flush()`.
+    """
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[IdentityKey, Model] = OrderedDict()
+        self._snapshots: dict[IdentityKey, dict[str, Any]] = {}
+        self._keys: dict[int, IdentityKey] = {}
+        self._pending: list[Model] = []
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is not None:
+            return self._maxsize
+        return settings.identity_map_size or 0
+
+    @staticmethod
+    def key_for(
+        model_class: Any, primary_key: dict[str, Any], schema: str | None = None
+    ) -> IdentityKey | None:
+        """Return the identity of a row, or `None` when its primary key is incomplete."""
+        values = tuple(primary_key.get(name) for name in model_class.pknames)
+        if any(value is None for value in values):
+            return None
+        return (model_class.get_real_class(), schema, values)
+
+    @classmethod
+    def identity(cls, instance: Any, schema: str | None = None) -> IdentityKey | None:
+        """Return the identity of `instance`, read from `schema` or its table schema."""
+        model_class = type(instance)
+        return cls.key_for(
+            model_class,
+            {name: getattr(instance, name, None) for name in model_class.pknames},
+            schema if schema is not None else getattr(instance.table, "schema", None),
+        )
+
+    def _key_of(self, instance: Any) -> IdentityKey | None:
+        """Return the key `instance` is tracked under, or its computed identity."""
+        key = self._keys.get(id(instance))
+        if key is not None and self._entries.get(key) is instance:
+            return key
+        return self.identity(instance)
+
+    def get(
+        self, model_class: Any, primary_key: dict[str, Any], schema: str | None = None
+    ) -> Model | None:
+        """Return the instance held for the given primary key values, if any."""
+        key = self.key_for(model_class, primary_key, schema)
+        instance = self._entries.get(key) if key is not None else None
+        if instance is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)  # type: ignore[arg-type]
+        self.hits += 1
+        return instance
+
+    def merge(self, instance: Model, schema: str | None = None) -> Model:
+        """Return the instance already held for `instance`'s row, or start tracking it.
+
+        `schema` is the schema the row was read from. Querysets pass it because
+        under `use_schema_translate_map` the instance table carries no schema.
+        """
+        key = self.identity(instance, schema)
+        if key is None:
+            return instance
+        existing = self._entries.get(key)
+        if existing is not None:
+            self._entries.move_to_end(key)
+            return existing
+        self._track(key, instance)
+        return instance
+
+    def add(self, instance: Model) -> None:
+        """Register a new instance to be inserted by the next `flush()`."""
+        self._pending.append(instance)
+
+    def discard(self, instance: Model) -> None:
+        """Stop tracking `instance`."""
+        self._pending = [pending for pending in self._pending if pending is not instance]
+        key = self._key_of(instance)
+        if key is not None and self._entries.get(key) is instance:
+            del self._entries[key]
+            self._snapshots.pop(key, None)
+            self._keys.pop(id(instance), None)
+
+    def clear(self) -> None:
+        """Drop every tracked instance and reset the counters."""
+        self._entries.clear()
+        self._snapshots.clear()
+        self._keys.clear()
+        self._pending.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def changed_fields(self, instance: Model) -> list[str]:
+        """Return the fields of a tracked instance changed since it was loaded."""
+        key = self._key_of(instance)
+        snapshot = self._snapshots.get(key) if key is not None else None
+        if snapshot is None:
+            return []
+        current = self._snapshot(instance)
+        return [name for name, value in current.items() if snapshot.get(name, value) != value]
+
+    def dirty(self) -> list[Model]:
+        """Return the tracked instances with unflushed changes."""
+        return [instance for instance in self._entries.values() if self.changed_fields(instance)]
+
+    async def flush(self) -> None:
+        """Write pending inserts and the changes of tracked instances.
+
+        New instances are inserted with one `bulk_create()` per model and
+        schema. Changed instances are updated with one `bulk_update()` per
+        model, schema and set of changed fields. Written instances are
+        snapshotted again, so a second `flush()` only sends newer changes.
+        """
+        inserts: dict[tuple[Any, str | None], list[Model]] = {}
+        for instance in self._pending:
+            model_class = type(instance).get_real_class()
+            inserts.setdefault((model_class, getattr(instance.table, "schema", None)), []).append(
+                instance
+            )
+        updates: dict[tuple[Any, str | None, tuple[str, ...]], list[Model]] = {}
+        for key, instance in self._entries.items():
+            fields = self.changed_fields(instance)
+            if fields:
+                updates.setdefault((key[0], key[1], tuple(sorted(fields))), []).append(instance)
+
+        for (model_class, schema), instances in inserts.items():
+            created = await model_class.query.using(schema=schema).bulk_create(
+                instances, return_instances=True
+            )
+            for instance, row in zip(instances, created, strict=True):
+                for name in model_class.pknames:
+                    setattr(instance, name, getattr(row, name))
+                self._pending.remove(instance)
+                self.merge(instance, schema)
+
+        for (model_class, schema, fields), instances in updates.items():
+            await model_class.query.using(schema=schema).bulk_update(instances, list(fields))
+            for instance in instances:
+                key = self._key_of(instance)
+                if key is not None:
+                    self._snapshots[key] = self._snapshot(instance)
+        self._evict()
+
+    def info(self) -> IdentityMapInfo:
+        return IdentityMapInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._entries),
+            pending=len(self._pending),
+        )
+
+    def __contains__(self, instance: Any) -> bool:
+        key = self._key_of(instance)
+        return key is not None and self._entries.get(key) is instance
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _snapshot(instance: Model) -> dict[str, Any]:
+        return {
+            name: _snapshot_value(value) for name, value in instance.extract_db_fields().items()
+        }
+
+    def _track(self, key: IdentityKey, instance: Model) -> None:
+        self._entries[key] = instance
+        self._snapshots[key] = self._snapshot(instance)
+        self._keys[id(instance)] = key
+        self._evict()
+
+    def _evict(self) -> None:
+        overflow = len(self._entries) - self.maxsize
+        if overflow <= 0:
+            return
+        for key in list(self._entries):
+            if overflow <= 0:
+                break
+            instance = self._entries[key]
+            if self.changed_fields(instance):
+                continue
+            del self._entries[key]
+            self._snapshots.pop(key, None)
+            self._keys.pop(id(instance), None)
+            overflow -= 1
+
+
+def get_identity_map() -> IdentityMap | None:
+    """Return the identity map bound to the current context, if any."""
+    return IDENTITY_MAP.get()
+
+
+@contextmanager
+def identity_map(maxsize: int | None = None) -> Generator[IdentityMap, None, None]:
+    """Track the instances loaded in the current context in a fresh `IdentityMap`.
+
+    Nothing is written on exit; call `flush()` to persist the tracked changes.
+
+    Args:
+        maxsize: Maximum number of tracked instances. Defaults to the
+            `identity_map_size` setting.
+
+    Yields:
+        IdentityMap: The map active for the duration of the block.
+    """
+    session = IdentityMap(maxsize)
+    token = IDENTITY_MAP.set(session)
+    try:
+        yield session
+    finally:
+        IDENTITY_MAP.reset(token)
+
+
+__all__ = ["IdentityMap", "IdentityMapInfo", "get_identity_map", "identity_map"]
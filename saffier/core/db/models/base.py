@@ -2,6 +2,7 @@
 
 import copy
 import functools
+import weakref
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, cast, get_args, get_origin
 
@@ -11,6 +12,7 @@ from typing_extensions import Self
 
 import saffier
 from saffier.conf import settings
+from saffier.core.connection.table_cache import SchemaTableCache
 from saffier.core.db.context_vars import (
     CURRENT_FIELD_CONTEXT,
     CURRENT_INSTANCE,
@@ -74,12 +76,34 @@ class SaffierBaseModel(DateParser, metaclass=BaseModelMeta):
     __skip_generic_reverse_delete__: ClassVar[bool] = False
 
     def __init__(self, *model_refs: Any, **kwargs: Any) -> None:
+        self._setup_instance_state()
+        self.setup_model_fields_from_kwargs(model_refs, kwargs)
+
+    def _setup_instance_state(self) -> None:
         self.__dict__["__no_load_trigger_attrs__"] = set(
             getattr(self.__class__, "__no_load_trigger_attrs__", set())
         )
         self.__dict__["_db_deleted"] = False
         self.__dict__["transaction"] = functools.partial(self._instance_transaction)
-        self.setup_model_fields_from_kwargs(model_refs, kwargs)
+
+    @classmethod
+    def _from_column_values(cls, values: dict[str, Any]) -> Self:
+        """Build an instance from column values without running the field setters.
+
+        Row loaders use it for foreign-key placeholders whose primary-key values
+        come straight from the database and need no normalization. Only plain
+        column fields may be passed.
+
+        Args:
+            values: Column values keyed by field name.
+
+        Returns:
+            Self: Instance holding exactly `values`.
+        """
+        instance = cls.__new__(cls)
+        instance._setup_instance_state()
+        instance.__dict__.update(values)
+        return instance
 
     @staticmethod
     def _is_model_ref_instance(value: Any) -> bool:
@@ -499,10 +523,15 @@ class SaffierBaseModel(DateParser, metaclass=BaseModelMeta):
 
     @property
     def table(self) -> sqlalchemy.Table:
+        explicit = self.__dict__.get("__using_schema__", None)
+        if explicit is not None and self.__dict__.get("_table", None) is None:
+            return cast("sqlalchemy.Table", self.__class__.table_schema(explicit, translate=False))
         if getattr(self, "_table", None) is None:
             schema = self.get_active_instance_schema()
             if schema is not None:
-                return cast("sqlalchemy.Table", self.__class__.table_schema(schema))
+                return cast(
+                    "sqlalchemy.Table", self.__class__.table_schema(schema, translate=False)
+                )
             return cast("sqlalchemy.Table", self.__class__.table)
         return self._table
 
@@ -902,7 +931,7 @@ class SaffierBaseModel(DateParser, metaclass=BaseModelMeta):
         cls.meta.model = cls
         cls.fields = cls.meta.fields
         cls._table = None
-        cls._db_schemas = {}
+        cls._db_schemas = weakref.WeakValueDictionary()
 
         for field_name, field in cls.fields.items():
             field.owner = cls
@@ -1020,13 +1049,7 @@ class SaffierBaseModel(DateParser, metaclass=BaseModelMeta):
             )
         else:
             registry_metadata = cast("sqlalchemy.MetaData", registry._metadata)  # type: ignore
-        schema_metadata_cache: dict[str | None, sqlalchemy.MetaData] = getattr(
-            registry,
-            "_schema_metadata_cache",
-            {},
-        )
-        if not hasattr(registry, "_schema_metadata_cache"):
-            registry._schema_metadata_cache = schema_metadata_cache
+        schema_tables = SchemaTableCache.of(registry)
         registry_schema = registry.db_schema
 
         # Keep tenant/using table generation isolated from the shared registry
@@ -1035,9 +1058,7 @@ class SaffierBaseModel(DateParser, metaclass=BaseModelMeta):
             metadata = registry_metadata
             metadata.schema = schema
         else:
-            if schema not in schema_metadata_cache:
-                schema_metadata_cache[schema] = sqlalchemy.MetaData(schema=schema)
-            metadata = schema_metadata_cache[schema]
+            metadata = schema_tables.metadata(schema)
 
         table_key = tablename if schema is None else f"{schema}.{tablename}"
         existing_table = metadata.tables.get(table_key)
@@ -1075,7 +1096,7 @@ class SaffierBaseModel(DateParser, metaclass=BaseModelMeta):
             constraints.append(constraint)
         constraints.extend(field_constraints)
 
-        return sqlalchemy.Table(
+        table = sqlalchemy.Table(
             tablename,
             metadata,
             *columns,
@@ -1084,6 +1105,9 @@ class SaffierBaseModel(DateParser, metaclass=BaseModelMeta):
             *constraints,
             extend_existing=True,  # type: ignore
         )
+        if schema != registry_schema:
+            schema_tables.track(schema)
+        return table
 
     @classmethod
     def _get_unique_constraints(cls, columns: Sequence) -> sqlalchemy.UniqueConstraint | None:
@@ -1366,28 +1390,23 @@ class SaffierBaseReflectModel(SaffierBaseModel, metaclass=BaseModelReflectMeta):
             )
         else:
             registry_metadata = cast("sqlalchemy.MetaData", registry._metadata)  # type: ignore
-        schema_metadata_cache: dict[str | None, sqlalchemy.MetaData] = getattr(
-            registry,
-            "_schema_metadata_cache",
-            {},
-        )
-        if not hasattr(registry, "_schema_metadata_cache"):
-            registry._schema_metadata_cache = schema_metadata_cache
+        schema_tables = SchemaTableCache.of(registry)
         registry_schema = registry.db_schema
 
         if schema == registry_schema:
             metadata = registry_metadata
             metadata.schema = schema
         else:
-            if schema not in schema_metadata_cache:
-                schema_metadata_cache[schema] = sqlalchemy.MetaData(schema=schema)
-            metadata = schema_metadata_cache[schema]
+            metadata = schema_tables.metadata(schema)
         tablename: str = cast("str", cls.meta.tablename)
         table_key = tablename if schema is None else f"{schema}.{tablename}"
         existing_table = metadata.tables.get(table_key)
         if existing_table is not None:
             return existing_table
-        return cls.reflect(tablename, metadata)
+        table = cls.reflect(tablename, metadata)
+        if schema != registry_schema:
+            schema_tables.track(schema)
+        return table
 
     @classmethod
     def reflect(cls, tablename: str, metadata: sqlalchemy.MetaData) -> sqlalchemy.Table:
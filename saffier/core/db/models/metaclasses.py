@@ -7,6 +7,7 @@ metadata, SQLAlchemy tables, reverse relations, and manager wiring.
 import contextlib
 import copy
 import inspect
+import weakref
 from collections import UserDict, deque
 from collections.abc import Sequence
 from typing import (
@@ -23,6 +24,7 @@ import sqlalchemy
 import saffier
 from saffier.conf import settings
 from saffier.core.connection.registry import Registry
+from saffier.core.connection.table_cache import SchemaTableCache
 from saffier.core.db import fields as saffier_fields
 from saffier.core.db.datastructures import Index, UniqueConstraint
 from saffier.core.db.fields import BigIntegerField, Field
@@ -454,7 +456,7 @@ class MetaInfo:
             for attr in ("_table", "_pknames", "_pkcolumns", "__proxy_model__"):
                 with contextlib.suppress(AttributeError):
                     delattr(self.model, attr)
-            self.model._db_schemas = {}
+            self.model._db_schemas = weakref.WeakValueDictionary()
 
     def full_init(self, init_column_mappers: bool = True, init_class_attrs: bool = True) -> None:
         """Eagerly initialize all lazily computed metadata structures.
@@ -1129,7 +1131,7 @@ class BaseModelMeta(type):
 
         meta.parents = parents
         new_class = cast("type[Model]", model_class(cls, name, bases, attrs))
-        new_class._db_schemas = {}
+        new_class._db_schemas = weakref.WeakValueDictionary()
 
         manager_annotations = inspect.get_annotations(new_class, eval_str=True)
         for manager_name in declared_manager_names:
@@ -1421,19 +1423,29 @@ class BaseModelMeta(type):
         *,
         metadata: sqlalchemy.MetaData | None = None,
         update_cache: bool = False,
+        translate: bool = True,
     ) -> Any:
         """Return the model table bound to a specific schema.
 
         Saffier caches one SQLAlchemy `Table` per schema so tenant-specific or
         manually selected schemas do not mutate the shared registry metadata. If
         the requested schema matches the registry default schema, the shared
-        table cache is used. Otherwise a per-schema table is built and cached in
+        table cache is used. Otherwise the table comes from the registry's
+        bounded `schema_table_cache`, built on a miss, and is indexed weakly in
         `_db_schemas`.
 
+        With the `use_schema_translate_map` setting enabled, schema-less base
+        tables are returned for every schema instead. Querysets bind their
+        `using_schema` while they execute and the database renders it through
+        SQLAlchemy's `schema_translate_map`, so no per-schema table is built.
+
         Args:
             schema: Schema name to bind the table to.
             metadata: Accepted for compatibility with related APIs but ignored.
             update_cache: When `True`, force rebuilding the cached table.
+            translate: Whether the base table may stand in for `schema` under
+                `use_schema_translate_map`. Schema DDL and model instances pass
+                `False` to get the schema-bound table.
 
         Returns:
             Any: The SQLAlchemy table object for the requested schema.
@@ -1443,7 +1455,14 @@ class BaseModelMeta(type):
             parent = getattr(cls, "parent", None)
             if parent is None:
                 raise AttributeError("No parent model found for proxy model.")
-            return parent.table_schema(schema=schema, update_cache=update_cache)
+            return parent.table_schema(
+                schema=schema, update_cache=update_cache, translate=translate
+            )
+
+        if translate and schema is not None and settings.use_schema_translate_map:
+            base_table = cls.table
+            if base_table.schema is None:
+                return base_table
 
         table = getattr(cls, "_table", None)
         if (
@@ -1459,13 +1478,12 @@ class BaseModelMeta(type):
                 cls._table = cls.build(schema=schema)
             return cls.table
 
-        schema_obj = cls._db_schemas.pop(schema, None)
+        schema_obj = SchemaTableCache.of(cls.meta.registry).get_table(
+            schema, f"{schema}.{cls.meta.tablename}"
+        )
         if schema_obj is None or update_cache:
             schema_obj = cls.build(schema=schema)
         cls._db_schemas[schema] = schema_obj
-        while len(cls._db_schemas) > 100:
-            cls._db_schemas.pop(next(iter(cls._db_schemas)), None)
-
         return schema_obj
 
     @property
@@ -17,6 +17,7 @@ from saffier.core.db.models.base import SaffierBaseReflectModel
 from saffier.core.db.models.mixins.admin import AdminMixin
 from saffier.core.db.models.mixins.generics import DeclarativeMixin
 from saffier.core.db.models.row import ModelRow
+from saffier.core.db.querysets.loader import attach_sibling_loaders, get_sibling_loader
 from saffier.core.utils.db import check_db_connection
 from saffier.core.utils.schemas import Schema
 from saffier.core.utils.sync import force_current_loop_for_sqlalchemy, run_sync
@@ -301,6 +302,20 @@ class Model(ModelRow, DeclarativeMixin, AdminMixin):
         finally:
             CURRENT_INSTANCE.reset(token)
 
+    def execute_post_save_hooks(self, field_values: dict[str, typing.Any]) -> None:
+        """Let fields release what their pre-save callbacks prepared.
+
+        It runs once the save is over, whether the write succeeded or not.
+
+        Args:
+            field_values: Field payload that was handed to the pre-save hooks.
+        """
+        for field_name, value in field_values.items():
+            field = self.fields.get(field_name)
+            post_save_callback = getattr(field, "post_save_callback", None)
+            if callable(post_save_callback):
+                post_save_callback(value)
+
     def _should_force_insert(self) -> bool:
         for field_name in type(self).pknames:
             field = self.fields.get(field_name)
@@ -399,32 +414,37 @@ class Model(ModelRow, DeclarativeMixin, AdminMixin):
                 field_validator.read_only = False
             fields[key] = field_validator
         validator = Schema(fields=fields)
-        token = EXPLICIT_SPECIFIED_VALUES.set(set(normalized_kwargs.keys()))
         try:
-            hook_values = await self.execute_pre_save_hooks(
-                field_values,
-                original_field_values,
+            token = EXPLICIT_SPECIFIED_VALUES.set(set(normalized_kwargs.keys()))
+            try:
+                hook_values = await self.execute_pre_save_hooks(
+                    field_values,
+                    original_field_values,
+                    is_update=True,
+                )
+            finally:
+                EXPLICIT_SPECIFIED_VALUES.reset(token)
+            validated_kwargs = validator.check(db_kwargs)
+            db_kwargs = self.__class__.extract_column_values(
+                validated_kwargs,
                 is_update=True,
+                is_partial=True,
+                phase="prepare_update",
+                instance=self,
+                model_instance=self,
             )
-        finally:
-            EXPLICIT_SPECIFIED_VALUES.reset(token)
-        validated_kwargs = validator.check(db_kwargs)
-        db_kwargs = self.__class__.extract_column_values(
-            validated_kwargs,
-            is_update=True,
-            is_partial=True,
-            phase="prepare_update",
-            instance=self,
-            model_instance=self,
-        )
-        db_kwargs.update(hook_values)
-        db_kwargs = self._update_auto_now_fields(db_kwargs, self.fields)
+            db_kwargs.update(hook_values)
+            db_kwargs = self._update_auto_now_fields(db_kwargs, self.fields)
 
-        if db_kwargs:
-            expression = self.table.update().values(**db_kwargs).where(*self.identifying_clauses())
-            check_db_connection(self.database)
-            async with self.database as database:
-                await database.execute(expression)
+            if db_kwargs:
+                expression = (
+                    self.table.update().values(**db_kwargs).where(*self.identifying_clauses())
+                )
+                check_db_connection(self.database)
+                async with self.database as database:
+                    await database.execute(expression)
+        finally:
+            self.execute_post_save_hooks(field_values)
         await self.signals.post_update.send(sender=self.__class__, instance=self)
         self._apply_persisted_db_values(db_kwargs)
 
@@ -618,6 +638,71 @@ class Model(ModelRow, DeclarativeMixin, AdminMixin):
                 continue
             setattr(self, key, value)
 
+    @classmethod
+    async def aload_many(
+        cls, objs: Sequence["Model"], fields: Sequence[str] | None = None
+    ) -> None:
+        """Load the missing database fields of many instances at once.
+
+        Instances are grouped by table and database, and every group is read
+        with one `IN` query on the identifying columns per
+        `prefetch_chunk_size` keys. Only fields that are not loaded yet are
+        filled in, so pending changes on the instances are kept.
+
+        Args:
+            objs: Instances to complete. Already loaded instances and
+                placeholders without a primary key are skipped.
+            fields: Field names that must be loaded. Defaults to every
+                database-backed field.
+        """
+        names = (
+            [name for name, field in cls.fields.items() if field.has_column()]
+            if fields is None
+            else list(fields)
+        )
+        column_names = tuple(cls.pkcolumns) or (cls.pkname,)
+        groups: dict[tuple[int, int], tuple[Any, Any, dict[tuple[Any, ...], list[Model]]]] = {}
+        for obj in objs:
+            if all(name in obj.__dict__ for name in names) or not obj.can_load:
+                continue
+            table, database = obj.table, obj.database
+            _, _, pending = groups.setdefault((id(table), id(database)), (table, database, {}))
+            key = tuple(
+                obj._normalize_identifier_value(getattr(obj, column_name))
+                for column_name in column_names
+            )
+            if None in key:
+                continue
+            pending.setdefault(key, []).append(obj)
+
+        for table, database, pending in groups.values():
+            columns = [table.c[column_name] for column_name in column_names]
+            keys = list(pending)
+            chunk_size = settings.prefetch_chunk_size or len(keys)
+            check_db_connection(database)
+            async with database as connection:
+                for start in range(0, len(keys), chunk_size):
+                    chunk = keys[start : start + chunk_size]
+                    clause = (
+                        columns[0].in_([key[0] for key in chunk])
+                        if len(columns) == 1
+                        else sqlalchemy.tuple_(*columns).in_(chunk)
+                    )
+                    rows = await connection.fetch_all(table.select().where(clause))
+                    for row in rows:
+                        key = tuple(row._mapping[column.key] for column in columns)
+                        instances = pending.get(key, [])
+                        if not instances:
+                            continue
+                        loaded = cls.from_query_result(
+                            row, using_schema=instances[0].get_active_instance_schema()
+                        )
+                        for obj in instances:
+                            for name, value in loaded.__dict__.items():
+                                if name in cls.fields and name not in obj.__dict__:
+                                    setattr(obj, name, value)
+            attach_sibling_loaders([obj for instances in pending.values() for obj in instances])
+
     async def _save(self, **kwargs: typing.Any) -> "Model":
         """Insert a new row and reapply generated database values to the instance.
 
@@ -677,6 +762,7 @@ class Model(ModelRow, DeclarativeMixin, AdminMixin):
         if force_insert is None:
             force_insert = bool(force_save)
         self.__dict__["_saffier_save_in_progress"] = True
+        hooked_values: dict[str, typing.Any] = {}
         try:
             await self.signals.pre_save.send(sender=self.__class__, instance=self)
 
@@ -709,6 +795,7 @@ class Model(ModelRow, DeclarativeMixin, AdminMixin):
             self.update_from_dict(dict(extracted_fields.items()))
             is_create = bool(force_insert) or not self.can_load or self._should_force_insert()
             token = EXPLICIT_SPECIFIED_VALUES.set(explicit_field_names)
+            hooked_values = extracted_fields
             try:
                 hook_values = await self.execute_pre_save_hooks(
                     extracted_fields,
@@ -776,6 +863,7 @@ class Model(ModelRow, DeclarativeMixin, AdminMixin):
             return self
         finally:
             self.__dict__.pop("_saffier_save_in_progress", None)
+            self.execute_post_save_hooks(hooked_values)
 
     async def real_save(
         self,
@@ -801,8 +889,9 @@ class Model(ModelRow, DeclarativeMixin, AdminMixin):
 
         The fallback handles computed fields, virtual relations, and unloaded
         database-backed fields. Accessing an unloaded DB field triggers a
-        synchronous `load()` call through `run_sync()` unless the attribute was
-        explicitly marked as a no-load trigger.
+        synchronous load through `run_sync()` unless the attribute was
+        explicitly marked as a no-load trigger. Instances hydrated by the same
+        queryset evaluation are loaded together with one query.
 
         Args:
             name: Attribute being resolved.
@@ -825,8 +914,9 @@ class Model(ModelRow, DeclarativeMixin, AdminMixin):
                 raise AttributeError(name)
             if name in getattr(self, "__no_load_trigger_attrs__", set()):
                 raise AttributeError(name)
+            loader = get_sibling_loader(self)
             with force_current_loop_for_sqlalchemy():
-                run_sync(self.load())
+                run_sync(self.load() if loader is None else loader.load(self))
             return self.__dict__[name]
         raise AttributeError(name)
 
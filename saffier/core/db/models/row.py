@@ -1,10 +1,13 @@
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any, Optional, cast
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, cast
 
 from sqlalchemy.engine.result import Row
 
+from saffier.conf import settings
 from saffier.core.db import fields as saffier_fields
+from saffier.core.db.identity import get_identity_map
 from saffier.core.db.models.base import SaffierBaseModel
+from saffier.core.db.relationships.related import RelatedField
 from saffier.core.utils.sync import force_current_loop_for_sqlalchemy, run_sync
 from saffier.exceptions import QuerySetError
 
@@ -14,6 +17,40 @@ if TYPE_CHECKING:  # pragma: no cover
 saffier_setattr = object.__setattr__
 
 
+class ForeignKeyLoaderPlan(NamedTuple):
+    """Precomputed placeholder construction for one foreign key.
+
+    `lookups` hold `(related_key, position, column, column_name)` entries, where
+    `position` is the index of the column in the rows, when known. Targets with
+    `plain` set are built without running their field setters.
+    """
+
+    name: str
+    target: Any
+    lookups: tuple[tuple[str, int | None, Any, str], ...]
+    null: bool
+    plain: bool
+    table: Any
+
+
+class RowLoaderPlan(NamedTuple):
+    """Precomputed hydration steps for one model branch of a query.
+
+    Plans are compiled once per result set by `ModelRow.compile_row_loader`
+    and applied to every row by `ModelRow.from_row_loader`. `columns` hold
+    `(key, position, column)` entries like the foreign-key lookups.
+    """
+
+    model_class: Any
+    instance_class: Any
+    children: tuple[tuple[str, "RowLoaderPlan"], ...]
+    foreign_keys: tuple[ForeignKeyLoaderPlan, ...]
+    columns: tuple[tuple[str, int | None, Any], ...]
+    exclude_secrets: bool
+    using_schema: str | None
+    table: Any
+
+
 class ModelRow(SaffierBaseModel):
     """Build model instances from raw SQLAlchemy row objects.
 
@@ -121,6 +158,265 @@ class ModelRow(SaffierBaseModel):
             prefetch_related=prefetch_related,
         )
 
+    @classmethod
+    async def apply_prefetch_related_many(
+        cls,
+        rows: Sequence[Row],
+        models: Sequence[type["Model"]],
+        prefetch_related: Sequence["Prefetch"],
+        using_schema: str | None = None,
+    ) -> list[type["Model"]]:
+        """Apply prefetch directives to a batch of materialized model instances.
+
+        Every prefetch that can be expressed as a join between the parent and
+        the prefetched model costs two queries for the whole batch: one fetching
+        `(parent, child)` key pairs for all parents at once and one loading the
+        child records through the prefetch queryset. The records are then
+        distributed back to their parents. Shapes that cannot be expressed that
+        way fall back to `apply_prefetch_related()` row by row.
+
+        Args:
+            rows (Sequence[Row]): Source rows, aligned with `models`.
+            models (Sequence[type[Model]]): Model instances returned by row
+                materialization.
+            prefetch_related (Sequence[Prefetch]): Prefetch directives attached
+                to the queryset.
+            using_schema (str | None): Schema the parent rows were read from.
+
+        Returns:
+            list[type[Model]]: The same model instances after all prefetch
+            targets have been attached.
+
+        Raises:
+            QuerySetError: If `to_attr` would overwrite an existing attribute.
+        """
+        if not prefetch_related or not models:
+            return list(models)
+
+        for prefetch in prefetch_related:
+            for model in models:
+                if hasattr(model, prefetch.to_attr):
+                    raise QuerySetError(
+                        f"Conflicting attribute to_attr='{prefetch.related_name}' with '{prefetch.to_attr}' in {model.__class__.__name__}"
+                    )
+
+            plan = cls.__resolve_prefetch_plan(models[0], prefetch)
+            if plan is None:
+                for row, model in zip(rows, models, strict=True):
+                    await cls.__handle_prefetch_related_async(
+                        row=row, model=model, prefetch_related=[prefetch]
+                    )
+                continue
+
+            join_model, join_path, keys_on_root, target_model = plan
+            grouped = await cls.__fetch_prefetch_groups(
+                models,
+                prefetch,
+                join_model=join_model,
+                join_path=join_path,
+                keys_on_root=keys_on_root,
+                target_model=target_model,
+                using_schema=using_schema,
+            )
+            for model in models:
+                key = tuple(model._pk_values().values())
+                saffier_setattr(model, prefetch.to_attr, grouped.get(key, []))
+        return list(models)
+
+    @classmethod
+    def __resolve_prefetch_plan(
+        cls, model: type["Model"], prefetch: "Prefetch"
+    ) -> tuple[type["Model"], str, bool, type["Model"]] | None:
+        """Describe a prefetch as a single join, when possible.
+
+        Mirrors the branches of `__handle_prefetch_related_async`: paths that
+        can be followed from the parent are joined from the parent, while the
+        upward nested form (`"studios__tracks"`) and the explicit queryset form
+        (`Prefetch("tracks_set", queryset=...)`) are joined from the
+        prefetched model back to the parent.
+
+        Args:
+            model (type[Model]): One of the materialized parent instances.
+            prefetch (Prefetch): Prefetch directive to resolve.
+
+        Returns:
+            tuple | None: `(join_model, join_path, keys_on_root, target_model)`
+            or `None` when the prefetch must be resolved row by row.
+        """
+        if len(cls.pknames) != len(cls.pkcolumns) or len(cls.pknames) == 0:
+            return None
+
+        queryset = prefetch.queryset
+        if queryset is not None and (
+            queryset.limit_count is not None or queryset._offset is not None
+        ):
+            return None
+
+        related_name = prefetch.related_name
+        parts = related_name.split("__")
+        first_part = parts[0]
+        is_navigable = isinstance(
+            cls.fields.get(first_part), saffier_fields.ManyToManyField
+        ) or hasattr(model, first_part)
+
+        if len(parts) == 1 and queryset is not None:
+            join_model = queryset.model_class
+            walked = cls.__walk_prefetch_path(join_model, related_name)
+            if walked is not None and walked[0] in cls.__prefetch_parent_classes():
+                return join_model, walked[1], False, join_model
+            walked = cls.__walk_prefetch_path(cls, related_name) if is_navigable else None
+            if walked is None or walked[0] is not join_model:
+                return None
+
+        if is_navigable:
+            walked = cls.__walk_prefetch_path(cls, related_name)
+            if walked is None:
+                return None
+            return cls, walked[1], True, walked[0]
+
+        if len(parts) == 1:
+            return None
+
+        current = cls
+        for part in parts[:-1]:
+            if isinstance(current.fields.get(part), saffier_fields.ManyToManyField) or hasattr(
+                model, part
+            ):
+                return None
+            related_field = current.meta.related_fields.get(part)
+            if related_field is None:
+                return None
+            current = related_field.related_to
+
+        last_part = parts[-1]
+        if isinstance(current.fields.get(last_part), saffier_fields.ManyToManyField) or hasattr(
+            model, last_part
+        ):
+            return None
+        last_field = getattr(current, last_part, None)
+        if not isinstance(last_field, RelatedField):
+            return None
+        target_model = last_field.related_from
+        foreign_key_name = target_model.meta.related_names_mapping.get(last_part)
+        if foreign_key_name is None:
+            return None
+        join_path = "__".join([foreign_key_name, *reversed(parts[:-1])])
+        walked = cls.__walk_prefetch_path(target_model, join_path)
+        if walked is None or walked[0] not in cls.__prefetch_parent_classes():
+            return None
+        return target_model, walked[1], False, target_model
+
+    @classmethod
+    def __prefetch_parent_classes(cls) -> tuple[Any, ...]:
+        candidates = (cls, getattr(cls, "parent", None), cls.__dict__.get("__proxy_model__"))
+        return tuple(candidate for candidate in candidates if candidate is not None)
+
+    @staticmethod
+    def __walk_prefetch_path(model_class: Any, path: str) -> tuple[Any, str] | None:
+        """Follow a relation path that the join builder can express.
+
+        Reverse many-to-many segments land on the through model, so the hop to
+        the other side of the relation is appended to the returned path.
+
+        Args:
+            model_class (Any): Model class the path starts from.
+            path (str): Relation path with `__` separated segments.
+
+        Returns:
+            tuple[Any, str] | None: Model class at the end of the path and the
+            joinable path leading to it, or `None` when a segment is not a
+            same-database relation.
+        """
+        join_parts: list[str] = []
+        for part in path.split("__"):
+            field = model_class.fields.get(part)
+            if isinstance(field, (saffier_fields.ForeignKey, saffier_fields.ManyToManyField)):
+                is_cross_db = getattr(field, "is_cross_db", None)
+                if callable(is_cross_db) and is_cross_db():
+                    return None
+                model_class = field.target
+                join_parts.append(part)
+                continue
+            related_field = getattr(model_class, part, None)
+            if (
+                not isinstance(related_field, RelatedField)
+                or related_field.related_to.meta.tablename != model_class.meta.tablename
+                or related_field.is_cross_db()
+            ):
+                return None
+            model_class = related_field.related_from
+            join_parts.append(part)
+            if model_class.meta.is_multi:
+                through_fields = [
+                    name
+                    for name, through_field in model_class.fields.items()
+                    if isinstance(through_field, saffier_fields.ForeignKey)
+                    and name != related_field.get_foreign_key_field_name()
+                ]
+                if len(through_fields) != 1:
+                    return None
+                model_class = model_class.fields[through_fields[0]].target
+                join_parts.append(through_fields[0])
+        return model_class, "__".join(join_parts)
+
+    @classmethod
+    async def __fetch_prefetch_groups(
+        cls,
+        models: Sequence[type["Model"]],
+        prefetch: "Prefetch",
+        *,
+        join_model: type["Model"],
+        join_path: str,
+        keys_on_root: bool,
+        target_model: type["Model"],
+        using_schema: str | None = None,
+    ) -> dict[tuple[Any, ...], list[type["Model"]]]:
+        """Load the records of one prefetch for a batch of parents.
+
+        Args:
+            models (Sequence[type[Model]]): Parent instances.
+            prefetch (Prefetch): Prefetch directive being resolved.
+            join_model (type[Model]): Model the key-pair join is rooted at.
+            join_path (str): Relation path from `join_model` to the other side.
+            keys_on_root (bool): Whether the parent keys live on `join_model`.
+            target_model (type[Model]): Prefetched model class.
+            using_schema (str | None): Schema used for the key-pair join.
+
+        Returns:
+            dict[tuple[Any, ...], list[type[Model]]]: Prefetched records keyed
+            by parent primary-key values.
+        """
+        parent_keys = list(dict.fromkeys(tuple(model._pk_values().values()) for model in models))
+        join_queryset = join_model.query.get_queryset()
+        if using_schema is not None:
+            join_queryset = join_queryset.using(schema=using_schema)
+
+        pairs = await join_queryset._fetch_prefetch_pairs(
+            join_path, parent_keys, keys_on_root=keys_on_root
+        )
+        if not pairs:
+            return {}
+
+        child_keys: dict[tuple[Any, ...], list[tuple[Any, ...]]] = {}
+        for parent_key, child_key in pairs:
+            parents = child_keys.setdefault(child_key, [])
+            if parent_key not in parents:
+                parents.append(parent_key)
+
+        queryset = prefetch.queryset
+        if queryset is None:
+            queryset = target_model.query.get_queryset()
+        elif not hasattr(queryset, "_fetch_prefetch_records"):
+            queryset = queryset.all()
+        records = await queryset._fetch_prefetch_records(list(child_keys))
+
+        grouped: dict[tuple[Any, ...], list[type[Model]]] = {}
+        for record in records:
+            record_key = tuple(record._pk_values().values())
+            for parent_key in child_keys.get(record_key, ()):
+                grouped.setdefault(parent_key, []).append(record)
+        return grouped
+
     @classmethod
     def from_query_result(
         cls,
@@ -259,17 +555,19 @@ class ModelRow(SaffierBaseModel):
                         related_instance.__no_load_trigger_attrs__.update(
                             model_related.meta.secret_fields
                         )
-                    if using_schema is not None:
-                        related_instance.table = model_related.table_schema(using_schema)
+                    cls.__apply_schema(related_instance, using_schema)
                     item[related] = related_instance
+                elif not exclude_secrets and (
+                    mapped := cls.__mapped_instance(model_related, child_item, using_schema)
+                ):
+                    item[related] = mapped
                 else:
                     related_instance = model_related(**child_item)
                     if exclude_secrets:
                         related_instance.__no_load_trigger_attrs__.update(
                             model_related.meta.secret_fields
                         )
-                    if using_schema is not None:
-                        related_instance.table = model_related.table_schema(using_schema)
+                    cls.__apply_schema(related_instance, using_schema)
                     item[related] = related_instance
 
         # Check for the only_fields
@@ -359,11 +657,297 @@ class ModelRow(SaffierBaseModel):
         model = cls.__handle_prefetch_related(
             row=row, model=model, prefetch_related=prefetch_related
         )
-
-        if using_schema is not None:
-            model.table = model.build(using_schema)  # type: ignore
         return model
 
+    @classmethod
+    def compile_row_loader(
+        cls,
+        select_related: Sequence[str] | None = None,
+        *,
+        exclude_secrets: bool = False,
+        using_schema: str | None = None,
+        tables_and_models: dict[str, tuple[Any, Any]] | None = None,
+        prefix: str = "",
+        positions: Mapping[Any, int] | None = None,
+    ) -> RowLoaderPlan:
+        """Compile the row-independent part of `from_query_result` into a plan.
+
+        Everything `from_query_result` derives from the model, the joined
+        tables, and the queryset options (target classes of `select_related`
+        branches, foreign-key placeholder columns, the columns to copy, schema
+        tables) is resolved once here. With `positions`, columns are read from
+        the rows by index, otherwise through the row mapping.
+        `only()`/`defer()` querysets keep using `from_query_result`.
+
+        Args:
+            select_related (Sequence[str] | None): Related paths joined into the
+                query.
+            exclude_secrets (bool): Whether secret fields are left unloaded.
+            using_schema (str | None): Schema override of the queryset.
+            tables_and_models (dict[str, tuple[Any, Any]] | None): Mapping
+                produced by queryset compilation for joined table aliases.
+            prefix (str): Prefix identifying the current join branch.
+            positions (Mapping[Any, int] | None): Index of each selected column
+                in the rows the plan will load.
+
+        Returns:
+            RowLoaderPlan: Plan to pass to `from_row_loader`.
+        """
+        select_related = select_related or []
+        positions = positions or {}
+        if tables_and_models is not None and prefix in tables_and_models:
+            model_table = tables_and_models[prefix][0]
+        else:
+            model_table = cls.table_schema(using_schema) if using_schema is not None else cls.table
+
+        secret_fields = cls.meta.secret_fields if exclude_secrets else set()
+
+        # Later paths sharing the same first part replace earlier ones, exactly
+        # like the item assignment in `from_query_result`.
+        children: dict[str, RowLoaderPlan] = {}
+        for related in select_related:
+            first_part, _, remainder = related.partition("__")
+            try:
+                model_cls = cls.fields[first_part].target
+            except (KeyError, AttributeError):
+                model_cls = getattr(cls, first_part).related_from
+            children[first_part] = model_cls.compile_row_loader(
+                [remainder] if remainder else [],
+                exclude_secrets=exclude_secrets,
+                using_schema=using_schema,
+                tables_and_models=tables_and_models,
+                prefix=(first_part if not prefix else f"{prefix}__{first_part}"),
+                positions=positions,
+            )
+
+        item_keys = set(children)
+        columns_collection = getattr(model_table, "c", None)
+        foreign_keys: list[ForeignKeyLoaderPlan] = []
+        for related, foreign_key in cls.meta.foreign_key_fields.items():
+            if cls.__should_ignore_related_name(related, select_related):
+                continue
+            if related in secret_fields:
+                continue
+
+            model_related = foreign_key.target
+            column_names = (
+                foreign_key.get_column_names(related)
+                if hasattr(foreign_key, "get_column_names")
+                else (related,)
+            )
+            related_keys = (
+                tuple(foreign_key.related_columns.keys())
+                if hasattr(foreign_key, "related_columns")
+                else (model_related.pkname,)
+            )
+            lookups = []
+            for related_key, column_name in zip(related_keys, column_names, strict=False):
+                column = getattr(columns_collection, column_name, None)
+                position = positions.get(column) if column is not None else None
+                lookups.append((related_key, position, column, column_name))
+            foreign_keys.append(
+                ForeignKeyLoaderPlan(
+                    name=related,
+                    target=model_related,
+                    lookups=tuple(lookups),
+                    null=bool(getattr(foreign_key, "null", False)),
+                    plain=cls.__has_plain_keys(model_related, related_keys),
+                    table=cls.__schema_table(model_related, using_schema),
+                )
+            )
+            item_keys.add(related)
+
+        columns: list[tuple[str, int | None, Any]] = []
+        for column in model_table.columns:
+            mapped_field = cls.meta.columns_to_field.get(column.key)
+            if mapped_field is None or mapped_field in secret_fields:
+                continue
+            if mapped_field in item_keys and (
+                column.key == mapped_field
+                or isinstance(
+                    cls.fields.get(mapped_field),
+                    (saffier_fields.ForeignKey, saffier_fields.OneToOneField),
+                )
+            ):
+                continue
+            if column.key in item_keys:
+                continue
+            columns.append((column.key, positions.get(column), column))
+
+        instance_class = cls.proxy_model if exclude_secrets else cls
+        return RowLoaderPlan(
+            model_class=cls,
+            instance_class=instance_class,
+            children=tuple(children.items()),
+            foreign_keys=tuple(foreign_keys),
+            columns=tuple(columns),
+            exclude_secrets=exclude_secrets,
+            using_schema=using_schema,
+            table=cls.__schema_table(instance_class, using_schema),
+        )
+
+    @classmethod
+    def from_row_loader(
+        cls,
+        row: Row,
+        plan: RowLoaderPlan,
+        reference_select: dict[str, Any] | None = None,
+        tables_and_models: dict[str, tuple[Any, Any]] | None = None,
+    ) -> type["Model"]:
+        """Materialize one row with a plan produced by `compile_row_loader`.
+
+        The result is the same model graph `from_query_result` builds for the
+        options the plan was compiled with. Instances are still constructed
+        through the model initializer so field normalization is preserved,
+        except foreign-key placeholders whose keys need none.
+
+        Args:
+            row (Row): SQLAlchemy row returned by the executed query.
+            plan (RowLoaderPlan): Compiled plan for the root model.
+            reference_select (dict[str, Any] | None): Extra row aliases to copy
+                onto the model or nested related objects.
+            tables_and_models (dict[str, tuple[Any, Any]] | None): Mapping the
+                plan was compiled against, used for `reference_select`.
+
+        Returns:
+            type[Model]: Materialized model instance.
+        """
+        return cls.__load_row_plan(
+            row,
+            row._mapping,
+            plan,
+            reference_select=reference_select,
+            tables_and_models=tables_and_models,
+        )
+
+    @classmethod
+    def __load_row_plan(
+        cls,
+        row: Row,
+        mapping: Any,
+        plan: RowLoaderPlan,
+        reference_select: dict[str, Any] | None = None,
+        tables_and_models: dict[str, tuple[Any, Any]] | None = None,
+    ) -> type["Model"]:
+        """Apply one plan node to a row, recursing into `select_related` children."""
+        item: dict[str, Any] = {}
+        for name, child in plan.children:
+            item[name] = cls.__load_row_plan(row, mapping, child)
+
+        for foreign_key in plan.foreign_keys:
+            child_item: dict[str, Any] = {}
+            for related_key, position, column, column_name in foreign_key.lookups:
+                if position is not None:
+                    value = row[position]
+                elif column is not None and column in mapping:
+                    value = mapping[column]
+                else:
+                    value = cls._row_value(row, column_name)
+                if value is not None:
+                    child_item[related_key] = value
+
+            if not child_item and foreign_key.null:
+                related_instance = foreign_key.target()
+            elif not plan.exclude_secrets and (
+                mapped := cls.__mapped_instance(foreign_key.target, child_item, plan.using_schema)
+            ):
+                item[foreign_key.name] = mapped
+                continue
+            elif foreign_key.plain:
+                related_instance = foreign_key.target._from_column_values(child_item)
+            else:
+                related_instance = foreign_key.target(**child_item)
+            if plan.exclude_secrets:
+                related_instance.__no_load_trigger_attrs__.update(
+                    foreign_key.target.meta.secret_fields
+                )
+            if foreign_key.table is not None:
+                related_instance.table = foreign_key.table
+            elif plan.using_schema is not None:
+                related_instance.__using_schema__ = plan.using_schema
+            item[foreign_key.name] = related_instance
+
+        for key, position, column in plan.columns:
+            if position is not None:
+                item[key] = row[position]
+                continue
+            try:
+                item[key] = mapping[column]
+            except KeyError:
+                if key in mapping:
+                    item[key] = mapping[key]
+
+        model = plan.instance_class(**item)
+        if plan.exclude_secrets:
+            model.__no_load_trigger_attrs__.update(plan.model_class.meta.secret_fields)
+
+        if reference_select:
+            cls.__apply_reference_select(
+                model=model,
+                row=row,
+                references=reference_select,
+                tables_and_models=tables_and_models,
+                root_model_class=plan.model_class,
+                using_schema=plan.using_schema,
+            )
+
+        if plan.table is not None:
+            model.table = plan.table
+        elif plan.using_schema is not None:
+            model.__using_schema__ = plan.using_schema
+        return cast("type[Model]", model)
+
+    @staticmethod
+    def __has_plain_keys(model_class: Any, keys: Sequence[str]) -> bool:
+        """Return whether placeholders holding `keys` can skip the field setters.
+
+        That is the case when the model keeps the default initializer and
+        attribute assignment, and every key is a plain column field whose
+        setter would store the value unchanged.
+        """
+        if (
+            model_class.__init__ is not SaffierBaseModel.__init__
+            or model_class.__setattr__ is not SaffierBaseModel.__setattr__
+        ):
+            return False
+        for key in keys:
+            field = model_class.fields.get(key)
+            if (
+                field is None
+                or model_class.meta.columns_to_field.get(key) != key
+                or field.is_virtual
+                or getattr(field, "is_computed", False)
+                or hasattr(field, "set_value")
+                or isinstance(field, (saffier_fields.ForeignKey, saffier_fields.OneToOneField))
+                or type(field).expand_relationship is not saffier_fields.Field.expand_relationship
+            ):
+                return False
+        return True
+
+    @staticmethod
+    def __schema_table(model_class: Any, schema: str | None) -> Any:
+        """Return the table instances read from `schema` are bound to while loading.
+
+        Under `use_schema_translate_map` no table is bound: instances only
+        record their schema, and resolve the schema-bound table once they are
+        written or reloaded.
+        """
+        if schema is None or settings.use_schema_translate_map:
+            return None
+        return model_class.build(schema)
+
+    @staticmethod
+    def __mapped_instance(
+        model_class: Any, primary_key: dict[str, Any], schema: str | None = None
+    ) -> Any:
+        """Return the instance the active identity map holds for a foreign key target."""
+        session = get_identity_map()
+        if session is None or not primary_key:
+            return None
+        if schema is None:
+            schema = getattr(model_class.table, "schema", None)
+        return session.get(model_class, primary_key, schema)
+
     @classmethod
     def __apply_reference_select(
         cls,
@@ -522,6 +1106,9 @@ class ModelRow(SaffierBaseModel):
     def __apply_schema(cls, model: type["Model"], schema: str | None = None) -> type["Model"]:
         """Attach a schema-specific table to one model instance when needed.
 
+        Under `use_schema_translate_map` the instance only records `schema`
+        and resolves its schema-bound table once it is written or reloaded.
+
         Args:
             model (type[Model]): Model class or instance being prepared.
             schema (str | None): Schema name requested by the queryset.
@@ -532,7 +1119,10 @@ class ModelRow(SaffierBaseModel):
         """
         # Apply the schema to model instances without mutating class-level table caches.
         if schema is not None and not isinstance(model, type):
-            model.table = model.build(schema)  # type: ignore
+            if settings.use_schema_translate_map:
+                model.__using_schema__ = schema
+            else:
+                model.table = model.build(schema)  # type: ignore
         return model
 
     @classmethod
@@ -1,26 +1,39 @@
 """Core queryset implementation used by Saffier managers."""
 
+import contextlib
 import copy
+import datetime
+import decimal
+import sqlite3
+import uuid
 import warnings
 from collections.abc import AsyncIterator, Generator, Sequence
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Union,
     cast,
 )
 
 import sqlalchemy
+from sqlalchemy.sql.visitors import iterate, replacement_traverse
 
 import saffier
+from saffier.conf import settings
+from saffier.core.connection.timeouts import query_timeout
 from saffier.core.db import fields as saffier_fields
-from saffier.core.db.context_vars import get_schema
+from saffier.core.db.context_vars import get_schema, with_translated_schema
 from saffier.core.db.datastructures import QueryModelResultCache
 from saffier.core.db.fields import CharField, TextField
-from saffier.core.db.querysets.clauses import Q, build_lookup_clauses
+from saffier.core.db.identity import IdentityMap, get_identity_map
+from saffier.core.db.querysets.clauses import CrossDatabaseLookup, Q, build_lookup_clauses
+from saffier.core.db.querysets.compiler import StatementCache, statement_cache
+from saffier.core.db.querysets.loader import attach_sibling_loaders
 from saffier.core.db.querysets.mixins import QuerySetPropsMixin, SaffierModel, TenancyMixin
 from saffier.core.db.querysets.prefetch import PrefetchMixin
 from saffier.core.db.querysets.protocols import AwaitableQuery
+from saffier.core.utils.concurrency import run_concurrently
 from saffier.core.utils.db import check_db_connection, hash_tablekey
 from saffier.core.utils.models import DateParser
 from saffier.core.utils.schemas import Schema
@@ -30,6 +43,39 @@ from saffier.protocols.queryset import QuerySetProtocol
 if TYPE_CHECKING:  # pragma: no cover
     from saffier import Database
     from saffier.core.db.models.model import Model, ReflectModel
+    from saffier.engines.base import EngineIncludeExclude
+
+# Dialects able to match composite primary keys with `(a, b) IN ((...), ...)`.
+_ROW_VALUE_IN_DIALECTS = {"postgresql", "mysql", "sqlite"}
+_WINDOW_COUNT_DIALECTS = {"postgresql", "sqlite", "mssql", "oracle"}
+_WINDOW_TOTAL_LABEL = "saffier_window_total"
+# Bound parameters accepted by one statement. SQLite raised its default from
+# 999 to 32766 in 3.32; dialects not listed fall back to the lowest common cap.
+_BIND_PARAMETER_LIMITS = {
+    "postgresql": 32767,
+    "mysql": 65535,
+    "mssql": 2100,
+    "sqlite": 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999,
+}
+_DEFAULT_BIND_PARAMETER_LIMIT = 999
+
+# Lookups whose clause shape does not depend on the value they compare with.
+_SIMPLE_LOOKUP_OPERATORS = {"exact", "gt", "gte", "lt", "lte"}
+_SIMPLE_LOOKUP_TYPES = {
+    str,
+    int,
+    float,
+    decimal.Decimal,
+    uuid.UUID,
+    datetime.date,
+    datetime.datetime,
+    datetime.time,
+}
+
+
+def _column_positions(columns: Any) -> dict[Any, int]:
+    """Map every selected column to its index in the rows of the select."""
+    return {column: index for index, column in enumerate(columns)}
 
 
 class BaseQuerySet(
@@ -44,6 +90,7 @@ class BaseQuerySet(
     """
 
     ESCAPE_CHARACTERS = ["%", "_"]
+    statement_cache: ClassVar[StatementCache] = statement_cache
 
     def __init__(
         self,
@@ -70,6 +117,7 @@ class BaseQuerySet(
         extra_select: Any = None,
         reference_select: Any = None,
         embed_parent: Any = None,
+        timeout: float | None = None,
     ) -> None:
         super().__init__(model_class=model_class)
         self.model_class = cast("type[Model]", model_class)
@@ -90,6 +138,7 @@ class BaseQuerySet(
         self._cache = QueryModelResultCache(attrs=cache_attrs)
         self._cached_select_with_tables = None
         self._cached_select_related_expression = None
+        self._row_loader: tuple[dict[str, tuple[Any, Any]], Any] | None = None
         self._source_queryset = self
         self._m2m_related = m2m_related  # type: ignore
         self.using_schema = using_schema
@@ -97,10 +146,16 @@ class BaseQuerySet(
         self.extra: dict[str, Any] = {}
         self._for_update = for_update
         self._batch_size = batch_size
+        self._timeout = timeout
         self._extra_select = [] if extra_select is None else extra_select
         self._reference_select = {} if reference_select is None else reference_select
         self.embed_parent = embed_parent
         self.embed_parent_filters = None
+        self._lookup_shape: tuple[Any, ...] | None = (
+            None if self.filter_clauses or self.or_clauses else ()
+        )
+        self._lookup_binds: tuple[Any, ...] = ()
+        self._lookup_clauses: tuple[Any, ...] = ()
 
         if self.is_m2m and not self._m2m_related:
             self._m2m_related = self.model_class.meta.multi_related[0]
@@ -694,6 +749,17 @@ class BaseQuerySet(
             return self._cached_select_with_tables
 
         queryset = self
+        cache_key = queryset._statement_cache_key()
+        if cache_key is not None:
+            cached = queryset.statement_cache.get(cache_key)
+            if cached is not None:
+                expression, where_clause, tables_and_models, binds = cached
+                if where_clause is not None:
+                    where_clause = queryset._rebind_clause(where_clause, binds)
+                if where_clause is not None or not binds:
+                    if where_clause is not None:
+                        expression = expression.where(where_clause)
+                    return queryset._set_select_with_tables(expression, dict(tables_and_models))
 
         queryset._validate_only_and_defer()
         outer_select_paths = queryset._dedupe_related_paths(
@@ -709,10 +775,60 @@ class BaseQuerySet(
         selectable_related = set(queryset._select_related)
         columns = queryset._build_select_columns(tables_and_models, selectable_related)
         expression = sqlalchemy.sql.select(*columns).select_from(select_from)
-
+        expression = queryset._apply_select_modifiers(
+            expression, tables_and_models, outer_select_paths, where=False
+        )
         where_clause = queryset._build_where_clause(tables_and_models, outer_select_paths)
+
+        if cache_key is not None:
+            bind_ids = (
+                {id(element) for element in iterate(where_clause)}
+                if where_clause is not None
+                else set()
+            )
+            if all(id(bind) in bind_ids for bind in queryset._lookup_binds):
+                queryset.statement_cache.set(
+                    cache_key,
+                    (expression, where_clause, dict(tables_and_models), queryset._lookup_binds),
+                )
         if where_clause is not None:
             expression = expression.where(where_clause)
+        return queryset._set_select_with_tables(expression, tables_and_models)
+
+    def _set_select_with_tables(
+        self, expression: Any, tables_and_models: dict[str, tuple[Any, Any]]
+    ) -> tuple[Any, dict[str, tuple[Any, Any]]]:
+        self._expression = expression
+        if self._select_related:
+            self._cached_select_related_expression = expression
+            self._source_queryset._cached_select_related_expression = expression
+        self._cached_select_with_tables = (expression, tables_and_models)
+        return self._cached_select_with_tables
+
+    def _apply_select_modifiers(
+        self,
+        expression: Any,
+        tables_and_models: dict[str, tuple[Any, Any]],
+        outer_select_paths: Sequence[str],
+        *,
+        where: bool = True,
+    ) -> Any:
+        """Apply filtering, ordering, pagination, grouping and locking to a select.
+
+        Args:
+            expression: Selectable whose column list is already final.
+            tables_and_models: Join map used to resolve relationship paths.
+            outer_select_paths: Relationship paths joined into the outer query.
+            where: Whether to apply the `WHERE` clause as well.
+
+        Returns:
+            Any: Updated selectable.
+        """
+        queryset = self
+        if where:
+            where_clause = queryset._build_where_clause(tables_and_models, outer_select_paths)
+            if where_clause is not None:
+                expression = expression.where(where_clause)
 
         if queryset._order_by:
             expression = queryset._build_order_by_expression(
@@ -749,17 +865,259 @@ class BaseQuerySet(
                     getattr(model, "table", model) for model in cast("tuple[Any, ...]", of)
                 )
             expression = expression.with_for_update(**for_update)
-
-        queryset._expression = expression  # type: ignore
-        if queryset._select_related:
-            queryset._cached_select_related_expression = expression
-            queryset._source_queryset._cached_select_related_expression = expression
-        queryset._cached_select_with_tables = (expression, tables_and_models)
-        return queryset._cached_select_with_tables
+        return expression
 
     def _build_select(self) -> Any:
         return self._build_select_with_tables()[0]
 
+    @staticmethod
+    def _is_projectable_field(field_name: str, field: Any, table: Any) -> bool:
+        """Return whether a field maps one-to-one onto a plain table column.
+
+        Relationship, composite, computed and file-like fields rewrite their
+        values on assignment, so they can only be serialized through a hydrated
+        model instance.
+        """
+        return (
+            not field.is_virtual
+            and field.has_column()
+            and not isinstance(field, (saffier_fields.ForeignKey, saffier_fields.ManyToManyField))
+            and not hasattr(field, "set_value")
+            and not getattr(field, "is_computed", False)
+            and field_name in table.columns
+        )
+
+    def _resolve_projection(
+        self,
+        fields: Sequence[str],
+        exclude: Sequence[str] | set[str] | None,
+    ) -> list[tuple[str, str, str]] | None:
+        """Resolve `values()` fields into `(output_key, join_path, column_key)` triples.
+
+        Local fields keep the model declaration order used by `model_dump()`,
+        followed by forward `__` paths such as `author__name` in the order they
+        were requested.
+
+        Models overriding `model_dump()` are always hydrated, so `values()`
+        keeps returning what their `model_dump()` produces.
+
+        Returns:
+            list[tuple[str, str, str]] | None: Projection plan, or `None` when
+            the output can only be produced from hydrated model instances.
+        """
+        model_class = self.model_class
+        if (
+            self.is_m2m
+            or self.embed_parent
+            or self._reference_select
+            or self._extra_select
+            or isinstance(self, CombinedQuerySet)
+            or model_class.model_dump is not saffier.Model.model_dump
+        ):
+            return None
+
+        excluded = set(exclude or ())
+        local_names: set[str] = set()
+        related_paths: list[str] = []
+        for name in fields:
+            if name in model_class.fields:
+                local_names.add(name)
+            elif "__" in name:
+                related_paths.append(name)
+            else:
+                return None
+
+        projection: list[tuple[str, str, str]] = []
+        for name, field in model_class.fields.items():
+            if fields and name not in local_names:
+                continue
+            if name in excluded or getattr(field, "exclude", False):
+                continue
+            if isinstance(field, saffier_fields.ManyToManyField):
+                continue
+            if getattr(field, "is_computed", False):
+                return None
+            if not field.has_column():
+                continue
+            if not self._is_projectable_field(name, field, self.table):
+                return None
+            if not self._should_include_selected_column(name, model_class):
+                continue
+            projection.append((name, "", name))
+
+        for path in related_paths:
+            if path in excluded:
+                continue
+            *parts, column_key = path.split("__")
+            target = model_class
+            for part in parts:
+                relation = target.fields.get(part)
+                if not isinstance(relation, saffier_fields.ForeignKey) or relation.is_cross_db(
+                    self.database if target is model_class else None
+                ):
+                    return None
+                target = relation.target
+            field = target.fields.get(column_key)
+            if field is None or not self._is_projectable_field(column_key, field, target.table):
+                return None
+            if self._exclude_secrets and field.secret:
+                continue
+            projection.append((path, "__".join(parts), column_key))
+
+        return projection
+
+    def _join_projection_paths(
+        self,
+        select_from: Any,
+        tables_and_models: dict[str, tuple[Any, Any]],
+        paths: Sequence[str],
+    ) -> Any:
+        """Outer-join forward foreign-key paths needed only by a projection.
+
+        Outer joins keep rows whose foreign key is `NULL`, so projecting a
+        related column never changes the number of rows returned.
+        """
+        for path in paths:
+            prefix = ""
+            model_class = self.model_class
+            for part in path.split("__"):
+                relation = model_class.fields[part]
+                previous_table = tables_and_models[prefix][0]
+                prefix = part if not prefix else f"{prefix}__{part}"
+                model_class = relation.target
+                if prefix in tables_and_models:
+                    continue
+                table = (
+                    model_class.table_schema(self.using_schema)
+                    if self.using_schema is not None
+                    else model_class.table
+                )
+                table = table.alias(
+                    hash_tablekey(tablekey=model_class.meta.tablename, prefix=prefix)
+                )
+                select_from = sqlalchemy.sql.outerjoin(
+                    select_from,
+                    table,
+                    self._build_join_condition(
+                        self._relation_join_columns(previous_table, part, relation),
+                        self._target_relation_columns(table, relation),
+                    ),
+                )
+                tables_and_models[prefix] = (table, model_class)
+        return select_from
+
+    def _build_projection_select(self, projection: Sequence[tuple[str, str, str]]) -> Any:
+        """Build a narrowed select returning only the projected columns.
+
+        Args:
+            projection: Plan produced by `_resolve_projection()`.
+
+        Returns:
+            Any: SQLAlchemy select whose columns follow the projection order.
+        """
+        queryset = self
+        queryset._validate_only_and_defer()
+        outer_select_paths = queryset._dedupe_related_paths(
+            [
+                *queryset._select_related,
+                *queryset._collect_related_paths(queryset._order_by),
+                *queryset._collect_related_paths(queryset._group_by),
+            ]
+        )
+        _, select_from, tables_and_models = queryset._build_tables_select_from_relationship(
+            outer_select_paths
+        )
+        select_from = queryset._join_projection_paths(
+            select_from,
+            tables_and_models,
+            list(dict.fromkeys(path for _, path, _ in projection if path)),
+        )
+        columns = [
+            tables_and_models[path][0].columns[column_key].label(output_key)
+            for output_key, path, column_key in projection
+        ]
+        expression = sqlalchemy.sql.select(*columns).select_from(select_from)
+        return queryset._apply_select_modifiers(expression, tables_and_models, outer_select_paths)
+
+    def _get_row_loader(self, tables_and_models: dict[str, tuple[Any, Any]]) -> Any:
+        """Return the compiled row loader for `tables_and_models`.
+
+        The plan only depends on the joined tables and the queryset options, so
+        it is compiled once and reused for every row and batch of an execution.
+        When `tables_and_models` belongs to the select this queryset built, the
+        plan reads the columns by their position in that select.
+        """
+        cached = self._row_loader
+        if cached is not None and cached[0] is tables_and_models:
+            return cached[1]
+        positions = None
+        selected = self._cached_select_with_tables
+        if selected is not None and selected[1] is tables_and_models:
+            positions = _column_positions(selected[0].selected_columns)
+        plan = self.model_class.compile_row_loader(
+            self._select_related,
+            exclude_secrets=self._exclude_secrets,
+            using_schema=self.using_schema,
+            tables_and_models=tables_and_models,
+            positions=positions,
+        )
+        self._row_loader = (tables_and_models, plan)
+        return plan
+
+    def _identity_map(self) -> IdentityMap | None:
+        """Return the active identity map when this queryset loads whole instances.
+
+        Partial loads (`only()`, `defer()`, `exclude_secrets()`), rows carrying
+        extra selected values and querysets bound to another database bypass
+        the map.
+        """
+        session = get_identity_map()
+        if (
+            session is None
+            or self._only
+            or self._defer
+            or self._exclude_secrets
+            or self._reference_select
+            or self._extra_select
+            or self.embed_parent
+            or self.database is not self.model_class.database
+        ):
+            return None
+        return session
+
+    def _identity_lookup(self, kwargs: dict[str, Any]) -> SaffierModel | None:
+        """Answer `get()` by primary key from the active identity map."""
+        session = self._identity_map()
+        if (
+            session is None
+            or self.filter_clauses
+            or self.or_clauses
+            or self._select_related
+            or self._prefetch_related
+            or self._for_update
+            or self.limit_count is not None
+            or self._offset is not None
+        ):
+            return None
+        pknames = self.model_class.pknames
+        if set(kwargs) == {"pk"} and len(pknames) == 1:
+            kwargs = {pknames[0]: kwargs["pk"]}
+        if set(kwargs) != set(pknames):
+            return None
+        return cast(
+            "SaffierModel | None", session.get(self.model_class, kwargs, self._identity_schema())
+        )
+
+    def _identity_schema(self) -> str | None:
+        """Return the schema this queryset reads from, keying identity map entries.
+
+        Under `use_schema_translate_map` the tables carry no schema, so the
+        `using_schema` rendered through the translate map is used instead.
+        """
+        if self.using_schema is not None:
+            return cast("str | None", self.using_schema)
+        return cast("str | None", self.model_class.table.schema)
+
     async def _hydrate_row(
         self,
         queryset: "QuerySet",
@@ -769,25 +1127,77 @@ class BaseQuerySet(
         is_only_fields: bool,
         is_defer_fields: bool,
     ) -> SaffierModel:
-        result = queryset.model_class.from_query_result(
-            row,
-            select_related=queryset._select_related,
-            prefetch_related=[],
+        results = await self._hydrate_rows(
+            queryset,
+            [row],
+            tables_and_models,
             is_only_fields=is_only_fields,
-            only_fields=queryset._only,
             is_defer_fields=is_defer_fields,
-            using_schema=queryset.using_schema,
-            exclude_secrets=queryset._exclude_secrets,
-            reference_select=queryset._reference_select,
-            tables_and_models=tables_and_models,
         )
-        if queryset._prefetch_related:
-            result = await queryset.model_class.apply_prefetch_related(
-                row=row,
-                model=result,
+        return results[0]
+
+    async def _hydrate_rows(
+        self,
+        queryset: "QuerySet",
+        rows: Sequence[Any],
+        tables_and_models: dict[str, tuple[Any, Any]],
+        *,
+        is_only_fields: bool,
+        is_defer_fields: bool,
+    ) -> list[SaffierModel]:
+        """Materialize rows and resolve their prefetches in one pass per `Prefetch`.
+
+        Args:
+            queryset: Queryset whose options drive the hydration.
+            rows: Raw rows returned by the database.
+            tables_and_models: Join mapping produced alongside the select.
+            is_only_fields: Whether `only()` is active.
+            is_defer_fields: Whether `defer()` is active.
+
+        Returns:
+            list[SaffierModel]: Hydrated models, aligned with `rows`.
+        """
+        if is_only_fields or is_defer_fields:
+            results = [
+                queryset.model_class.from_query_result(
+                    row,
+                    select_related=queryset._select_related,
+                    prefetch_related=[],
+                    is_only_fields=is_only_fields,
+                    only_fields=queryset._only,
+                    is_defer_fields=is_defer_fields,
+                    using_schema=queryset.using_schema,
+                    exclude_secrets=queryset._exclude_secrets,
+                    reference_select=queryset._reference_select,
+                    tables_and_models=tables_and_models,
+                )
+                for row in rows
+            ]
+        else:
+            plan = queryset._get_row_loader(tables_and_models)
+            from_row_loader = queryset.model_class.from_row_loader
+            results = [
+                from_row_loader(
+                    row,
+                    plan,
+                    reference_select=queryset._reference_select,
+                    tables_and_models=tables_and_models,
+                )
+                for row in rows
+            ]
+        session = queryset._identity_map()
+        if session is not None and not (is_only_fields or is_defer_fields):
+            schema = queryset._identity_schema()
+            results = [session.merge(result, schema) for result in results]
+        attach_sibling_loaders(results, include_instances=is_only_fields or is_defer_fields)
+        if queryset._prefetch_related and results:
+            await queryset.model_class.apply_prefetch_related_many(
+                rows=rows,
+                models=results,
                 prefetch_related=queryset._prefetch_related,
+                using_schema=queryset.using_schema,
             )
-        return result
+        return results
 
     def _filter_query(self, exclude: bool = False, or_: bool = False, **kwargs: Any) -> "QuerySet":
         clauses: list[Any] = []
@@ -802,15 +1212,30 @@ class BaseQuerySet(
         if self.model_class.is_proxy_model:
             self.model_class = self.model_class.parent
 
-        clauses, implied_select_related = build_lookup_clauses(
-            self.model_class,
-            self.table,
-            kwargs,
-            escape_characters=tuple(self.ESCAPE_CHARACTERS),
-            using_schema=self.using_schema,
-            embed_parent=self.embed_parent_filters,
-            model_database=self.database,
-        )
+        lookup_shape = self._current_lookup_shape()
+        simple_lookups = self._simple_lookups(kwargs)
+        binds: list[Any] = []
+        if simple_lookups is not None:
+            clauses = []
+            for field, column, operator, value in simple_lookups:
+                bind = sqlalchemy.bindparam(None, value, type_=column.type)
+                clauses.append(
+                    field.operator_to_clause(
+                        field_name=column.key, operator=operator, table=column.table, value=bind
+                    )
+                )
+                binds.append(bind)
+            implied_select_related: list[str] = []
+        else:
+            clauses, implied_select_related = build_lookup_clauses(
+                self.model_class,
+                self.table,
+                kwargs,
+                escape_characters=tuple(self.ESCAPE_CHARACTERS),
+                using_schema=self.using_schema,
+                embed_parent=self.embed_parent_filters,
+                model_database=self.database,
+            )
         for related_path in implied_select_related:
             if related_path not in filter_related:
                 filter_related.append(related_path)
@@ -827,7 +1252,7 @@ class BaseQuerySet(
             else:
                 or_clauses += clauses
 
-        return cast(
+        queryset = cast(
             "QuerySet",
             self.__class__(
                 model_class=self.model_class,
@@ -851,8 +1276,124 @@ class BaseQuerySet(
                 extra_select=self._extra_select,
                 reference_select=self._reference_select,
                 embed_parent=self.embed_parent,
+                timeout=self._timeout,
             ),
         )
+        if lookup_shape is not None and simple_lookups is not None:
+            queryset._lookup_shape = (
+                *lookup_shape,
+                (
+                    exclude,
+                    or_,
+                    tuple((column.key, operator) for _, column, operator, _ in simple_lookups),
+                ),
+            )
+            queryset._lookup_binds = (*self._lookup_binds, *binds)
+            queryset._lookup_clauses = (*filter_clauses, *or_clauses)
+        return queryset
+
+    def _simple_lookups(self, kwargs: dict[str, Any]) -> list[tuple[Any, Any, str, Any]] | None:
+        """Resolve lookups comparing plain model columns with scalar values.
+
+        The clauses of such lookups only differ in their bound values, so they
+        are built directly and statements using them can be served from the
+        statement cache. Returns `None` when any lookup needs the generic path.
+        """
+        if self.embed_parent_filters:
+            return None
+        fields = self.model_class.fields
+        lookups = []
+        for key, value in kwargs.items():
+            if type(value) not in _SIMPLE_LOOKUP_TYPES:
+                return None
+            if key == "pk":
+                if len(self.pknames) > 1:
+                    return None
+                field_name, operator = self.model_class.pkname, "exact"
+            else:
+                field_name, _, operator = key.partition("__")
+                operator = operator or "exact"
+            if operator not in _SIMPLE_LOOKUP_OPERATORS:
+                return None
+            field = fields.get(field_name)
+            column = self.table.columns.get(field_name)
+            if (
+                column is None
+                or not isinstance(field, saffier_fields.Field)
+                or type(field).clean is not saffier_fields.Field.clean
+                or type(field).operator_to_clause is not saffier_fields.Field.operator_to_clause
+            ):
+                return None
+            lookups.append((field, column, operator, value))
+        return lookups
+
+    def _current_lookup_shape(self) -> tuple[Any, ...] | None:
+        """Return the lookup shape when every filter came from simple lookups."""
+        if self._lookup_shape is None:
+            return None
+        clauses = (*self.filter_clauses, *self.or_clauses)
+        if len(clauses) != len(self._lookup_clauses) or any(
+            clause is not tracked
+            for clause, tracked in zip(clauses, self._lookup_clauses, strict=True)
+        ):
+            return None
+        return self._lookup_shape
+
+    def _statement_cache_key(self) -> Any:
+        """Describe everything the select build depends on apart from bound values."""
+        lookup_shape = self._current_lookup_shape()
+        if lookup_shape is None or self._extra_select or self._reference_select:
+            return None
+        names = (
+            *self._select_related,
+            *self._filter_related,
+            *self._order_by,
+            *self._group_by,
+            *self._only,
+            *self._defer,
+            *(self.distinct_on if isinstance(self.distinct_on, (list, tuple)) else ()),
+        )
+        if not all(isinstance(name, str) for name in names):
+            return None
+        key = (
+            self.model_class,
+            self.table,
+            lookup_shape,
+            tuple(self._select_related),
+            tuple(self._filter_related),
+            tuple(self._order_by),
+            tuple(self._group_by),
+            tuple(self._only),
+            tuple(self._defer),
+            tuple(self.distinct_on)
+            if isinstance(self.distinct_on, (list, tuple))
+            else self.distinct_on,
+            self._exclude_secrets,
+            self.limit_count,
+            self._offset,
+            tuple(sorted(self._for_update.items())) if self._for_update else None,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _rebind_clause(self, clause: Any, binds: tuple[Any, ...]) -> Any:
+        """Copy a cached clause, swapping its lookup binds for this queryset's."""
+        replacements = {
+            id(bind): own_bind for bind, own_bind in zip(binds, self._lookup_binds, strict=True)
+        }
+        replaced: set[int] = set()
+
+        def replace(element: Any) -> Any:
+            own_bind = replacements.get(id(element))
+            if own_bind is not None:
+                replaced.add(id(element))
+            return own_bind
+
+        clause = replacement_traverse(clause, {}, replace)
+        return clause if len(replaced) == len(replacements) else None
 
     def _validate_kwargs(self, **kwargs: Any) -> Any:
         original_kwargs = dict(kwargs)
@@ -957,6 +1498,61 @@ class BaseQuerySet(
         _distinct_on: sqlalchemy.Column = table.columns[crawl_result.field_name]
         return _distinct_on
 
+    @contextlib.asynccontextmanager
+    async def _connected_database(self, *, read: bool = False) -> AsyncIterator["Database"]:
+        """Enter the queryset database with `using_schema` bound for translation.
+
+        Under the `use_schema_translate_map` setting querysets target the
+        schema-less base tables, and the database renders `using_schema` for
+        them through `schema_translate_map` while the block runs.
+
+        Read-only operations pass `read=True` so databases with replicas can
+        serve them from a replica. `select_for_update()` querysets always stay
+        on the primary. A `timeout()` applies to every statement run in the
+        block, including the remote queries of cross-database lookups, which
+        are resolved before the block starts.
+        """
+        async with contextlib.AsyncExitStack() as stack:
+            if self._timeout is not None:
+                stack.enter_context(query_timeout(self._timeout))
+            await self._resolve_cross_database_lookups()
+            database = await stack.enter_async_context(self.database)
+            if read and not self._for_update:
+                database = await stack.enter_async_context(database.reading())
+            if settings.use_schema_translate_map:
+                stack.enter_context(with_translated_schema(self.using_schema))
+            yield database
+
+    def _cross_database_lookups(self) -> list[CrossDatabaseLookup]:
+        """Return the cross-database lookups used by the filters of the queryset."""
+        lookups: dict[int, CrossDatabaseLookup] = {}
+        for clause in (*self.filter_clauses, *self.or_clauses):
+            if not isinstance(clause, sqlalchemy.sql.ClauseElement):
+                continue
+            for element in iterate(clause):
+                if isinstance(element, CrossDatabaseLookup):
+                    lookups.setdefault(id(element._resolution), element)
+        return list(lookups.values())
+
+    async def _resolve_cross_database_lookups(self) -> None:
+        """Read the remote keys of the cross-database lookups not resolved yet.
+
+        Lookups against different databases run concurrently; lookups sharing
+        a database run one after the other on it.
+        """
+        pending: dict[int, list[CrossDatabaseLookup]] = {}
+        for lookup in self._cross_database_lookups():
+            if lookup.keys is None:
+                pending.setdefault(id(lookup.database), []).append(lookup)
+        if not pending:
+            return
+
+        async def resolve(lookups: list[CrossDatabaseLookup]) -> None:
+            for lookup in lookups:
+                await lookup.resolve()
+
+        await run_concurrently([resolve(lookups) for lookups in pending.values()])
+
     def _clone(self) -> Any:
         """
         Return a copy of the current QuerySet that's ready for another
@@ -986,6 +1582,7 @@ class BaseQuerySet(
         queryset._expression = self._expression
         queryset._cache = QueryModelResultCache(attrs=self._cache.attrs, prefix=self._cache.prefix)
         queryset._cached_select_with_tables = None
+        queryset._row_loader = None
         queryset._cached_select_related_expression = self._cached_select_related_expression
         queryset._source_queryset = getattr(self, "_source_queryset", self)
         queryset._m2m_related = self._m2m_related
@@ -1003,6 +1600,7 @@ class BaseQuerySet(
         queryset.using_schema = effective_schema
         queryset._for_update = copy.copy(self._for_update)
         queryset._batch_size = self._batch_size
+        queryset._timeout = self._timeout
         queryset._extra_select = copy.copy(self._extra_select)
         queryset._reference_select = copy.copy(self._reference_select)
         queryset.embed_parent = self.embed_parent
@@ -1011,6 +1609,9 @@ class BaseQuerySet(
         queryset._cache_first = None
         queryset._cache_last = None
         queryset._cache_fetch_all = False
+        queryset._lookup_shape = self._lookup_shape
+        queryset._lookup_binds = self._lookup_binds
+        queryset._lookup_clauses = self._lookup_clauses
 
         return queryset
 
@@ -1088,6 +1689,7 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         if kwargs:
             queryset = queryset._filter_query(exclude=exclude, or_=or_, **kwargs)
 
+        queryset._lookup_shape = None
         if isinstance(clause, Q):
             clause, implied_select_related = clause.resolve(queryset)
             for related_path in implied_select_related:
@@ -1304,6 +1906,19 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         queryset._batch_size = batch_size
         return queryset
 
+    def timeout(self, seconds: float | None) -> "QuerySet":
+        """Cancel the statements run by the queryset after `seconds`.
+
+        The timeout overrides the database `query_timeout` and still stops at
+        the active `query_deadline()`. `None` restores the database default.
+
+        Returns:
+            QuerySet: Cloned queryset with the statement timeout.
+        """
+        queryset: QuerySet = self._clone()
+        queryset._timeout = seconds
+        return queryset
+
     def extra_select(self, *extra: Any) -> "QuerySet":
         """Add raw SQLAlchemy expressions to the `SELECT` list.
 
@@ -1333,6 +1948,7 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         *,
         next_item_attr: str = "",
         previous_item_attr: str = "",
+        approximate_count: bool = False,
     ) -> Any:
         """Return a numbered paginator bound to the current queryset.
 
@@ -1346,6 +1962,7 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             page_size=page_size,
             next_item_attr=next_item_attr,
             previous_item_attr=previous_item_attr,
+            approximate_count=approximate_count,
         )
 
     def cursor_paginator(
@@ -1354,6 +1971,8 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         *,
         next_item_attr: str = "",
         previous_item_attr: str = "",
+        approximate_count: bool = False,
+        cursor_secret: str | bytes | None = None,
     ) -> Any:
         """Return a cursor paginator bound to the current queryset.
 
@@ -1367,6 +1986,8 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             page_size=page_size,
             next_item_attr=next_item_attr,
             previous_item_attr=previous_item_attr,
+            approximate_count=approximate_count,
+            cursor_secret=cursor_secret,
         )
 
     def limit(self, limit_count: int) -> "QuerySet":
@@ -1485,12 +2106,23 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             list[Any]: Serialized rows.
         """
         fields = fields or []
-        queryset: QuerySet = self._clone()
-        rows: list[type[Model]] = await queryset.all()
-
         if not isinstance(fields, list):
             raise QuerySetError(detail="Fields must be an iterable.")
 
+        as_tuple = kwargs.pop("__as_tuple__", False)
+        queryset: QuerySet = self._clone()
+
+        projection = queryset._resolve_projection(fields, exclude)
+        if projection and (not flatten or len(projection) == 1):
+            return await queryset._values_from_projection(
+                projection,
+                exclude_none=exclude_none,
+                as_tuple=as_tuple,
+                flatten=flatten,
+            )
+
+        rows: list[type[Model]] = await queryset.all()
+
         if not fields:
             rows = [row.model_dump(exclude=exclude, exclude_none=exclude_none) for row in rows]  # type: ignore
         else:
@@ -1499,8 +2131,6 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
                 for row in rows
             ]
 
-        as_tuple = kwargs.pop("__as_tuple__", False)
-
         if not as_tuple:
             return rows
 
@@ -1513,6 +2143,48 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
                 raise QuerySetError(detail=f"{fields[0]} does not exist in the results.") from None
         return rows
 
+    async def _values_from_projection(
+        self,
+        projection: list[tuple[str, str, str]],
+        *,
+        exclude_none: bool,
+        as_tuple: bool,
+        flatten: bool,
+    ) -> list[Any]:
+        """Run a narrowed select and convert rows without hydrating models.
+
+        Args:
+            projection: Plan produced by `_resolve_projection()`.
+            exclude_none: Whether `None` values should be omitted.
+            as_tuple: Whether rows should be returned as tuples.
+            flatten: Whether single-column tuple output should be flattened.
+
+        Returns:
+            list[Any]: Dictionaries, tuples or scalar values.
+        """
+        expression = self._build_projection_select(projection)
+        self._set_query_expression(expression)
+        check_db_connection(self.database)
+        async with self._connected_database(read=True) as database:
+            rows = await database.fetch_all(expression)
+
+        if as_tuple and flatten:
+            if exclude_none:
+                return [row[0] for row in rows if row[0] is not None]
+            return [row[0] for row in rows]
+
+        keys = [output_key for output_key, _, _ in projection]
+        if as_tuple:
+            if exclude_none:
+                return [tuple(value for value in row if value is not None) for row in rows]
+            return [tuple(row) for row in rows]
+        if exclude_none:
+            return [
+                {key: value for key, value in zip(keys, row, strict=True) if value is not None}
+                for row in rows
+            ]
+        return [dict(zip(keys, row, strict=True)) for row in rows]
+
     async def values_list(
         self,
         fields: Sequence[str] | str | None = None,
@@ -1532,17 +2204,14 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             list[Any]: Tuple rows or flattened values.
         """
         fields = fields or []
+        if isinstance(fields, str):
+            fields = [fields]
+
         if flat and len(fields) > 1:
             raise QuerySetError(
                 detail=f"Maximum of 1 in fields when `flat` is enables, got {len(fields)} instead."
             ) from None
 
-        if flat and isinstance(fields, str):
-            fields = [fields]
-
-        if isinstance(fields, str):
-            fields = [fields]
-
         return await self.values(
             fields=fields,
             exclude=exclude,
@@ -1551,6 +2220,49 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             __as_tuple__=True,
         )
 
+    async def as_engine_json(
+        self,
+        *,
+        include: "EngineIncludeExclude" = None,
+        exclude: "EngineIncludeExclude" = None,
+        exclude_none: bool = False,
+    ) -> AsyncIterator[str]:
+        """Stream the rows as one JSON array of engine projections.
+
+        Rows are read with the same server-side iteration as `async for` and
+        serialized per `batch_size()` batch through the model engine's
+        `dump_many_json()`, so the response can be sent while rows still
+        arrive and the full result is never held in memory.
+
+        Args:
+            include: Optional include rules forwarded to the engine.
+            exclude: Optional exclude rules forwarded to the engine.
+            exclude_none: Whether `None` values should be omitted.
+
+        Yields:
+            str: Consecutive fragments of the JSON array.
+        """
+        batch_size = self._batch_size or self.database.default_batch_size
+        batch: list[SaffierModel] = []
+        separator = ""
+
+        def dump() -> str:
+            engine = type(batch[0]).require_model_engine()
+            items = engine.dump_many_json(
+                batch, include=include, exclude=exclude, exclude_none=exclude_none
+            )
+            return f"{separator}{items[1:-1]}"
+
+        yield "["
+        async for instance in self._execute_iterate():
+            batch.append(instance)
+            if len(batch) >= batch_size:
+                yield dump()
+                batch, separator = [], ","
+        if batch:
+            yield dump()
+        yield "]"
+
     async def exists(self, **kwargs: Any) -> bool:
         """Return whether at least one row matches the queryset.
 
@@ -1572,7 +2284,7 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         expression = sqlalchemy.exists(expression).select()
         queryset._set_query_expression(expression)
         check_db_connection(queryset.database)
-        async with queryset.database as database:
+        async with queryset._connected_database(read=True) as database:
             _exists = await database.fetch_val(expression)
         return cast("bool", _exists)
 
@@ -1617,12 +2329,47 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             expression = sqlalchemy.select(sqlalchemy.func.count()).select_from(subquery)
         queryset._set_query_expression(expression)
         check_db_connection(queryset.database)
-        async with queryset.database as database:
+        async with queryset._connected_database(read=True) as database:
             _count = await database.fetch_val(expression)
         if not kwargs:
             self._cache_count = cast("int", _count)
         return cast("int", _count)
 
+    async def load_related(self, *fields: str) -> list[SaffierModel]:
+        """Evaluate the queryset and load the given foreign keys of every result.
+
+        Each level of a relation path such as `"author__city"` is loaded for all
+        the results at once through `Model.aload_many()`, so accessing the
+        related fields afterwards does not query the database again.
+
+        Args:
+            *fields: Foreign-key paths to load, using `__` between levels.
+
+        Returns:
+            list[SaffierModel]: The evaluated results.
+        """
+        results: list[SaffierModel] = await self
+        for path in fields:
+            level: list[Any] = list(results)
+            for name in path.split("__"):
+                if not level:
+                    break
+                model_class = type(level[0])
+                if name not in model_class.meta.foreign_key_fields:
+                    raise QuerySetError(
+                        detail=f"'{name}' is not a foreign key of {model_class.__name__}."
+                    )
+                level = [
+                    related
+                    for instance in level
+                    if (related := getattr(instance, name, None)) is not None
+                    and getattr(related, "__db_model__", False)
+                    and related.pk is not None
+                ]
+                if level:
+                    await type(level[0]).aload_many(level)
+        return results
+
     async def get_or_none(self, **kwargs: Any) -> SaffierModel | None:
         """Fetch one row or return `None` instead of raising.
 
@@ -1651,18 +2398,34 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         if self._cache_fetch_all:
             return list(self._cache.get_category(self.model_class).values())
 
+        results, _ = await self._execute_all()
+        return results
+
+    async def _execute_all(self, *extra_columns: Any) -> tuple[list[SaffierModel], list[Any]]:
+        """Run the select, hydrate the rows and fill the result caches.
+
+        Args:
+            *extra_columns: Additional labelled columns added to the select.
+                They are returned in the raw rows and ignored by hydration.
+
+        Returns:
+            tuple[list[SaffierModel], list[Any]]: Hydrated results and the raw
+            rows they were built from.
+        """
         queryset = self
         if queryset.is_m2m:
             queryset = queryset.distinct(queryset.m2m_related)
 
         expression, tables_and_models = queryset._build_select_with_tables()
+        if extra_columns:
+            expression = expression.add_columns(*extra_columns)
         queryset._set_query_expression(expression)
         self._set_query_expression(expression)
         if queryset._select_related:
             self._cached_select_related_expression = expression
 
         check_db_connection(queryset.database)
-        async with queryset.database as database:
+        async with queryset._connected_database(read=True) as database:
             rows = await database.fetch_all(expression)
 
         is_only_fields = bool(queryset._only)
@@ -1672,14 +2435,13 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         queryset.model_class.raw_query = queryset.sql
 
         results: list[SaffierModel] = []
-        for row in rows:
-            result = await queryset._hydrate_row(
-                queryset,
-                row,
-                tables_and_models,
-                is_only_fields=is_only_fields,
-                is_defer_fields=is_defer_fields,
-            )
+        for result in await queryset._hydrate_rows(
+            queryset,
+            rows,
+            tables_and_models,
+            is_only_fields=is_only_fields,
+            is_defer_fields=is_defer_fields,
+        ):
             if not queryset.is_m2m:
                 results.append(
                     queryset._cache_or_return_result(queryset._embed_parent_in_result(result))
@@ -1693,7 +2455,43 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         queryset._cache_last = results[-1] if results else None
         queryset._cache_fetch_all = True
 
-        return results
+        return results, rows
+
+    def _can_count_over_window(self) -> bool:
+        """Return whether a `count(*) OVER ()` column counts the matched rows.
+
+        The window is evaluated before `LIMIT` and `OFFSET`, so it gives the
+        total of an unsliced queryset. It is not used when `DISTINCT`,
+        grouping or related filters could make the joined rows differ from
+        the rows `count()` would report.
+        """
+        if self.distinct_on is not None or self._group_by or self._filter_related or self.is_m2m:
+            return False
+        dialect = self.database.engine.dialect if self.database.engine else None
+        name = self.database.url.dialect
+        if name in ("mysql", "mariadb"):
+            version = getattr(dialect, "server_version_info", None) or ()
+            return bool(version) and version >= (
+                (10, 2) if getattr(dialect, "is_mariadb", False) else (8,)
+            )
+        return name in _WINDOW_COUNT_DIALECTS
+
+    async def _all_with_total(self) -> tuple[list[SaffierModel], int | None]:
+        """Evaluate the queryset together with the total of the unsliced query.
+
+        The total is read from a `count(*) OVER ()` column of the same
+        statement, so one round trip returns a page and the number of rows
+        the queryset matches without its limit and offset.
+
+        Returns:
+            tuple[list[SaffierModel], int | None]: Results and total, or `None`
+            when no row came back to carry the count.
+        """
+        total_column = sqlalchemy.func.count().over().label(_WINDOW_TOTAL_LABEL)
+        results, rows = await self._execute_all(total_column)
+        if not rows:
+            return results, None
+        return results, cast("int", rows[0]._mapping[_WINDOW_TOTAL_LABEL])
 
     def all(self, clear_cache: bool = False, **kwargs: Any) -> "QuerySet":
         """Return a clone ready for full evaluation.
@@ -1708,6 +2506,8 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         """
         if clear_cache:
             self._clear_cache(keep_cached_selected=not self._has_dynamic_clauses)
+            for lookup in self._cross_database_lookups():
+                lookup.reset()
             return self
         queryset: QuerySet = self._clone()
         queryset.extra = kwargs
@@ -1724,6 +2524,9 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             cached = self._cache.get(self.model_class, kwargs)
             if cached is not None:
                 return cast("SaffierModel", cached)
+            mapped = self._identity_lookup(kwargs)
+            if mapped is not None:
+                return mapped
             queryset = self.filter(**kwargs)
             queryset._cache = self._cache
             return await queryset.get()
@@ -1740,7 +2543,7 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         expression, tables_and_models = queryset._build_select_with_tables()
         expression = expression.limit(2)
         check_db_connection(queryset.database)
-        async with queryset.database as database:
+        async with queryset._connected_database(read=True) as database:
             rows = await database.fetch_all(expression)
         queryset._set_query_expression(expression)
         if queryset._select_related:
@@ -1792,14 +2595,14 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             self._cached_select_related_expression = expression
 
         check_db_connection(queryset.database)
-        async with queryset.database as database:
-            rows = await database.fetch_all(expression)
-        if not rows:
+        async with queryset._connected_database(read=True) as database:
+            row = await database.fetch_one(expression)
+        if row is None:
             return None
 
         result = await queryset._hydrate_row(
             queryset,
-            rows[0],
+            row,
             tables_and_models,
             is_only_fields=bool(queryset._only),
             is_defer_fields=bool(queryset._defer),
@@ -1837,14 +2640,14 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             self._cached_select_related_expression = expression
 
         check_db_connection(queryset.database)
-        async with queryset.database as database:
-            rows = await database.fetch_all(expression)
-        if not rows:
+        async with queryset._connected_database(read=True) as database:
+            row = await database.fetch_one(expression)
+        if row is None:
             return None
 
         result = await queryset._hydrate_row(
             queryset,
-            rows[0],
+            row,
             tables_and_models,
             is_only_fields=bool(queryset._only),
             is_defer_fields=bool(queryset._defer),
@@ -1919,6 +2722,11 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         }
         instance = queryset.model_class(**instance_kwargs)
         instance.table = queryset.table
+        if settings.use_schema_translate_map and queryset.using_schema is not None:
+            # The instance outlives this queryset, so it keeps a schema-bound table.
+            instance.table = queryset.model_class.table_schema(
+                queryset.using_schema, translate=False
+            )
         instance = await instance.save(force_save=True, values=set(explicit_input.keys()))
 
         for field_name, related_values in many_to_many_values.items():
@@ -1937,41 +2745,363 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         self._cache.update(self.model_class, [instance])
         return instance
 
-    async def bulk_create(self, objs: list[dict]) -> None:
-        """Insert multiple rows in one bulk operation.
+    async def bulk_create(
+        self,
+        objs: Sequence[dict[str, Any] | SaffierModel],
+        batch_size: int | None = None,
+        return_instances: bool = False,
+        send_signals: bool = False,
+    ) -> list[SaffierModel] | None:
+        """Insert multiple rows in bulk operations.
+
+        Every payload is validated like `create()` and each batch is written
+        with one `executemany`. SQLAlchemy renders the batch as multi-row
+        `INSERT ... VALUES` statements where the driver supports it, paging
+        them so every statement stays under the dialect's parameter limit.
 
         Args:
-            objs: List of logical field payloads to validate and insert.
+            objs: Logical field payloads or model instances to insert.
+            batch_size: Maximum number of rows per batch. Defaults to a single
+                batch.
+            return_instances: Whether to return the created instances with
+                their primary keys. They are hydrated from `RETURNING` where the
+                dialect supports it and built from the inserted primary keys
+                otherwise.
+            send_signals: Whether to send `pre_save` and `post_save` once per
+                batch. Receivers get the queryset as `instance`, the column
+                payloads as `values` and, with `return_instances`, the created
+                `model_instances`.
+
+        Returns:
+            list[SaffierModel] | None: The created instances, aligned with
+            `objs`, when `return_instances` is set.
         """
         queryset: QuerySet = self._clone()
+        model_class = queryset.model_class
+        registry = getattr(model_class.meta, "registry", None)
+        if getattr(registry, "content_type", None) is not None:
+            objs = [dict(obj) if isinstance(obj, dict) else obj for obj in objs]
+            await registry.ensure_content_types(model_class, objs, schema=queryset.using_schema)
+        validated_objs = []
         new_objs = []
         for obj in objs:
-            validated_obj = queryset._validate_kwargs(**obj)
-            db_values = queryset.model_class.extract_column_values(
+            values = obj if isinstance(obj, dict) else obj.extract_db_fields()
+            validated_obj = queryset._validate_kwargs(**values)
+            db_values = model_class.extract_column_values(
                 validated_obj,
                 phase="prepare_insert",
                 instance=queryset,
                 evaluate_values=True,
             )
+            validated_objs.append(validated_obj)
             new_objs.append(db_values)
 
         if not new_objs:
-            return
+            return [] if return_instances else None
         expression = queryset.table.insert()
         queryset._set_query_expression(expression)
+        chunk_size = batch_size or len(new_objs)
+        instances: list[SaffierModel] = []
         check_db_connection(queryset.database)
-        async with queryset.database as database:
-            await database.execute_many(expression, new_objs)
+        async with queryset._connected_database() as database:
+            returning = return_instances and getattr(
+                database.engine.dialect,
+                "insert_executemany_returning_sort_by_parameter_order",
+                False,
+            )
+            plan = (
+                model_class.compile_row_loader(
+                    using_schema=queryset.using_schema,
+                    tables_and_models={"": (queryset.table, model_class)},
+                    positions=_column_positions(queryset.table.columns),
+                )
+                if returning
+                else None
+            )
+            for start in range(0, len(new_objs), chunk_size):
+                chunk = new_objs[start : start + chunk_size]
+                if send_signals:
+                    await model_class.signals.pre_save.send(
+                        sender=self.__class__, instance=self, values=chunk
+                    )
+
+                chunk_instances = None
+                if plan is not None:
+                    rows = await database.fetch_many(
+                        expression.returning(
+                            *queryset.table.columns, sort_by_parameter_order=True
+                        ),
+                        chunk,
+                    )
+                    chunk_instances = [model_class.from_row_loader(row, plan) for row in rows]
+                elif return_instances:
+                    chunk_instances = await queryset._insert_without_returning(
+                        database,
+                        expression,
+                        chunk,
+                        validated_objs[start : start + chunk_size],
+                    )
+                else:
+                    await database.execute_many(expression, chunk)
+
+                if chunk_instances is not None:
+                    instances.extend(chunk_instances)
+                if send_signals:
+                    await model_class.signals.post_save.send(
+                        sender=self.__class__,
+                        instance=self,
+                        values=chunk,
+                        model_instances=chunk_instances,
+                    )
 
-    async def bulk_update(self, objs: list[SaffierModel], fields: list[str]) -> None:
+        return instances if return_instances else None
+
+    async def _insert_without_returning(
+        self,
+        database: Any,
+        expression: Any,
+        rows: list[dict[str, Any]],
+        validated_objs: list[dict[str, Any]],
+    ) -> list[SaffierModel]:
+        """Insert `rows` and build the created instances without `RETURNING`.
+
+        Rows carrying their whole primary key are inserted with one
+        `executemany`. Otherwise the generated keys are only reported per
+        statement, so the rows are inserted one by one instead.
         """
-        Bulk updates records in a table.
+        model_class = self.model_class
+        pkcolumns = model_class.pkcolumns
+        primary_keys = [tuple(row.get(column) for column in pkcolumns) for row in rows]
+        if any(value is None for key in primary_keys for value in key):
+            primary_keys = []
+            for row in rows:
+                inserted = await database.execute(expression, row)
+                primary_keys.append(inserted if isinstance(inserted, Sequence) else (inserted,))
+        else:
+            await database.execute_many(expression, rows)
 
-        A similar solution was suggested here: https://github.com/encode/orm/pull/148
+        instances = []
+        for validated_obj, key in zip(validated_objs, primary_keys, strict=True):
+            instance = model_class(**validated_obj)
+            for column, value in zip(pkcolumns, key, strict=True):
+                setattr(instance, model_class.meta.columns_to_field.get(column, column), value)
+            instances.append(instance)
+        return instances
 
-        It is thought to be a clean approach to a simple problem so it was added here and
-        refactored to be compatible with Saffier.
+    def _field_column_names(self, field_names: Sequence[str]) -> list[str]:
+        """Expand field names into the names of the columns they are stored in."""
+        column_names: list[str] = []
+        for field_name in field_names:
+            if field_name not in self.model_class.fields:
+                raise QuerySetError(
+                    detail=f"Field '{field_name}' does not exist in {self.model_class.__name__}."
+                )
+            column_names.extend(self.model_class.meta.field_to_column_names[field_name])
+        return column_names
+
+    @staticmethod
+    def _conflict_key_clause(columns: Sequence[Any], keys: Sequence[tuple[Any, ...]]) -> Any:
+        """Match rows whose `columns` hold one of `keys`, treating `None` as `IS NULL`."""
+        if not any(value is None for key in keys for value in key):
+            return PrefetchMixin._prefetch_key_clause(columns, keys)
+        return sqlalchemy.or_(
+            *[
+                sqlalchemy.and_(
+                    *[
+                        column.is_(None) if value is None else column == value
+                        for column, value in zip(columns, key, strict=True)
+                    ]
+                )
+                for key in keys
+            ]
+        )
+
+    def _upsert_statement(
+        self, conflict_columns: Sequence[str], update_columns: Sequence[str]
+    ) -> Any:
+        """Build the dialect-specific `INSERT` for `bulk_upsert()`.
+
+        Without update columns, conflicting rows are skipped (`DO NOTHING`)
+        whatever unique constraint they collide on.
         """
+        dialect = self.database.url.dialect
+        table = self.table
+        if dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+
+            statement = insert(table)
+            if not update_columns:
+                return statement.on_conflict_do_nothing()
+            return statement.on_conflict_do_update(
+                index_elements=[table.c[name] for name in conflict_columns],
+                set_={name: statement.excluded[name] for name in update_columns},
+            )
+        if dialect in ("mysql", "mariadb"):
+            from sqlalchemy.dialects.mysql import insert
+
+            statement = insert(table)
+            if not update_columns:
+                name = conflict_columns[0]
+                return statement.on_duplicate_key_update({name: table.c[name]})
+            return statement.on_duplicate_key_update(
+                {name: statement.inserted[name] for name in update_columns}
+            )
+        raise QuerySetError(detail=f"bulk_upsert() is not supported by the '{dialect}' dialect.")
+
+    async def _fetch_rows_by_keys(
+        self, columns: Sequence[Any], keys: Sequence[tuple[Any, ...]]
+    ) -> list[Any]:
+        rows: list[Any] = []
+        async with self._connected_database() as database:
+            for chunk in self._prefetch_chunks(keys):
+                expression = sqlalchemy.select(self.table).where(
+                    self._conflict_key_clause(columns, chunk)
+                )
+                rows.extend(await database.fetch_all(expression))
+        return rows
+
+    async def bulk_upsert(
+        self,
+        objs: Sequence[dict[str, Any] | SaffierModel],
+        conflict_fields: Sequence[str] | None = None,
+        update_fields: Sequence[str] | None = None,
+    ) -> list[SaffierModel]:
+        """Insert rows and update the ones colliding on `conflict_fields`.
+
+        The statement compiles to `INSERT ... ON CONFLICT (...) DO UPDATE` on
+        PostgreSQL and SQLite and to `INSERT ... ON DUPLICATE KEY UPDATE` on
+        MySQL/MariaDB. Rows are hydrated from `RETURNING` where the dialect
+        supports it for `executemany`, otherwise they are selected back by
+        their conflict keys. No model signals are sent.
+
+        Args:
+            objs: Logical field payloads or model instances.
+            conflict_fields: Fields covered by a primary key or unique
+                constraint. Defaults to the primary key.
+            update_fields: Fields overwritten on existing rows. Defaults to every
+                provided field except the conflict fields and the primary key.
+                An empty list leaves existing rows untouched (`DO NOTHING`).
+
+        Returns:
+            list[SaffierModel]: One instance per object, aligned with `objs`.
+            Objects sharing the same conflict key map to the same instance and
+            the last of them is the one written.
+
+        Raises:
+            QuerySetError: If a field does not exist, a conflict value is
+                missing, or the database dialect has no upsert syntax.
+        """
+        queryset: QuerySet = self._clone()
+        model_class = queryset.model_class
+        conflict_fields = list(conflict_fields or model_class.pknames)
+        conflict_columns = queryset._field_column_names(conflict_fields)
+        pk_columns = set(model_class.pkcolumns)
+
+        keys: list[tuple[Any, ...]] = []
+        rows: dict[tuple[Any, ...], dict[str, Any]] = {}
+        for obj in objs:
+            values = obj if isinstance(obj, dict) else obj.extract_db_fields()
+            db_values = model_class.extract_column_values(
+                queryset._validate_kwargs(**values),
+                phase="prepare_insert",
+                instance=queryset,
+                evaluate_values=True,
+            )
+            for column_name in conflict_columns:
+                if column_name not in db_values or (
+                    column_name in pk_columns and db_values[column_name] is None
+                ):
+                    raise QuerySetError(
+                        detail=f"A value for '{column_name}' is required by conflict_fields."
+                    )
+            key = tuple(db_values[column_name] for column_name in conflict_columns)
+            rows.pop(key, None)
+            rows[key] = db_values
+            keys.append(key)
+
+        if not rows:
+            return []
+
+        if update_fields is None:
+            excluded = set(conflict_columns) | pk_columns
+            update_columns = None
+        else:
+            excluded = set()
+            update_columns = queryset._field_column_names(update_fields)
+
+        columns = [queryset.table.c[column_name] for column_name in conflict_columns]
+        found: dict[tuple[Any, ...], Any] = {}
+        pending = rows
+        if update_columns == []:
+            # Existing rows are only read, so skip them up front. This also
+            # keeps tables without a matching unique constraint duplicate free.
+            for row in await queryset._fetch_rows_by_keys(columns, list(rows)):
+                found[tuple(row._mapping[column] for column in columns)] = row
+            pending = {key: values for key, values in rows.items() if key not in found}
+
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for db_values in pending.values():
+            groups.setdefault(tuple(db_values), []).append(db_values)
+
+        check_db_connection(queryset.database)
+        async with queryset._connected_database() as database:
+            returning = getattr(database.engine.dialect, "insert_executemany_returning", False)
+            for group_columns, group in groups.items():
+                group_updates = (
+                    [name for name in group_columns if name not in excluded]
+                    if update_columns is None
+                    else [name for name in update_columns if name in group_columns]
+                )
+                expression = queryset._upsert_statement(conflict_columns, group_updates)
+                queryset._set_query_expression(expression)
+                if not returning:
+                    await database.execute_many(expression, group)
+                    continue
+                expression = expression.returning(*queryset.table.columns)
+                for row in await database.fetch_many(expression, group):
+                    found[tuple(row._mapping[column] for column in columns)] = row
+
+        missing = [key for key in rows if key not in found]
+        if missing:
+            for row in await queryset._fetch_rows_by_keys(columns, missing):
+                found[tuple(row._mapping[column] for column in columns)] = row
+
+        plan = model_class.compile_row_loader(
+            using_schema=queryset.using_schema,
+            tables_and_models={"": (queryset.table, model_class)},
+            positions=_column_positions(queryset.table.columns),
+        )
+        instances = {key: model_class.from_row_loader(row, plan) for key, row in found.items()}
+        return [instances[key] for key in keys if key in instances]
+
+    async def bulk_update(
+        self,
+        objs: list[SaffierModel],
+        fields: list[str],
+        batch_size: int | None = None,
+        strategy: str | None = None,
+    ) -> None:
+        """
+        Bulk updates records in a table.
+
+        Two strategies are available. `"case"` sends one
+        `UPDATE ... SET col = CASE WHEN pk = ... THEN ... END WHERE pk IN (...)`
+        per batch of `batch_size` objects (the `bulk_update_batch_size` setting by
+        default), capped so the batch stays under the dialect's bound-parameter
+        limit. Without either, the batch is as large as that limit allows.
+        `"executemany"` runs one `UPDATE ... WHERE pk = ...` per object through
+        `executemany`. When `strategy` is not given, `"case"` is used for more
+        than one object unless the primary key spans several columns on a
+        dialect without row-value `IN` support.
+
+        The executemany variant follows the solution suggested here:
+        https://github.com/encode/orm/pull/148
+        """
+        if strategy not in (None, "case", "executemany"):
+            raise QuerySetError(detail=f"Unknown bulk_update strategy '{strategy}'.")
         queryset: QuerySet = self._clone()
 
         new_fields = {}
@@ -2007,34 +3137,112 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             )
             for obj in new_objs
         ]
+        keys = [tuple(getattr(obj, pk_name) for pk_name in queryset.pknames) for obj in objs]
+        if not any(new_objs):
+            return
 
-        pk_bind_names = {pk_name: f"__pk_{pk_name}" for pk_name in queryset.pknames}
-        expression = queryset.table.update().where(
+        if strategy is None:
+            strategy = (
+                "case"
+                if len(objs) > 1
+                and (
+                    len(queryset.pknames) == 1
+                    or queryset.database.url.dialect in _ROW_VALUE_IN_DIALECTS
+                )
+                else "executemany"
+            )
+        check_db_connection(queryset.database)
+        async with queryset._connected_database() as database:
+            if strategy == "executemany":
+                await queryset._bulk_update_executemany(database, keys, new_objs)
+                return
+
+            chunk_size = queryset._bulk_update_case_batch_size(new_objs, batch_size)
+            for start in range(0, len(objs), chunk_size):
+                expression = queryset._bulk_update_case_statement(
+                    keys[start : start + chunk_size], new_objs[start : start + chunk_size]
+                )
+                if expression is not None:
+                    queryset._set_query_expression(expression)
+                    await database.execute(expression)
+
+    async def _bulk_update_executemany(
+        self, database: Any, keys: list[tuple[Any, ...]], new_objs: list[dict[str, Any]]
+    ) -> None:
+        pk_bind_names = {pk_name: f"__pk_{pk_name}" for pk_name in self.pknames}
+        expression = self.table.update().where(
             sqlalchemy.and_(
                 *[
-                    getattr(queryset.table.c, pk_name)
-                    == sqlalchemy.bindparam(pk_bind_names[pk_name])
-                    for pk_name in queryset.pknames
+                    getattr(self.table.c, pk_name) == sqlalchemy.bindparam(pk_bind_names[pk_name])
+                    for pk_name in self.pknames
                 ]
             )
         )
         kwargs: dict[str, Any] = {
             field: sqlalchemy.bindparam(field) for obj in new_objs for field in obj
         }
-        pks = [
-            {pk_bind_names[pk_name]: getattr(obj, pk_name) for pk_name in queryset.pknames}
-            for obj in objs
+        query_list = [
+            {
+                **{
+                    pk_bind_names[pk_name]: value
+                    for pk_name, value in zip(self.pknames, key, strict=True)
+                },
+                **values,
+            }
+            for key, values in zip(keys, new_objs, strict=True)
         ]
 
-        query_list = []
-        for pk, value in zip(pks, new_objs):  # noqa
-            query_list.append({**pk, **value})
-
         expression = expression.values(kwargs)
-        queryset._set_query_expression(expression)
-        check_db_connection(queryset.database)
-        async with queryset.database as database:
-            await database.execute_many(expression, query_list)
+        self._set_query_expression(expression)
+        await database.execute_many(expression, query_list)
+
+    def _bulk_update_case_batch_size(
+        self, new_objs: list[dict[str, Any]], batch_size: int | None
+    ) -> int:
+        """Return how many objects one `CASE` update can hold.
+
+        Every object binds its primary key once per updated column and once
+        more in the `IN` list, plus one value per column, so the batch is capped
+        to stay under the dialect's bound-parameter limit.
+        """
+        columns = len({column_name for values in new_objs for column_name in values})
+        pk_count = len(self.pknames)
+        limit = _BIND_PARAMETER_LIMITS.get(
+            self.database.url.dialect, _DEFAULT_BIND_PARAMETER_LIMIT
+        )
+        fitting = max(limit // (columns * (pk_count + 1) + pk_count), 1)
+        requested = batch_size or settings.bulk_update_batch_size
+        return min(requested, fitting) if requested else fitting
+
+    def _bulk_update_case_statement(
+        self, keys: list[tuple[Any, ...]], new_objs: list[dict[str, Any]]
+    ) -> Any:
+        """Build one `UPDATE` setting every column through a `CASE` on the primary key."""
+        pk_columns = [getattr(self.table.c, pk_name) for pk_name in self.pknames]
+        branches: dict[str, list[tuple[Any, Any]]] = {}
+        for key, values in zip(keys, new_objs, strict=True):
+            matches = sqlalchemy.and_(
+                *[column == value for column, value in zip(pk_columns, key, strict=True)]
+            )
+            for column_name, value in values.items():
+                column = self.table.c[column_name]
+                branches.setdefault(column_name, []).append(
+                    (matches, sqlalchemy.bindparam(None, value, type_=column.type))
+                )
+        if not branches:
+            return None
+
+        updated_keys = [key for key, values in zip(keys, new_objs, strict=True) if values]
+        return (
+            self.table.update()
+            .where(self._prefetch_key_clause(pk_columns, updated_keys))
+            .values(
+                {
+                    column_name: sqlalchemy.case(*whens, else_=self.table.c[column_name])
+                    for column_name, whens in branches.items()
+                }
+            )
+        )
 
     async def raw_delete(
         self,
@@ -2066,7 +3274,7 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             )
 
         check_db_connection(queryset.database)
-        async with queryset.database as database:
+        async with queryset._connected_database() as database:
             row_count = cast("int", await database.fetch_val(count_expression) or 0)
         expression = queryset.table.delete()
 
@@ -2080,7 +3288,7 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
 
         queryset._set_query_expression(expression)
         check_db_connection(queryset.database)
-        async with queryset.database as database:
+        async with queryset._connected_database() as database:
             await database.execute(expression)
         return row_count
 
@@ -2116,11 +3324,14 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         )
         return row_count
 
-    async def update(self, **kwargs: Any) -> None:
+    async def update(self, **kwargs: Any) -> int:
         """Update rows matched by the queryset with the provided field values.
 
         Args:
             **kwargs: Logical field payload to normalize, validate, and persist.
+
+        Returns:
+            int: Number of updated rows, as reported by the database driver.
         """
         queryset: QuerySet = self._clone()
         normalized_kwargs = queryset.model_class.normalize_field_kwargs(kwargs)
@@ -2158,7 +3369,7 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
 
         if not db_kwargs:
             await self.model_class.signals.post_update.send(sender=self.__class__, instance=self)
-            return
+            return 0
 
         expression = queryset.table.update().values(**db_kwargs)
 
@@ -2167,10 +3378,11 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
 
         queryset._set_query_expression(expression)
         check_db_connection(queryset.database)
-        async with queryset.database as database:
-            await database.execute(expression)
+        async with queryset._connected_database() as database:
+            row_count = await database.execute(expression)
 
         await self.model_class.signals.post_update.send(sender=self.__class__, instance=self)
+        return cast(int, row_count)
 
     async def get_or_create(
         self,
@@ -2214,11 +3426,14 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         """
         Bulk gets or creates records.
 
-        When `unique_fields` is provided, existing records are fetched by those fields.
-        Missing records are created. Duplicate lookup payloads inside `objs` are collapsed.
+        When `unique_fields` is provided, existing records are fetched by those fields with
+        one query. The missing ones go through `create()`, so save hooks, `pre_save`/`post_save`
+        signals and content types behave as for single creates. Duplicate lookup payloads
+        inside `objs` are collapsed.
         """
         queryset: QuerySet = self._clone()
-        instances: list[SaffierModel] = []
+        model_class = queryset.model_class
+        payloads: list[dict[str, Any]] = []
         seen_lookups: set[tuple[tuple[str, Any], ...]] = set()
 
         for obj in objs:
@@ -2238,14 +3453,41 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
                     continue
                 seen_lookups.add(lookup_key)
 
-                instance = await queryset.get_or_none(**lookup)
-                if instance is not None:
-                    instances.append(instance)
-                    continue
+            payloads.append(values)
 
-            instance = await queryset.create(**values)
-            instances.append(instance)
+        if not unique_fields:
+            return [await queryset.create(**values) for values in payloads]
+
+        unique_columns = queryset._field_column_names(unique_fields)
+        columns = [queryset.table.c[column_name] for column_name in unique_columns]
+        keys: list[tuple[Any, ...]] = []
+        for values in payloads:
+            db_values = model_class.extract_column_values(
+                queryset._validate_kwargs(**values),
+                phase="prepare_insert",
+                instance=queryset,
+                evaluate_values=True,
+            )
+            keys.append(tuple(db_values.get(column_name) for column_name in unique_columns))
+
+        plan = model_class.compile_row_loader(
+            using_schema=queryset.using_schema,
+            tables_and_models={"": (queryset.table, model_class)},
+            positions=_column_positions(queryset.table.columns),
+        )
+        existing = {
+            tuple(row._mapping[column] for column in columns): model_class.from_row_loader(
+                row, plan
+            )
+            for row in await queryset._fetch_rows_by_keys(columns, keys)
+        }
 
+        instances: list[SaffierModel] = []
+        for key, values in zip(keys, payloads, strict=True):
+            instance = existing.get(key)
+            if instance is None:
+                instance = existing[key] = await queryset.create(**values)
+            instances.append(instance)
         return instances
 
     bulk_select_or_insert = bulk_get_or_create
@@ -2426,6 +3668,7 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             tuple[Any, dict[str, tuple[Any, Any]]]: Select expression and join
             table/model mapping.
         """
+        await self._resolve_cross_database_lookups()
         return self._build_select_with_tables()
 
     async def as_select(self) -> Any:
@@ -2471,25 +3714,23 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
 
         check_db_connection(queryset.database)
         if fetch_all_at_once:
-            async with queryset.database as database:
+            async with queryset._connected_database(read=True) as database:
                 rows = await database.fetch_all(expression)
 
-            for row in rows:
-                result = await queryset._hydrate_row(
-                    queryset,
-                    row,
-                    tables_and_models,
-                    is_only_fields=is_only_fields,
-                    is_defer_fields=is_defer_fields,
-                )
-
+            for result in await queryset._hydrate_rows(
+                queryset,
+                rows,
+                tables_and_models,
+                is_only_fields=is_only_fields,
+                is_defer_fields=is_defer_fields,
+            ):
                 if not queryset.is_m2m:
                     yield queryset._embed_parent_in_result(result)
                 else:
                     yield getattr(result, queryset.m2m_related)
             return
 
-        async with queryset.database as database:
+        async with queryset._connected_database(read=True) as database:
             async for row in database.iterate(expression, chunk_size=queryset._batch_size):
                 result = await queryset._hydrate_row(
                     queryset,
@@ -2545,6 +3786,16 @@ class CombinedQuerySet(QuerySet):
         queryset._op = self._op
         return queryset
 
+    def _can_count_over_window(self) -> bool:
+        return False
+
+    def _cross_database_lookups(self) -> list[CrossDatabaseLookup]:
+        return [
+            *self._left._cross_database_lookups(),
+            *self._right._cross_database_lookups(),
+            *super()._cross_database_lookups(),
+        ]
+
     def _build_select_with_tables(self) -> tuple[Any, dict[str, tuple[Any, Any]]]:
         queryset = self._clone()
 
@@ -3,13 +3,16 @@ from __future__ import annotations
 from typing import Any
 
 import sqlalchemy
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import StrSQLCompiler
 
 from saffier.conf import settings
 from saffier.core.db import fields as saffier_fields
 from saffier.core.db.relationships.related import RelatedField
 from saffier.core.db.relationships.utils import crawl_relationship
+from saffier.core.utils.concurrency import batched
 from saffier.core.utils.db import hash_tablekey
-from saffier.core.utils.sync import force_current_loop_for_sqlalchemy, run_sync
+from saffier.exceptions import QuerySetError
 
 DEFAULT_ESCAPE_CHARACTERS = ("%", "_")
 
@@ -50,6 +53,81 @@ def _build_composite_in_clause(
     return sqlalchemy.or_(*clauses)
 
 
+class CrossDatabaseLookup(sqlalchemy.sql.expression.ColumnElement[bool]):
+    """Filter on a relation whose target lives in another database.
+
+    The keys matching the remote lookup are unknown while the filter is built.
+    The queryset reads them with `resolve()` when it runs, together with the
+    other pending lookups, and the filter then renders as an `IN` over those
+    keys, split in lists of `cross_db_lookup_chunk_size` keys.
+
+    The keys are kept until `reset()`, so every statement of a queryset and of
+    its clones reuses one remote query.
+    """
+
+    __visit_name__ = "cross_database_lookup"
+    inherit_cache = False
+    type = sqlalchemy.Boolean()
+
+    def __init__(
+        self,
+        columns: list[sqlalchemy.Column[Any]],
+        queryset: Any,
+        remote_fields: tuple[str, ...],
+    ) -> None:
+        self.columns = columns
+        self.queryset = queryset
+        self.remote_fields = remote_fields
+        # Shared with the copies SQLAlchemy makes of the element.
+        self._resolution: dict[str, list[tuple[Any, ...]]] = {}
+
+    @property
+    def database(self) -> Any:
+        return self.queryset.database
+
+    @property
+    def keys(self) -> list[tuple[Any, ...]] | None:
+        return self._resolution.get("keys")
+
+    async def resolve(self) -> list[tuple[Any, ...]]:
+        """Read the remote keys matching the lookup, once."""
+        if "keys" not in self._resolution:
+            rows = await self.queryset.values_list(fields=list(self.remote_fields))
+            self._resolution["keys"] = list(dict.fromkeys(tuple(row) for row in rows))
+        return self._resolution["keys"]
+
+    def reset(self) -> None:
+        """Forget the resolved keys so the next execution reads them again."""
+        self._resolution.pop("keys", None)
+
+    def as_clause(self) -> Any:
+        keys = self.keys
+        if keys is None:
+            raise QuerySetError(
+                detail="Cross-database lookups are resolved when the queryset is evaluated."
+            )
+        if len(self.columns) > 1:
+            return _build_composite_in_clause(
+                [dict(zip(self.columns, key, strict=True)) for key in keys]
+            )
+        values = [key[0] for key in keys if key[0] is not None]
+        if not values:
+            return sqlalchemy.false()
+        chunk_size = settings.cross_db_lookup_chunk_size or len(values)
+        clauses = [self.columns[0].in_(chunk) for chunk in batched(values, chunk_size)]
+        return clauses[0] if len(clauses) == 1 else sqlalchemy.or_(*clauses)
+
+
+@compiles(CrossDatabaseLookup)
+def _compile_cross_database_lookup(
+    element: CrossDatabaseLookup, compiler: Any, **kwargs: Any
+) -> str:
+    if element.keys is None and isinstance(compiler, StrSQLCompiler):
+        columns = ", ".join(compiler.process(column, **kwargs) for column in element.columns)
+        return f"({columns}) IN (<cross-database lookup>)"
+    return compiler.process(element.as_clause(), **kwargs)
+
+
 def build_lookup_clauses(
     model_class: Any,
     table: sqlalchemy.Table,
@@ -99,38 +177,21 @@ def build_lookup_clauses(
                     raise ValueError(
                         f"Cross-database lookup requires a foreign key field, got {crawl_result.field_name!r}."
                     )
-                remote_fields = tuple(relation_field.related_columns.keys())
                 sub_queryset = relation_field.target.query.filter(
                     **{crawl_result.cross_db_remainder: value}
                 )
-                if len(remote_fields) == 1:
-                    with force_current_loop_for_sqlalchemy():
-                        sub_results = run_sync(
-                            sub_queryset.values_list(fields=[remote_fields[0]], flat=True)
-                        )
-                    clauses.append(
-                        table.columns[
-                            relation_field.get_column_names(crawl_result.field_name)[0]
-                        ].in_(sub_results)
-                    )
-                else:
-                    with force_current_loop_for_sqlalchemy():
-                        sub_results = run_sync(
-                            sub_queryset.values_list(fields=list(remote_fields))
-                        )
-                    clauses.append(
-                        _build_composite_in_clause(
-                            [
-                                {
-                                    table.columns[column_name]: row[idx]
-                                    for idx, column_name in enumerate(
-                                        relation_field.get_column_names(crawl_result.field_name)
-                                    )
-                                }
-                                for row in sub_results
-                            ]
-                        )
+                clauses.append(
+                    CrossDatabaseLookup(
+                        [
+                            table.columns[column_name]
+                            for column_name in relation_field.get_column_names(
+                                crawl_result.field_name
+                            )
+                        ],
+                        sub_queryset,
+                        tuple(relation_field.related_columns.keys()),
                     )
+                )
                 continue
             direct_relation_field = None
             if crawl_result.forward_path and "__" not in crawl_result.forward_path:
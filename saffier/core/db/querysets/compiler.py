@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from saffier.conf import settings
 
 if TYPE_CHECKING:
     from saffier.core.db.querysets.base import BaseQuerySet
@@ -20,4 +23,73 @@ class QueryCompiler:
         return await self.queryset.as_select_with_tables()
 
 
-__all__ = ["QueryCompiler"]
+class StatementCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class StatementCache:
+    """Bounded LRU of built queryset statements keyed by query shape.
+
+    Querysets whose lookups only compare model columns with plain values build
+    the same statement from every call site, with only the bound values
+    changing. The first statement built for such a shape is kept here so later
+    querysets can reuse it with their own bind parameters instead of running
+    the select build again.
+
+    The size comes from the `statement_cache_size` setting unless `maxsize` is
+    given, and a size of `0` disables the cache. `info()` reports the hit and
+    miss counters.
+    """
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Any, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is not None:
+            return self._maxsize
+        return settings.statement_cache_size or 0
+
+    def get(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(self, key: Any, entry: Any) -> None:
+        maxsize = self.maxsize
+        if maxsize <= 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached statement and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> StatementCacheInfo:
+        return StatementCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._entries),
+        )
+
+
+statement_cache = StatementCache()
+
+
+__all__ = ["QueryCompiler", "StatementCache", "StatementCacheInfo", "statement_cache"]
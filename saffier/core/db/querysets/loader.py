@@ -0,0 +1,96 @@
+"""Sibling-aware lazy loading for instances hydrated together."""
+
+from __future__ import annotations
+
+import weakref
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from saffier.core.db.models.model import Model
+
+# Loaders by `id()` of their instances. Models are unhashable, so a
+# `WeakKeyDictionary` cannot hold them; the weak references each loader keeps
+# to its siblings drop their entry instead once an instance is collected.
+_LOADERS: dict[int, SiblingLoader] = {}
+
+
+def _forget(key: int) -> Any:
+    return lambda ref: _LOADERS.pop(key, None)
+
+
+class SiblingLoader:
+    """Loading context shared by instances hydrated by the same evaluation.
+
+    The first access to an unloaded field on one of the instances loads the
+    missing fields of every sibling still alive with one `IN` query, instead of
+    one `SELECT` per instance. Siblings are held through weak references so a
+    single retained instance does not keep the whole result set alive.
+
+    Loaders are kept outside the instances, so they never show up in
+    `__dict__`, copies or pickles.
+    """
+
+    __slots__ = ("_siblings",)
+
+    def __init__(self, instances: Sequence[Model]) -> None:
+        self._siblings = [weakref.ref(instance, _forget(id(instance))) for instance in instances]
+
+    def siblings(self) -> list[Model]:
+        return [instance for ref in self._siblings if (instance := ref()) is not None]
+
+    async def load(self, instance: Model) -> None:
+        """Load `instance` together with its siblings of the same model."""
+        model_class = type(instance)
+        siblings = [sibling for sibling in self.siblings() if type(sibling) is model_class]
+        if not any(sibling is instance for sibling in siblings):
+            siblings.append(instance)
+        await model_class.aload_many(siblings)
+
+
+def attach_sibling_loaders(instances: Sequence[Model], *, include_instances: bool = False) -> None:
+    """Share sibling loaders between instances hydrated together.
+
+    Foreign-key placeholders found on the same field of `instances` share one
+    loader. Related instances that are already loaded, such as the ones from
+    `select_related()`, are walked recursively so their placeholders are
+    shared as well.
+
+    Args:
+        instances: Instances of one model hydrated by the same evaluation.
+        include_instances: Whether `instances` themselves are partially loaded
+            (`only()`/`defer()`) and should share a loader too.
+    """
+    if len(instances) < 2:
+        return
+    if include_instances:
+        _share_loader(instances)
+
+    for name in type(instances[0]).meta.foreign_key_fields:
+        related = [
+            value
+            for instance in instances
+            if (value := instance.__dict__.get(name)) is not None
+            and getattr(value, "__db_model__", False)
+            and value.pk is not None
+        ]
+        if len(related) < 2:
+            continue
+        if related[0]._has_loaded_db_fields():
+            attach_sibling_loaders(related)
+        else:
+            _share_loader(related)
+
+
+def get_sibling_loader(instance: Any) -> SiblingLoader | None:
+    """Return the loader shared by `instance` and its siblings, if any."""
+    return _LOADERS.get(id(instance))
+
+
+def _share_loader(instances: Sequence[Any]) -> None:
+    loader = SiblingLoader(instances)
+    for instance in instances:
+        _LOADERS[id(instance)] = loader
+
+
+__all__ = ["SiblingLoader", "attach_sibling_loaders", "get_sibling_loader"]
@@ -33,7 +33,14 @@ class ResultParser:
         _prefetches: Any = None,
         _cache: Any = None,
     ) -> list[tuple[Any, Any]]:
-        return [await self.row_to_model(row, tables_and_models) for row in rows]
+        results = await self.queryset._hydrate_rows(
+            self.queryset,
+            rows,
+            tables_and_models,
+            is_only_fields=bool(self.queryset._only),
+            is_defer_fields=bool(self.queryset._defer),
+        )
+        return [(result, self.queryset._embed_parent_in_result(result)) for result in results]
 
 
 __all__ = ["ResultParser"]
@@ -1,9 +1,14 @@
-from typing import TYPE_CHECKING, Optional, cast
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Optional, cast
 
+import sqlalchemy
+
+from saffier.conf import settings
+from saffier.core.utils.db import check_db_connection
 from saffier.exceptions import QuerySetError
 
 if TYPE_CHECKING:
-    from saffier import QuerySet
+    from saffier import Model, QuerySet
 
 
 class Prefetch:
@@ -49,3 +54,70 @@ class PrefetchMixin:
         prefetch = list(self._prefetch_related) + prefetch  # type: ignore
         queryset._prefetch_related = prefetch
         return queryset
+
+    @staticmethod
+    def _prefetch_chunks(keys: Sequence[tuple[Any, ...]]) -> list[Sequence[tuple[Any, ...]]]:
+        chunk_size = settings.prefetch_chunk_size or len(keys) or 1
+        return [keys[start : start + chunk_size] for start in range(0, len(keys), chunk_size)]
+
+    @staticmethod
+    def _prefetch_key_clause(columns: Sequence[Any], keys: Sequence[tuple[Any, ...]]) -> Any:
+        if len(columns) == 1:
+            return columns[0].in_([key[0] for key in keys])
+        return sqlalchemy.tuple_(*columns).in_([tuple(key) for key in keys])
+
+    async def _fetch_prefetch_pairs(
+        self,
+        related_path: str,
+        keys: Sequence[tuple[Any, ...]],
+        *,
+        keys_on_root: bool,
+    ) -> list[tuple[tuple[Any, ...], tuple[Any, ...]]]:
+        """
+        Returns the `(parent key, child key)` pairs linked through `related_path`.
+
+        The join starts at the queryset model. When `keys_on_root` is set the
+        parent keys are the primary keys of the queryset model, otherwise they
+        are the primary keys of the model at the end of the path.
+        """
+        queryset: QuerySet = self._clone()
+        _, select_from, tables_and_models = queryset._build_tables_select_from_relationship(
+            [related_path]
+        )
+        root_table, root_model = tables_and_models[""]
+        leaf_table, leaf_model = tables_and_models[related_path]
+        root_columns = queryset._primary_join_columns(root_table, root_model)
+        leaf_columns = queryset._primary_join_columns(leaf_table, leaf_model)
+        parent_columns, child_columns = (
+            (root_columns, leaf_columns) if keys_on_root else (leaf_columns, root_columns)
+        )
+        labelled = [
+            column.label(f"prefetch_parent_{index}") for index, column in enumerate(parent_columns)
+        ] + [column.label(f"prefetch_child_{index}") for index, column in enumerate(child_columns)]
+        width = len(parent_columns)
+
+        pairs: list[tuple[tuple[Any, ...], tuple[Any, ...]]] = []
+        check_db_connection(queryset.database)
+        async with queryset._connected_database(read=True) as database:
+            for chunk in self._prefetch_chunks(keys):
+                expression = (
+                    sqlalchemy.select(*labelled)
+                    .select_from(select_from)
+                    .where(self._prefetch_key_clause(parent_columns, chunk))
+                    .distinct()
+                )
+                for row in await database.fetch_all(expression):
+                    values = tuple(row)
+                    pairs.append((values[:width], values[width:]))
+        return pairs
+
+    async def _fetch_prefetch_records(self, keys: Sequence[tuple[Any, ...]]) -> list["Model"]:
+        """
+        Loads the records of the queryset whose primary keys are in `keys`.
+        """
+        queryset: QuerySet = self._clone()
+        columns = queryset._primary_join_columns(queryset.table, queryset.model_class)
+        records: list[Model] = []
+        for chunk in self._prefetch_chunks(keys):
+            records.extend(await queryset.filter(self._prefetch_key_clause(columns, chunk)))
+        return records
@@ -3,8 +3,10 @@
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
+import sqlalchemy
 from sqlalchemy.exc import IntegrityError
 
+from saffier.core.utils.db import check_db_connection
 from saffier.exceptions import ObjectNotFound, RelationshipIncompatible, RelationshipNotFound
 from saffier.protocols.many_relationship import ManyRelationProtocol
 
@@ -234,10 +236,132 @@ class Relation(ManyRelationProtocol):
         await self.add(child)
         return child
 
-    async def add_many(self, *children: type["Model"]) -> list[Any]:
-        results = []
+    def _relation_columns(self) -> tuple[Any, Any] | None:
+        """Return the through-table columns pointing at the owner and the target.
+
+        Returns:
+            tuple[Any, Any] | None: Owner and target columns, or `None` when one
+            of the foreign keys spans several columns. The set-based helpers
+            fall back to the per-child operations in that case.
+        """
+        through = self.resolved_through
+        columns = []
+        for name in (self.owner_name, self.to_name):
+            field = through.fields[name]
+            column_names = (
+                field.get_column_names(name) if hasattr(field, "get_column_names") else (name,)
+            )
+            if len(column_names) != 1:
+                return None
+            columns.append(through.table.c[column_names[0]])
+        return columns[0], columns[1]
+
+    @staticmethod
+    def _is_relation_key(value: Any) -> bool:
+        return value is not None and not isinstance(value, dict) and not hasattr(value, "pk")
+
+    async def _resolve_children(self, children: Sequence[Any]) -> list[Any]:
+        """Validate children and persist dictionary payloads as target instances."""
+        target = self.resolved_to
+        resolved = []
         for child in children:
-            results.append(await self.add(child))
+            if not isinstance(child, (target, dict)):
+                raise RelationshipIncompatible(
+                    f"The child is not from the type '{target.__name__}'."
+                )
+            if isinstance(child, dict):
+                child = target(**child)
+                await child.save()
+            resolved.append(child)
+        return resolved
+
+    async def _fetch_through_rows(self, expression: Any) -> list[Any]:
+        database = self.resolved_through.query.database
+        check_db_connection(database)
+        async with database as connection:
+            return await connection.fetch_all(expression)
+
+    async def add_many(self, *children: type["Model"] | dict[str, Any]) -> list[Any]:
+        """Attach several children with one lookup query and one bulk insert.
+
+        The through rows already present for the given children are fetched
+        with a single `IN` query and the missing ones are inserted with one
+        `executemany`. Unlike `add()`, no model save signals are fired for the
+        created through rows.
+
+        Args:
+            *children: Related model instances or dictionaries used to create
+                them.
+
+        Returns:
+            list[Any]: One entry per child, aligned with `children`. Children
+            that were already attached (or repeated in `children`) map to
+            `None`.
+        """
+        resolved = await self._resolve_children(children)
+        if not resolved:
+            return []
+
+        columns = self._relation_columns()
+        owner_key = self._build_relation_params(None)[self.owner_name]
+        keys = [self._build_relation_params(child)[self.to_name] for child in resolved]
+        if (
+            columns is None
+            or not self._is_relation_key(owner_key)
+            or not all(self._is_relation_key(key) for key in keys)
+        ):
+            return [await self.add(child) for child in resolved]
+
+        owner_column, to_column = columns
+        clause = to_column.in_(set(keys))
+        if not getattr(self.target_foreign_key, "unique", False):
+            clause = sqlalchemy.and_(owner_column == owner_key, clause)
+        existing = {
+            row[0]
+            for row in await self._fetch_through_rows(
+                sqlalchemy.select(to_column).where(clause).distinct()
+            )
+        }
+
+        positions: dict[Any, int] = {}
+        for index, key in enumerate(keys):
+            if key not in existing and key not in positions:
+                positions[key] = index
+
+        results: list[Any] = [None] * len(resolved)
+        if not positions:
+            return results
+
+        through = self.resolved_through
+        try:
+            await through.query.bulk_create(
+                [{self.owner_name: owner_key, self.to_name: key} for key in positions]
+            )
+        except IntegrityError:
+            # Another writer attached some of the children meanwhile.
+            for index in positions.values():
+                results[index] = await self.add(resolved[index])
+            return results
+
+        through_instances: dict[Any, Any] = {}
+        if self.embed_through and isinstance(self.embed_through, str):
+            rows = await self._fetch_through_rows(
+                sqlalchemy.select(through.table).where(
+                    sqlalchemy.and_(owner_column == owner_key, to_column.in_(list(positions)))
+                )
+            )
+            through_instances = {
+                row._mapping[to_column]: through.from_query_result(row) for row in rows
+            }
+
+        for key, index in positions.items():
+            child = resolved[index]
+            through_instance = through_instances.get(key)
+            results[index] = (
+                self._bind_embedded_through(child, through_instance)
+                if through_instance is not None
+                else child
+            )
         return results
 
     async def add(self, child: type["Model"] | dict[str, Any]) -> Any:
@@ -276,8 +400,79 @@ class Relation(ManyRelationProtocol):
         return self._bind_embedded_through(child, relation_instance)
 
     async def remove_many(self, *children: type["Model"]) -> None:
+        """Detach several children with a single `DELETE ... IN (...)` statement.
+
+        Args:
+            *children: Related children to remove.
+
+        Raises:
+            RelationshipNotFound: If some of the children were not related.
+            RelationshipIncompatible: If a child is not an instance of the
+                relation target model.
+        """
+        target = self.resolved_to
         for child in children:
-            await self.remove(child)
+            if not isinstance(child, target):
+                raise RelationshipIncompatible(
+                    f"The child is not from the type '{target.__name__}'."
+                )
+        if not children:
+            return
+
+        columns = self._relation_columns()
+        owner_key = self._build_relation_params(None)[self.owner_name]
+        keys = {self._build_relation_params(child)[self.to_name] for child in children}
+        if (
+            columns is None
+            or not self._is_relation_key(owner_key)
+            or not all(self._is_relation_key(key) for key in keys)
+        ):
+            for child in children:
+                await self.remove(child)
+            return
+
+        owner_column, to_column = columns
+        row_count = await self.resolved_through.query.filter(
+            sqlalchemy.and_(owner_column == owner_key, to_column.in_(keys))
+        ).delete()
+        if row_count < len(keys):
+            raise RelationshipNotFound(
+                detail=(
+                    f"There is no relationship between '{self.owner_name}' and "
+                    f"'{self.to_name}' for {len(keys) - row_count} of the given children."
+                )
+            )
+
+    async def set(self, children: Sequence[type["Model"] | dict[str, Any]]) -> None:
+        """Make `children` the exact set of related objects.
+
+        Through rows for children that are no longer wanted are removed with
+        one `DELETE ... NOT IN (...)`, letting the database compute the
+        difference, and the missing ones are attached with `add_many()`.
+
+        Args:
+            children: Related model instances or dictionaries used to create
+                them.
+        """
+        resolved = await self._resolve_children(children)
+        columns = self._relation_columns()
+        owner_key = self._build_relation_params(None)[self.owner_name]
+        keys = {self._build_relation_params(child)[self.to_name] for child in resolved}
+        through = self.resolved_through
+
+        if (
+            columns is None
+            or not self._is_relation_key(owner_key)
+            or not all(self._is_relation_key(key) for key in keys)
+        ):
+            await through.query.filter(**{self.owner_name: self.instance}).delete()
+        else:
+            owner_column, to_column = columns
+            clause = owner_column == owner_key
+            if keys:
+                clause = sqlalchemy.and_(clause, to_column.not_in(keys))
+            await through.query.filter(clause).delete()
+        await self.add_many(*resolved)
 
     async def remove(self, child: type["Model"] | None = None) -> None:
         """Remove one child from the relation, resolving unique reverse links automatically.
@@ -311,6 +311,7 @@ class FieldFile(File):
         self.field = field
         self.metadata = dict(metadata or {})
         self.approved = approved
+        self._prepared = False
         self._committed = bool(name) if committed is None else committed
         if isinstance(file, File) and not name:
             name = file.name
@@ -362,6 +363,31 @@ class FieldFile(File):
         if delete_old and old_name and old_name != self.name:
             self.storage.delete(old_name)
 
+    async def asave(
+        self,
+        content: File | BinaryIO | bytes,
+        *,
+        name: str | None = None,
+        delete_old: bool = True,
+        instance: Any | None = None,
+    ) -> None:
+        """Async variant of `save()`.
+
+        Content is written through `Storage.asave()` and metadata is extracted
+        in a storage worker thread, so large uploads and image decoding do not
+        block the event loop.
+        """
+        old_name = self.name
+        if not isinstance(content, File):
+            content = File(content, name=name or getattr(content, "name", "") or old_name)
+        target_name = self.field.generate_name(instance, content, name or content.name or old_name)
+        self.name = await self.storage.asave(content, target_name)
+        self._committed = True
+        self.__dict__.pop("size", None)
+        self.metadata = await self.field.aextract_metadata(self)
+        if delete_old and old_name and old_name != self.name:
+            await self.storage.adelete(old_name)
+
     def delete(self) -> None:
         """
         Remove the stored object and reset the wrapper to an empty value.
@@ -378,6 +404,15 @@ class FieldFile(File):
         self.metadata = {}
         self.__dict__.pop("size", None)
 
+    async def adelete(self) -> None:
+        """Async variant of `delete()`."""
+        if self.name:
+            await self.storage.adelete(self.name)
+        self.name = ""
+        self._committed = True
+        self.metadata = {}
+        self.__dict__.pop("size", None)
+
     def set_approved(self, approved: bool) -> None:
         """Update the approval flag and refresh approval-gated metadata.
 
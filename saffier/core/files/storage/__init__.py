@@ -1,5 +1,5 @@
-from .base import Storage
+from .base import Storage, run_in_storage_thread
 from .filesystem import FileSystemStorage
 from .handler import StorageHandler, storages
 
-__all__ = ["FileSystemStorage", "Storage", "StorageHandler", "storages"]
+__all__ = ["FileSystemStorage", "Storage", "StorageHandler", "run_in_storage_thread", "storages"]
@@ -1,17 +1,51 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import pathlib
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any, TypeVar
 
+import anyio
+import anyio.to_thread
+
+from saffier.conf import settings
 from saffier.core.files.base import ContentFile, File
 from saffier.exceptions import SuspiciousFileOperation
 from saffier.utils.path import get_random_string, get_valid_filename, validate_file_name
 
 _ArgValue = TypeVar("_ArgValue")
 _ArgSetting = TypeVar("_ArgSetting")
+_Result = TypeVar("_Result")
+
+_limiters: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, anyio.CapacityLimiter] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def storage_thread_limiter() -> anyio.CapacityLimiter:
+    """
+    Return the limiter that bounds storage worker threads on the running loop.
+
+    Limiters are bound to their event loop, so one is kept per loop. The size
+    follows the `storage_thread_limit` setting, including later changes.
+    """
+    loop = asyncio.get_running_loop()
+    total_tokens = max(settings.storage_thread_limit or 1, 1)
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = _limiters[loop] = anyio.CapacityLimiter(total_tokens)
+    elif limiter.total_tokens != total_tokens:
+        limiter.total_tokens = total_tokens
+    return limiter
+
+
+async def run_in_storage_thread(func: Callable[..., _Result], *args: Any) -> _Result:
+    """Run blocking storage work in a worker thread without holding the loop."""
+    return await anyio.to_thread.run_sync(func, *args, limiter=storage_thread_limiter())
 
 
 class Storage(ABC):
@@ -34,6 +68,12 @@ class Storage(ABC):
     def _save(self, content: File, name: str = "") -> str: ...
 
     def save(self, content: Any, name: str = "") -> str:
+        content, name = self._prepare_save(content, name)
+        final_name = self._save(content, name)
+        content.name = final_name
+        return final_name
+
+    def _prepare_save(self, content: Any, name: str) -> tuple[File, str]:
         if not name:
             name = getattr(content, "name", "")
         name = self.sanitize_name(name)
@@ -44,8 +84,23 @@ class Storage(ABC):
             content = ContentFile(content, name)
         elif not hasattr(content, "chunks"):
             content = File(content, name)
+        return content, name
 
-        final_name = self._save(content, name)
+    async def aopen(self, name: str, mode: str | None = None) -> Any:
+        return await run_in_storage_thread(self.open, name, mode)
+
+    async def _asave(self, content: File, name: str = "") -> str:
+        return await run_in_storage_thread(self._save, content, name)
+
+    async def asave(self, content: Any, name: str = "") -> str:
+        """
+        Save content like `save()` without blocking the event loop.
+
+        Backends get a thread-offloaded implementation for free and can
+        override `_asave()` with a native one.
+        """
+        content, name = self._prepare_save(content, name)
+        final_name = await self._asave(content, name)
         content.name = final_name
         return final_name
 
@@ -132,6 +187,15 @@ class Storage(ABC):
     @abstractmethod
     def size(self, name: str) -> int: ...
 
+    async def adelete(self, name: str) -> None:
+        await run_in_storage_thread(self.delete, name)
+
+    async def aexists(self, name: str) -> bool:
+        return await run_in_storage_thread(self.exists, name)
+
+    async def asize(self, name: str) -> int:
+        return await run_in_storage_thread(self.size, name)
+
     def url(self, name: str) -> str:
         raise NotImplementedError("This backend doesn't support 'url'.")
 
@@ -2,19 +2,22 @@ from __future__ import annotations
 
 import contextlib
 import os
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from functools import cached_property
 from threading import Lock
 from typing import Any, BinaryIO, cast
 from urllib.parse import urljoin
 
+import anyio
+
 from saffier.conf import settings
 from saffier.core.files.base import File
 from saffier.core.files.move import file_move_safe
 from saffier.utils.path import filepath_to_uri, safe_join
 
 from .. import locks
-from .base import Storage
+from .base import Storage, run_in_storage_thread
 
 
 class FileSystemStorage(Storage):
@@ -106,20 +109,74 @@ class FileSystemStorage(Storage):
                 if hasattr(content, "temporary_file_path"):
                     file_move_safe(content.temporary_file_path(), full_path)
                 else:
-                    descriptor = os.open(full_path, self.OS_OPEN_FLAGS, 0o666)
+                    with self._open_for_write(full_path) as file_object:
+                        for chunk in content.chunks():
+                            file_object.write(chunk)
+            except FileExistsError:
+                if reserved_name is not None:
+                    self.unreserve_name(reserved_name)
+                name = self.get_available_name(name)
+                reserved_name = name
+                full_path = self.path(name)
+            else:
+                if reserved_name is not None:
+                    self.unreserve_name(reserved_name)
+                break
+        return full_path
+
+    def _open_for_write(self, full_path: str) -> BinaryIO:
+        descriptor = os.open(full_path, self.OS_OPEN_FLAGS, 0o666)
+        try:
+            locks.lock(descriptor, locks.LOCK_EX)
+            return cast(BinaryIO, os.fdopen(descriptor, "wb"))
+        except BaseException:
+            os.close(descriptor)
+            raise
+
+    @staticmethod
+    def _write_next_chunk(chunks: Iterator[bytes], file_object: BinaryIO) -> bool:
+        chunk = next(chunks, None)
+        if chunk is None:
+            return False
+        file_object.write(chunk)
+        return True
+
+    async def _asave(self, content: File, name: str = "") -> str:
+        full_path = self._get_full_path(name)
+        await run_in_storage_thread(self._create_directory, full_path)
+        final_full_path = await self._asave_content(full_path, name, content)
+        await run_in_storage_thread(self._set_permissions, final_full_path)
+        return await run_in_storage_thread(self._get_relative_path, final_full_path)
+
+    async def _asave_content(self, full_path: str, name: str, content: Any) -> str:
+        """
+        Stream `content` to disk one chunk per worker-thread call.
+
+        The event loop is released between chunks, so large uploads do not
+        stall other coroutines and a slow disk only occupies one thread.
+        """
+        reserved_name: str | None = None
+        while True:
+            try:
+                if hasattr(content, "temporary_file_path"):
+                    await run_in_storage_thread(
+                        file_move_safe, content.temporary_file_path(), full_path
+                    )
+                else:
+                    file_object = await run_in_storage_thread(self._open_for_write, full_path)
                     try:
-                        locks.lock(descriptor, locks.LOCK_EX)
-                        with os.fdopen(descriptor, "wb") as file_object:
-                            descriptor = -1
-                            for chunk in content.chunks():
-                                file_object.write(chunk)
+                        chunks = iter(content.chunks())
+                        while await run_in_storage_thread(
+                            self._write_next_chunk, chunks, file_object
+                        ):
+                            pass
                     finally:
-                        if descriptor != -1:
-                            os.close(descriptor)
+                        with anyio.CancelScope(shield=True):
+                            await run_in_storage_thread(file_object.close)
             except FileExistsError:
                 if reserved_name is not None:
                     self.unreserve_name(reserved_name)
-                name = self.get_available_name(name)
+                name = await run_in_storage_thread(self.get_available_name, name)
                 reserved_name = name
                 full_path = self.path(name)
             else:
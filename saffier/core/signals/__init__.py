@@ -3,10 +3,12 @@ from .signal import Broadcaster, Signal
 
 post_migrate = Signal()
 pre_migrate = Signal()
+migrate_progress = Signal()
 
 __all__ = [
     "Broadcaster",
     "Signal",
+    "migrate_progress",
     "post_delete",
     "post_migrate",
     "post_save",
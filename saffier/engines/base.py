@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import datetime
+import decimal
+import enum
+import uuid
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from typing import TYPE_CHECKING, Any, TypeAlias, cast
 
 import orjson
@@ -16,6 +20,22 @@ if TYPE_CHECKING:
 
 EngineIncludeExclude: TypeAlias = set[int] | set[str] | dict[int, Any] | dict[str, Any] | None
 
+# Values `model_dump()` returns unchanged, which can be projected straight from `__dict__`.
+_SCALAR_TYPES: tuple[type, ...] = (
+    str,
+    int,
+    float,
+    bool,
+    type(None),
+    bytes,
+    decimal.Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    uuid.UUID,
+    enum.Enum,
+)
+
 
 class ModelEngine(ABC):
     """Base class for optional model-engine adapters layered on top of Saffier.
@@ -79,6 +99,103 @@ class ModelEngine(ABC):
             payload[field_name] = value
         return payload
 
+    def _projection_plan(
+        self,
+        model_class: type[Model],
+        *,
+        include: EngineIncludeExclude = None,
+        exclude: EngineIncludeExclude = None,
+    ) -> list[tuple[str, str]]:
+        """Return the `(name, kind)` pairs `build_projection_payload()` would emit."""
+        plan: list[tuple[str, str]] = []
+        for field_name, field in model_class.fields.items():
+            if field.__class__.__name__ == "ManyToManyField" or getattr(field, "exclude", False):
+                continue
+            if not self._is_included(field_name, include) or self._is_excluded(
+                field_name, exclude
+            ):
+                continue
+            plan.append(
+                (field_name, "computed" if getattr(field, "is_computed", False) else "field")
+            )
+        for field_name in model_class.get_plain_model_fields():
+            if self._is_included(field_name, include) and not self._is_excluded(
+                field_name, exclude
+            ):
+                plan.append((field_name, "plain"))
+        return plan
+
+    @staticmethod
+    def _scalar_projection_payload(
+        instance: Model,
+        plan: list[tuple[str, str]],
+        *,
+        exclude_none: bool = False,
+    ) -> dict[str, Any] | None:
+        """Read a projection payload from `__dict__`, or `None` if a value needs `model_dump()`."""
+        values = instance.__dict__
+        payload: dict[str, Any] = {}
+        for field_name, kind in plan:
+            if field_name in values:
+                value = values[field_name]
+            elif kind == "computed":
+                try:
+                    value = getattr(instance, field_name)
+                except AttributeError:
+                    continue
+            else:
+                continue
+            if kind != "plain" and not isinstance(value, _SCALAR_TYPES):
+                return None
+            if exclude_none and value is None:
+                continue
+            payload[field_name] = value
+        return payload
+
+    def build_projection_payloads(
+        self,
+        instances: Iterable[Model],
+        *,
+        include: EngineIncludeExclude = None,
+        exclude: EngineIncludeExclude = None,
+        exclude_none: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Build the projection payloads of many instances.
+
+        Scalar field values are read straight from the instance `__dict__`.
+        Instances holding related models, files or containers, and models
+        overriding `model_dump()`, fall back to `build_projection_payload()`,
+        so both produce the same payloads.
+        """
+        from saffier.core.db.models.model import Model
+
+        plans: dict[type[Model], list[tuple[str, str]] | None] = {}
+        payloads: list[dict[str, Any]] = []
+        for instance in instances:
+            model_class = type(instance)
+            if model_class in plans:
+                plan = plans[model_class]
+            else:
+                plan = plans[model_class] = (
+                    self._projection_plan(model_class, include=include, exclude=exclude)
+                    if model_class.model_dump is Model.model_dump
+                    else None
+                )
+            payload = (
+                None
+                if plan is None
+                else self._scalar_projection_payload(instance, plan, exclude_none=exclude_none)
+            )
+            if payload is None:
+                payload = self.build_projection_payload(
+                    instance,
+                    include=include,
+                    exclude=exclude,
+                    exclude_none=exclude_none,
+                )
+            payloads.append(payload)
+        return payloads
+
     def project_model(
         self,
         instance: Model,
@@ -181,6 +298,48 @@ class ModelEngine(ABC):
             option=orjson.OPT_NON_STR_KEYS,
         ).decode("utf-8")
 
+    def dump_many(
+        self,
+        instances: Iterable[Model],
+        *,
+        include: EngineIncludeExclude = None,
+        exclude: EngineIncludeExclude = None,
+        exclude_none: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Serialize many instances like `dump_model()`.
+
+        Adapters override this to validate and dump the whole batch at once.
+        """
+        return [
+            self.dump_model(
+                instance,
+                include=include,
+                exclude=exclude,
+                exclude_none=exclude_none,
+            )
+            for instance in instances
+        ]
+
+    def dump_many_json(
+        self,
+        instances: Iterable[Model],
+        *,
+        include: EngineIncludeExclude = None,
+        exclude: EngineIncludeExclude = None,
+        exclude_none: bool = False,
+    ) -> str:
+        """Serialize many instances into a JSON array of `dump_model_json()` objects."""
+        items = (
+            self.dump_model_json(
+                instance,
+                include=include,
+                exclude=exclude,
+                exclude_none=exclude_none,
+            )
+            for instance in instances
+        )
+        return f"[{','.join(items)}]"
+
     @abstractmethod
     def get_model_class(self, model_class: type[Model], *, mode: str = "projection") -> type[Any]:
         """Return the engine-backed representation class for one Saffier model."""
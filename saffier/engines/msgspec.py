@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import TYPE_CHECKING, Any, cast
 
 from saffier.engines.base import EngineIncludeExclude, ModelEngine
@@ -40,6 +40,7 @@ class MsgspecModelEngine(ModelEngine):
         self.strict = strict
         self.struct_config = dict(struct_config or {})
         self._model_cache: dict[tuple[type[Model], str, int], type[Any]] = {}
+        self._json_encoder: Any = None
 
     def _import_msgspec(self) -> Any:
         """Import and return the msgspec module lazily."""
@@ -108,8 +109,9 @@ class MsgspecModelEngine(ModelEngine):
         self,
         struct_value: Any,
         *,
-        only_fields: set[str] | None = None,
+        only_fields: Iterable[str] | None = None,
         exclude_none: bool = False,
+        builtin_payload: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Convert one msgspec struct into a dictionary payload.
 
@@ -118,12 +120,15 @@ class MsgspecModelEngine(ModelEngine):
             only_fields: Optional explicit field subset to preserve even when a
                 field equals its declared default.
             exclude_none: Whether `None` values should be omitted.
+            builtin_payload: `msgspec.to_builtins()` output of `struct_value`
+                when it was already converted as part of a batch.
 
         Returns:
             dict[str, Any]: Converted dictionary payload.
         """
-        msgspec = self._import_msgspec()
-        builtin_payload = cast("dict[str, Any]", msgspec.to_builtins(struct_value))
+        if builtin_payload is None:
+            msgspec = self._import_msgspec()
+            builtin_payload = cast("dict[str, Any]", msgspec.to_builtins(struct_value))
 
         if only_fields is None:
             field_names = tuple(getattr(type(struct_value), "__struct_fields__", ()))
@@ -262,6 +267,69 @@ class MsgspecModelEngine(ModelEngine):
             ),
         ).decode("utf-8")
 
+    def dump_many(
+        self,
+        instances: Iterable[Model],
+        *,
+        include: EngineIncludeExclude = None,
+        exclude: EngineIncludeExclude = None,
+        exclude_none: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Convert and dump a batch of one model with single msgspec calls."""
+        instances = list(instances)
+        if len({type(instance) for instance in instances}) != 1:
+            return super().dump_many(
+                instances, include=include, exclude=exclude, exclude_none=exclude_none
+            )
+        msgspec = self._import_msgspec()
+        engine_model = self.get_model_class(type(instances[0]))
+        payloads = self.build_projection_payloads(
+            instances,
+            include=include,
+            exclude=exclude,
+            exclude_none=exclude_none,
+        )
+        projected = msgspec.convert(
+            payloads,
+            type=list[engine_model],
+            strict=False,
+            from_attributes=True,
+            str_keys=True,
+        )
+        builtins = msgspec.to_builtins(projected)
+        return [
+            self._struct_to_data(
+                value,
+                only_fields=payload,
+                exclude_none=exclude_none,
+                builtin_payload=builtin_payload,
+            )
+            for value, payload, builtin_payload in zip(projected, payloads, builtins, strict=True)
+        ]
+
+    def dump_many_json(
+        self,
+        instances: Iterable[Model],
+        *,
+        include: EngineIncludeExclude = None,
+        exclude: EngineIncludeExclude = None,
+        exclude_none: bool = False,
+    ) -> str:
+        """Encode `dump_many()` with a cached msgspec JSON encoder."""
+        if self._json_encoder is None:
+            self._json_encoder = self._import_msgspec().json.Encoder()
+        return cast(
+            "bytes",
+            self._json_encoder.encode(
+                self.dump_many(
+                    instances,
+                    include=include,
+                    exclude=exclude,
+                    exclude_none=exclude_none,
+                )
+            ),
+        ).decode("utf-8")
+
     def json_schema(
         self,
         model_class: type[Model],
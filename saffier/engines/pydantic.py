@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import typing
+from collections.abc import Iterable
 from typing import Any, cast
 
-from saffier.engines.base import ModelEngine
+from saffier.engines.base import EngineIncludeExclude, ModelEngine
 from saffier.engines.utils import optional_annotation, resolve_annotation, saffier_field_annotation
 from saffier.exceptions import ImproperlyConfigured
 
@@ -22,6 +23,7 @@ class PydanticModelEngine(ModelEngine):
         """Initialize the adapter with optional `ConfigDict` overrides."""
         self.config = dict(config or {})
         self._model_cache: dict[tuple[type[Model], str, int], type[Any]] = {}
+        self._list_adapters: dict[type[Any], Any] = {}
 
     def _import_pydantic(self) -> tuple[Any, Any, Any, Any]:
         """Import and return the required Pydantic symbols lazily."""
@@ -142,6 +144,78 @@ class PydanticModelEngine(ModelEngine):
             value = self.build_projection_payload(cast("Model", value))
         return engine_model.model_validate(value)
 
+    def _list_adapter(self, engine_model: type[Any]) -> Any:
+        """Return the cached `TypeAdapter(list[engine_model])`."""
+        adapter = self._list_adapters.get(engine_model)
+        if adapter is None:
+            from pydantic import TypeAdapter
+
+            adapter = self._list_adapters[engine_model] = TypeAdapter(list[engine_model])
+        return adapter
+
+    def _project_many(
+        self,
+        instances: list[Model],
+        *,
+        include: EngineIncludeExclude,
+        exclude: EngineIncludeExclude,
+        exclude_none: bool,
+    ) -> tuple[Any, list[Any], dict[str, Any]]:
+        """Validate the projections of `instances` in one adapter call."""
+        adapter = self._list_adapter(self.get_model_class(type(instances[0])))
+        projected = adapter.validate_python(
+            self.build_projection_payloads(
+                instances,
+                include=include,
+                exclude=exclude,
+                exclude_none=exclude_none,
+            )
+        )
+        kwargs: dict[str, Any] = {"exclude_unset": True, "exclude_none": exclude_none}
+        if include is not None:
+            kwargs["include"] = {"__all__": include}
+        if exclude is not None:
+            kwargs["exclude"] = {"__all__": exclude}
+        return adapter, projected, kwargs
+
+    def dump_many(
+        self,
+        instances: Iterable[Model],
+        *,
+        include: EngineIncludeExclude = None,
+        exclude: EngineIncludeExclude = None,
+        exclude_none: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Validate and dump a batch of one model through a cached list adapter."""
+        instances = list(instances)
+        if len({type(instance) for instance in instances}) != 1:
+            return super().dump_many(
+                instances, include=include, exclude=exclude, exclude_none=exclude_none
+            )
+        adapter, projected, kwargs = self._project_many(
+            instances, include=include, exclude=exclude, exclude_none=exclude_none
+        )
+        return cast("list[dict[str, Any]]", adapter.dump_python(projected, **kwargs))
+
+    def dump_many_json(
+        self,
+        instances: Iterable[Model],
+        *,
+        include: EngineIncludeExclude = None,
+        exclude: EngineIncludeExclude = None,
+        exclude_none: bool = False,
+    ) -> str:
+        """Validate and encode a batch of one model through a cached list adapter."""
+        instances = list(instances)
+        if len({type(instance) for instance in instances}) != 1:
+            return super().dump_many_json(
+                instances, include=include, exclude=exclude, exclude_none=exclude_none
+            )
+        adapter, projected, kwargs = self._project_many(
+            instances, include=include, exclude=exclude, exclude_none=exclude_none
+        )
+        return cast("bytes", adapter.dump_json(projected, **kwargs)).decode("utf-8")
+
     def to_saffier_data(
         self,
         model_class: type[Model],
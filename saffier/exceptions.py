@@ -73,6 +73,10 @@ class QuerySetError(SaffierException):
     """Raised when queryset construction or execution cannot proceed."""
 
 
+class QueryTimeoutError(SaffierException, TimeoutError):
+    """Raised when a statement outlives its timeout or the active query deadline."""
+
+
 class ModelReferenceError(SaffierException):
     """Raised when `RefForeignKey` references cannot be matched or persisted."""
 
@@ -9,6 +9,8 @@ except ImportError:  # pragma: nocover
 
 
 if TYPE_CHECKING:  # pragma: nocover
+    from collections.abc import Sequence
+
     from saffier import Model
 
 
@@ -37,3 +39,5 @@ class ManyRelationProtocol(Protocol):
     async def add_many(self, *children: Model) -> list[Model | None]: ...
 
     async def remove_many(self, *children: Model) -> None: ...
+
+    async def set(self, children: Sequence[Model]) -> None: ...
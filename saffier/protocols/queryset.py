@@ -44,6 +44,8 @@ class QuerySetProtocol(Protocol):
 
     def batch_size(self, batch_size: int | None = None) -> "QuerySet": ...
 
+    def timeout(self, seconds: float | None) -> "QuerySet": ...
+
     def extra_select(self, *extra: Any) -> "QuerySet": ...
 
     def reference_select(self, references: dict[str, Any]) -> "QuerySet": ...
@@ -58,6 +60,7 @@ class QuerySetProtocol(Protocol):
         *,
         next_item_attr: str = ...,
         previous_item_attr: str = ...,
+        approximate_count: bool = ...,
     ) -> Any: ...
 
     def cursor_paginator(
@@ -66,6 +69,8 @@ class QuerySetProtocol(Protocol):
         *,
         next_item_attr: str = ...,
         previous_item_attr: str = ...,
+        approximate_count: bool = ...,
+        cursor_secret: str | bytes | None = ...,
     ) -> Any: ...
 
     def limit(self, limit_count: int) -> "QuerySet": ...
@@ -82,6 +87,8 @@ class QuerySetProtocol(Protocol):
 
     async def count(self) -> int: ...
 
+    async def load_related(self, *fields: str) -> list[SaffierModel]: ...
+
     async def get_or_none(self, **kwargs: Any) -> SaffierModel | None: ...
 
     async def all(self, **kwargs: Any) -> Sequence[SaffierModel | None]: ...
@@ -94,9 +101,21 @@ class QuerySetProtocol(Protocol):
 
     async def create(self, *model_refs: Any, **kwargs: Any) -> SaffierModel: ...
 
-    async def bulk_create(self, objs: Sequence[list[dict[Any, Any]]]) -> None: ...
+    async def bulk_create(
+        self,
+        objs: Sequence[list[dict[Any, Any]]],
+        batch_size: int | None = None,
+        return_instances: bool = False,
+        send_signals: bool = False,
+    ) -> list[SaffierModel] | None: ...
 
-    async def bulk_update(self, objs: Sequence[list[SaffierModel]], fields: list[str]) -> None: ...
+    async def bulk_update(
+        self,
+        objs: Sequence[list[SaffierModel]],
+        fields: list[str],
+        batch_size: int | None = None,
+        strategy: str | None = None,
+    ) -> None: ...
 
     async def raw_delete(
         self,
@@ -106,7 +125,7 @@ class QuerySetProtocol(Protocol):
 
     async def delete(self, use_models: bool = False) -> int: ...
 
-    async def update(self, **kwargs: Any) -> None: ...
+    async def update(self, **kwargs: Any) -> int: ...
 
     async def values(
         self,
@@ -138,6 +157,13 @@ class QuerySetProtocol(Protocol):
         unique_fields: list[str] | None = None,
     ) -> list[SaffierModel]: ...
 
+    async def bulk_upsert(
+        self,
+        objs: Sequence[dict[str, Any] | SaffierModel],
+        conflict_fields: Sequence[str] | None = None,
+        update_fields: Sequence[str] | None = None,
+    ) -> list[SaffierModel]: ...
+
     async def update_or_create(
         self, *model_refs: Any, defaults: Any = None, **kwargs: Any
     ) -> tuple[SaffierModel, bool]: ...
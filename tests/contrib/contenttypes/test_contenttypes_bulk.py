@@ -0,0 +1,132 @@
+import copy
+
+import pytest
+
+import saffier
+from saffier.contrib.contenttypes import ContentTypeField
+from saffier.core.db.querysets import QuerySet
+from saffier.testclient import DatabaseTestClient
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = DatabaseTestClient(DATABASE_URL, force_rollback=False, full_isolation=False)
+models = saffier.Registry(database=database, with_content_type=True)
+
+
+class Company(saffier.Model):
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Event(saffier.Model):
+    name = saffier.CharField(max_length=100)
+    kind = ContentTypeField(shared=True)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    async with database:
+        await models.create_all()
+        yield
+        models.content_type_cache.clear()
+        if not database.drop:
+            await models.drop_all()
+
+
+@pytest.fixture()
+def bulk_inserts(monkeypatch):
+    calls = []
+    bulk_create = QuerySet.bulk_create
+
+    async def spy(self, objs, *args, **kwargs):
+        calls.append((self.model_class.__name__, len(objs)))
+        return await bulk_create(self, objs, *args, **kwargs)
+
+    monkeypatch.setattr(QuerySet, "bulk_create", spy)
+    return calls
+
+
+async def test_bulk_create_inserts_content_types_in_one_batch(bulk_inserts):
+    payloads = [{"name": "a"}, {"name": "b"}]
+    companies = await Company.query.bulk_create(
+        [*payloads, Company(name="c")], return_instances=True
+    )
+
+    assert bulk_inserts == [("Company", 3), ("ContentType", 3)]
+    assert payloads == [{"name": "a"}, {"name": "b"}]
+    assert len({company.content_type.id for company in companies}) == 3
+    assert all(company.content_type.name == "Company" for company in companies)
+    assert await companies[0].content_type.get_instance() == companies[0]
+
+    company = await Company.query.create(name="d")
+    assert company.content_type.id not in {c.content_type.id for c in companies}
+    assert await models.content_type.query.count() == 4
+
+
+async def test_bulk_get_or_create_sets_content_types():
+    existing = await Company.query.create(name="a")
+
+    companies = await Company.query.bulk_get_or_create(
+        [{"name": "a"}, {"name": "b"}, {"name": "c"}], unique_fields=["name"]
+    )
+
+    assert companies[0].pk == existing.pk
+    assert companies[0].content_type.id == existing.content_type.id
+    assert all(company.content_type.name == "Company" for company in companies)
+    assert len({company.content_type.id for company in companies}) == 3
+    assert await Company.query.count() == 3
+    assert await models.content_type.query.count() == 3
+
+
+async def test_shared_content_types_are_created_once():
+    events = await Event.query.bulk_create([{"name": "a"}, {"name": "b"}], return_instances=True)
+    event = await Event.query.create(name="c", kind={})
+
+    assert {item.kind.id for item in (*events, event)} == {event.kind.id}
+    assert event.kind.collision_key == "Event"
+    assert list(models.content_type_cache) == [(str(database.url), "Event", None)]
+
+    models.content_type_cache.clear()
+    other = await Event.query.create(name="d", kind={})
+    assert other.kind.id == event.kind.id
+
+    await other.delete()
+    assert await models.content_type.query.filter(name="Event").count() == 1
+    assert await Event.query.count() == 3
+
+
+async def test_shared_content_types_are_not_cached_inside_transactions():
+    with pytest.raises(RuntimeError):
+        async with database.transaction():
+            event = await Event.query.create(name="a", kind={})
+            assert event.kind.id is not None
+            raise RuntimeError()
+
+    assert models.content_type_cache == {}
+    assert await models.content_type.query.count() == 0
+
+    event = await Event.query.create(name="b", kind={})
+    assert await models.content_type.query.filter(id=event.kind.id).exists()
+    assert list(models.content_type_cache) == [(str(database.url), "Event", None)]
+
+
+async def test_registry_can_share_content_types_per_model():
+    shared = saffier.Registry(database=database, with_content_type=True, shared_content_types=True)
+
+    class Tag(saffier.Model):
+        name = saffier.CharField(max_length=100)
+
+        class Meta:
+            registry = shared
+
+    field = Tag.meta.fields["content_type"]
+    assert field.shared
+    assert not field.unique
+    assert not field.remove_referenced
+    assert copy.copy(shared).shared_content_types
@@ -0,0 +1,142 @@
+import datetime
+
+import pytest
+
+import saffier
+from saffier.contrib.pagination import CursorPaginator
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = Database(DATABASE_URL)
+models = saffier.Registry(database=database)
+
+
+class Entry(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    score = saffier.IntegerField()
+    published = saffier.DateTimeField()
+
+    class Meta:
+        registry = models
+        table_prefix = "keyset"
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def queries(monkeypatch):
+    calls = []
+    original = type(database).fetch_all
+
+    def spy(self, *args, **kwargs):
+        calls.append("fetch_all")
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(database), "fetch_all", spy)
+    return calls
+
+
+async def create_entries(count: int = 20) -> list[Entry]:
+    start = datetime.datetime(2024, 1, 1)
+    return await Entry.query.bulk_create(
+        [
+            {"score": index % 4, "published": start + datetime.timedelta(hours=index)}
+            for index in range(count)
+        ],
+        return_instances=True,
+    )
+
+
+def expected_ids(entries: list[Entry], *order: str) -> list[int]:
+    rows = list(entries)
+    for criteria in reversed(order):
+        name = criteria.lstrip("-")
+        rows.sort(key=lambda entry: getattr(entry, name), reverse=criteria.startswith("-"))
+    return [entry.id for entry in rows]
+
+
+@pytest.mark.parametrize("order", [("score", "id"), ("-score", "-id"), ("-score", "id")])
+async def test_composite_order_walks_every_row_once(queries, order):
+    entries = await create_entries()
+    paginator = CursorPaginator(Entry.query.order_by(*order), page_size=6)
+
+    queries.clear()
+    ids: list[int] = []
+    page = await paginator.get_page()
+    while True:
+        ids.extend(entry.id for entry in page.content)
+        if page.is_last:
+            break
+        page = await paginator.get_page(page.next_cursor)
+
+    assert ids == expected_ids(entries, *order)
+    assert len(queries) == 4
+
+
+async def test_backward_page_uses_one_query(queries):
+    await create_entries()
+    paginator = CursorPaginator(Entry.query.order_by("score", "id"), page_size=5)
+    first = await paginator.get_page()
+    second = await paginator.get_page(first.next_cursor)
+
+    queries.clear()
+    back = await paginator.get_page(second.next_cursor, backward=True)
+
+    assert queries == ["fetch_all"]
+    assert [entry.id for entry in back.content] == [entry.id for entry in second.content]
+    assert back.is_first is False
+    assert back.is_last is False
+
+
+async def test_signed_cursors_round_trip():
+    entries = await create_entries()
+    paginator = CursorPaginator(
+        Entry.query.order_by("published", "id"), page_size=7, cursor_secret="s3cret"
+    )
+
+    first = await paginator.get_page()
+    assert isinstance(first.next_cursor, str)
+
+    second = await paginator.get_page(first.next_cursor)
+    assert second.current_cursor == first.next_cursor
+    assert [entry.id for entry in second.content] == [entry.id for entry in entries[7:14]]
+
+    other = CursorPaginator(
+        Entry.query.order_by("published", "id"), page_size=7, cursor_secret="other"
+    )
+    with pytest.raises(ValueError):
+        await other.get_page(first.next_cursor)
+
+    payload, signature = first.next_cursor.split(".")
+    with pytest.raises(ValueError):
+        await paginator.get_page(f"{payload}x.{signature}")
+
+
+async def test_page_caches_are_bounded(queries):
+    await create_entries()
+    paginator = CursorPaginator(Entry.query.order_by("id"), page_size=2, cache_size=2)
+
+    cursors = [None]
+    for _ in range(4):
+        cursors.append((await paginator.get_page(cursors[-1])).next_cursor)
+
+    assert len(paginator._page_cache) == 2
+    queries.clear()
+    await paginator.get_page(cursors[3])
+    assert queries == []
+    await paginator.get_page(cursors[0])
+    assert queries == ["fetch_all"]
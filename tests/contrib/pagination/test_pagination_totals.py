@@ -0,0 +1,127 @@
+import pytest
+
+import saffier
+from saffier.contrib.pagination import Paginator
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = Database(DATABASE_URL)
+models = saffier.Registry(database=database)
+
+
+class Ticket(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    title = saffier.CharField(max_length=100)
+    priority = saffier.IntegerField(default=0)
+
+    class Meta:
+        registry = models
+        table_prefix = "totals"
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def queries(monkeypatch):
+    calls = []
+    for name in ("fetch_all", "fetch_val"):
+        original = getattr(type(database), name)
+
+        def spy(self, *args, __name=name, __original=original, **kwargs):
+            calls.append(__name)
+            return __original(self, *args, **kwargs)
+
+        monkeypatch.setattr(type(database), name, spy)
+    return calls
+
+
+async def create_tickets(count: int = 23) -> None:
+    await Ticket.query.bulk_create(
+        [{"title": f"ticket-{index}", "priority": index % 3} for index in range(count)]
+    )
+
+
+async def test_page_and_total_come_from_one_query(queries):
+    await create_tickets()
+    paginator = Paginator(Ticket.query.filter(priority__gte=1).order_by("id"), page_size=5)
+
+    queries.clear()
+    page = await paginator.get_page(2)
+
+    assert queries == ["fetch_all"]
+    assert [ticket.title for ticket in page.content] == [
+        f"ticket-{index}" for index in (8, 10, 11, 13, 14)
+    ]
+    assert await paginator.get_total() == 15
+    assert await paginator.get_amount_pages() == 3
+    assert queries == ["fetch_all"]
+
+
+async def test_total_is_counted_when_the_page_is_empty(queries):
+    await create_tickets()
+    paginator = Paginator(Ticket.query.order_by("id"), page_size=10)
+
+    page = await paginator.get_page(5)
+
+    assert page.content == []
+    assert await paginator.get_total() == 23
+    assert await paginator.get_amount_pages() == 3
+    assert queries.count("fetch_val") == 1
+
+    empty = Paginator(Ticket.query.filter(priority=9).order_by("id"), page_size=10)
+    queries.clear()
+    await empty.get_page(1)
+
+    assert await empty.get_total() == 0
+    assert queries == ["fetch_all"]
+
+
+async def test_distinct_querysets_count_separately(queries):
+    await create_tickets()
+    paginator = Paginator(Ticket.query.distinct().order_by("id"), page_size=10)
+
+    queries.clear()
+    page = await paginator.get_page(3)
+
+    assert len(page.content) == 3
+    assert await paginator.get_total() == 23
+    assert await paginator.get_amount_pages() == 3
+    assert queries.count("fetch_val") == 1
+
+
+async def test_clear_caches_recounts():
+    await create_tickets(3)
+    paginator = Paginator(Ticket.query.order_by("id"), page_size=2)
+
+    assert await paginator.get_total() == 3
+
+    await Ticket.query.create(title="late")
+    assert await paginator.get_total() == 3
+
+    paginator.clear_caches()
+    paginator.queryset = Ticket.query.order_by("id")
+    await paginator.get_page(1)
+    assert await paginator.get_total() == 4
+
+
+async def test_approximate_count_falls_back_to_counting():
+    await create_tickets()
+    paginator = Ticket.query.order_by("id").paginator(page_size=10, approximate_count=True)
+
+    assert await paginator.get_estimated_total() is None
+    assert len((await paginator.get_page(1)).content) == 10
+    assert await paginator.get_total() == 23
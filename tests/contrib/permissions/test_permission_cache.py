@@ -0,0 +1,171 @@
+import types
+
+import pytest
+
+import saffier
+from saffier.contrib.permissions import BasePermission, PermissionCache, permission_cache
+from saffier.contrib.permissions import cache as cache_module
+from saffier.testclient import DatabaseTestClient
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = DatabaseTestClient(DATABASE_URL, use_existing=False)
+models = saffier.Registry(database=database)
+
+
+class User(saffier.Model):
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+        table_prefix = "permcache"
+
+
+class Document(saffier.Model):
+    title = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+        table_prefix = "permcache"
+
+
+class Group(saffier.Model):
+    name = saffier.CharField(max_length=100)
+    users = saffier.ManyToMany("User", through_tablename=saffier.NEW_M2M_NAMING)
+
+    class Meta:
+        registry = models
+        table_prefix = "permcache"
+
+
+class Permission(BasePermission):
+    users = saffier.ManyToMany("User", through_tablename=saffier.NEW_M2M_NAMING)
+    groups = saffier.ManyToMany("Group", through_tablename=saffier.NEW_M2M_NAMING)
+    obj = saffier.ForeignKey("Document", null=True)
+
+    class Meta:
+        registry = models
+        table_prefix = "permcache"
+
+
+@pytest.fixture(autouse=True, scope="module")
+async def create_test_database():
+    async with database:
+        await models.create_all()
+        yield
+        if not database.drop:
+            await models.drop_all()
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def rollback_transactions():
+    permission_cache.clear()
+    permission_cache.invalidate()
+    async with models:
+        yield
+
+
+@pytest.fixture()
+def fetches(monkeypatch):
+    calls = []
+    fetch_all = type(database).fetch_all
+
+    async def spy(self, *args, **kwargs):
+        calls.append(args[0])
+        return await fetch_all(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(database), "fetch_all", spy)
+    return calls
+
+
+async def test_has_perm_answers_from_the_cached_set(fetches):
+    user = await User.query.create(name="ann")
+    document, other = await Document.query.bulk_create(
+        [{"title": "a"}, {"title": "b"}], return_instances=True
+    )
+    group = await Group.query.create(name="editors", users=[user])
+    await Permission.query.create(users=[user], name="view")
+    await Permission.query.create(groups=[group], name="edit", obj=document)
+    fetches.clear()
+
+    assert await Permission.query.has_perm(user, "view")
+    assert await Permission.query.has_perm(user, "view", obj=other)
+    assert await Permission.query.has_perm(user, "edit")
+    assert await Permission.query.has_perm(user, "edit", obj=document)
+    assert not await Permission.query.has_perm(user, "edit", obj=other.pk)
+    assert not await Permission.query.has_perm(user, "delete")
+    assert len(fetches) == 1
+    assert permission_cache.info().hits == 5
+
+    assert await Permission.query.effective_permissions(user) == {
+        "view": frozenset({None}),
+        "edit": frozenset({document.pk}),
+    }
+
+
+async def test_changes_invalidate_the_cached_sets():
+    user = await User.query.create(name="bob")
+    group = await Group.query.create(name="admins")
+    permission = await Permission.query.create(groups=[group], name="admin")
+    assert not await Permission.query.has_perm(user, "admin")
+
+    await group.users.add(user)
+    assert await Permission.query.has_perm(user, "admin")
+
+    await Permission.query.filter(id=permission.id).update(name="root")
+    assert await Permission.query.has_perm(user, "root")
+
+    await permission.delete()
+    assert not await Permission.query.has_perm(user, "root")
+
+
+async def test_entries_expire(monkeypatch):
+    now = types.SimpleNamespace(value=100.0)
+    monkeypatch.setattr(cache_module, "time", types.SimpleNamespace(monotonic=lambda: now.value))
+    cache = PermissionCache(maxsize=2, ttl=10)
+    generation = cache.generation(Permission)
+
+    cache.set(Permission, 1, generation, {"view": frozenset({None})})
+    assert cache.get(Permission, 1, generation) == {"view": frozenset({None})}
+    now.value += 11
+    assert cache.get(Permission, 1, generation) is None
+
+    cache.set(Permission, 1, generation, {})
+    cache.invalidate(Permission)
+    cache.set(Permission, 2, generation, {})
+    assert cache.info().currsize == 0
+
+
+async def test_set_based_writes_invalidate_the_cached_sets():
+    user = await User.query.create(name="cid")
+    group = await Group.query.create(name="readers")
+    permission = await Permission.query.create(name="read")
+    assert not await Permission.query.has_perm(user, "read")
+
+    await permission.users.add_many(user)
+    assert await Permission.query.has_perm(user, "read")
+
+    await permission.users.set([])
+    assert not await Permission.query.has_perm(user, "read")
+
+    await permission.groups.add_many(group)
+    await group.users.set([user])
+    assert await Permission.query.has_perm(user, "read")
+
+    await group.users.remove_many(user)
+    assert not await Permission.query.has_perm(user, "read")
+
+    await Permission.query.bulk_create([{"name": "write"}])
+    write = await Permission.query.get(name="write")
+    await write.users.add(user)
+    assert await Permission.query.has_perm(user, "write")
+
+    write.name = "publish"
+    await Permission.query.bulk_update([write], fields=["name"])
+    assert await Permission.query.has_perm(user, "publish")
+
+    await Permission.query.bulk_upsert(
+        [{"id": write.id, "name": "approve"}], conflict_fields=["id"], update_fields=["name"]
+    )
+    assert await Permission.query.has_perm(user, "approve")
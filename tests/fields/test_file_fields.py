@@ -1,6 +1,7 @@
 import io
 import shutil
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
@@ -158,3 +159,57 @@ async def test_image_field_extracts_dimensions_and_tracks_approval_column():
     assert loaded.image.metadata["width"] == 2
     assert loaded.image.metadata["height"] == 3
     assert "image_approved" in Asset.fields
+
+
+async def test_model_saves_store_files_and_extract_metadata_off_loop(monkeypatch):
+    def blocking(*args, **kwargs):
+        raise AssertionError("blocking storage call on the event loop")
+
+    monkeypatch.setattr(storage, "save", blocking)
+    monkeypatch.setattr(saffier.files.FieldFile, "save", blocking)
+    threads = []
+    extract_metadata = saffier.ImageField.extract_metadata
+
+    def spy(self, field_file):
+        threads.append(threading.current_thread())
+        return extract_metadata(self, field_file)
+
+    monkeypatch.setattr(saffier.ImageField, "extract_metadata", spy)
+
+    document = await Asset.query.create(
+        file=saffier.files.ContentFile(b"hello", name="docs/async.txt"),
+        image=saffier.files.ContentFile(make_png(4, 5), name="images/async.png"),
+    )
+    await document.update(image=saffier.files.ContentFile(make_png(6, 7), name="images/b.png"))
+    loaded = await Asset.query.get(pk=document.pk)
+
+    assert loaded.file.size == 5
+    assert loaded.file.metadata == {"mime": "text/plain"}
+    assert (loaded.image.metadata["width"], loaded.image.metadata["height"]) == (6, 7)
+    assert storage.exists("images/async.png")
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+    await loaded.file.adelete()
+    assert loaded.file.name == ""
+    assert not storage.exists("docs/async.txt")
+
+
+async def test_failed_saves_release_the_prepared_files(monkeypatch):
+    document = await Asset.query.create(
+        file=saffier.files.ContentFile(b"hello", name="docs/prepared.txt")
+    )
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("write failed")
+
+    monkeypatch.setattr(Asset, "extract_column_values", fail)
+    with pytest.raises(RuntimeError):
+        await document.update(file=saffier.files.ContentFile(b"again", name="docs/again.txt"))
+    assert document.file.committed
+    assert not document.file._prepared
+
+    document.file = saffier.files.ContentFile(b"third", name="docs/third.txt")
+    with pytest.raises(RuntimeError):
+        await document.save()
+    assert not document.file._prepared
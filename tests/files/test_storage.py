@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import io
 import os
 
 import pytest
 
 import saffier
+from saffier.conf import override_settings
+from saffier.core.files.storage import base as storage_base
+from saffier.core.files.storage import filesystem
 from saffier.exceptions import InvalidStorageError, SuspiciousFileOperation
 
 
@@ -108,3 +112,39 @@ def test_filesystem_storage_returns_tz_aware_datetimes_by_default(tmp_path) -> N
     assert storage.get_accessed_time(name).tzinfo is not None
     assert storage.get_created_time(name).tzinfo is not None
     assert storage.get_modified_time(name).tzinfo is not None
+
+
+@pytest.mark.anyio
+async def test_filesystem_storage_async_protocol_streams_off_loop(tmp_path, monkeypatch) -> None:
+    storage = saffier.files.FileSystemStorage(location=tmp_path)
+    offloaded = []
+    run_in_storage_thread = filesystem.run_in_storage_thread
+
+    async def spy(func, *args):
+        offloaded.append(getattr(func, "__name__", ""))
+        return await run_in_storage_thread(func, *args)
+
+    monkeypatch.setattr(filesystem, "run_in_storage_thread", spy)
+    monkeypatch.setattr(saffier.files.File, "DEFAULT_CHUNK_SIZE", 4)
+    content = saffier.files.File(io.BytesIO(b"hello world"), name="nested/file name.txt")
+
+    name = await storage.asave(content)
+    second = await storage.asave(b"second", "nested/file name.txt")
+
+    assert name == content.name == "nested/file_name.txt"
+    assert second != name
+    assert offloaded.count("_write_next_chunk") == 4 + 3
+    assert await storage.aexists(name)
+    assert await storage.asize(name) == 11
+    with await storage.aopen(name) as file:
+        assert file.read() == b"hello world"
+
+    await storage.adelete(name)
+    assert not await storage.aexists(name)
+
+
+@pytest.mark.anyio
+async def test_storage_thread_limit_follows_settings(tmp_path) -> None:
+    with override_settings(storage_thread_limit=2):
+        assert storage_base.storage_thread_limiter().total_tokens == 2
+    assert storage_base.storage_thread_limiter().total_tokens == 8
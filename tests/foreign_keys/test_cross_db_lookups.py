@@ -0,0 +1,101 @@
+import pytest
+
+import saffier
+from saffier.conf import settings
+from saffier.core.db.querysets.clauses import CrossDatabaseLookup
+from saffier.exceptions import QuerySetError
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_ALTERNATIVE_URL, DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = Database(DATABASE_URL, full_isolation=False)
+remote_database = Database(DATABASE_ALTERNATIVE_URL, full_isolation=False)
+models = saffier.Registry(database=database)
+remote_models = saffier.Registry(database=remote_database)
+
+
+class Author(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = remote_models
+        tablename = "cross_lookup_authors"
+
+
+class Book(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    title = saffier.CharField(max_length=100)
+    author = saffier.ForeignKey(Author, on_delete=saffier.CASCADE)
+
+    class Meta:
+        registry = models
+        tablename = "cross_lookup_books"
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    async with database, remote_database:
+        await remote_models.create_all()
+        await models.create_all()
+        authors = await Author.query.bulk_create(
+            [{"name": name} for name in ("ann", "anna", "bob")], return_instances=True
+        )
+        await Book.query.bulk_create(
+            [{"title": f"{author.name} book", "author": author} for author in authors]
+        )
+        yield
+        await models.drop_all()
+        await remote_models.drop_all()
+
+
+@pytest.fixture()
+def remote_queries(monkeypatch):
+    calls = []
+    fetch_all = type(remote_database).fetch_all
+
+    async def spy(self, *args, **kwargs):
+        if self.url == remote_database.url:
+            calls.append(args[0])
+        return await fetch_all(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(remote_database), "fetch_all", spy)
+    return calls
+
+
+async def test_lookups_resolve_once_when_the_queryset_runs(remote_queries):
+    queryset = Book.query.filter(author__name__startswith="ann")
+    assert remote_queries == []
+    assert "<cross-database lookup>" in str(queryset._build_select())
+
+    assert await queryset.count() == 2
+    titles = await queryset.order_by("id").values_list("title", flat=True)
+    assert titles == ["ann book", "anna book"]
+    assert len(await queryset) == 2
+    assert len(remote_queries) == 1
+
+    await Author.query.filter(name="anna").update(name="carl")
+    assert await queryset.count() == 2
+    assert await queryset.all(clear_cache=True).count() == 1
+    assert len(remote_queries) == 2
+
+    assert await Book.query.exclude(author__name="bob").count() == 2
+    assert await Book.query.filter(author__name="nobody").count() == 0
+
+
+async def test_large_key_sets_are_chunked(monkeypatch):
+    monkeypatch.setattr(settings, "cross_db_lookup_chunk_size", 2)
+    queryset = Book.query.filter(author__name__in=["ann", "anna", "bob"])
+    expression = await queryset.as_select()
+
+    assert str(expression).count(" IN (") == 2
+    assert await queryset.count() == 3
+
+
+async def test_unresolved_lookups_are_not_executed():
+    lookup = Book.query.filter(author__name="ann").filter_clauses[0]
+    assert isinstance(lookup, CrossDatabaseLookup)
+
+    with pytest.raises(QuerySetError):
+        await database.fetch_all(Book.table.select().where(lookup))
@@ -0,0 +1,139 @@
+import pytest
+
+import saffier
+from saffier.exceptions import RelationshipIncompatible, RelationshipNotFound
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+TABLE_PREFIX = "mmbulk"
+
+database = Database(DATABASE_URL)
+models = saffier.Registry(database=database)
+
+
+class Track(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    title = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+        table_prefix = TABLE_PREFIX
+
+
+class Album(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+    tracks = saffier.ManyToManyField(Track, embed_through="link")
+
+    class Meta:
+        registry = models
+        table_prefix = TABLE_PREFIX
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def statements(monkeypatch):
+    calls = []
+    for name in ("execute", "execute_many", "fetch_all"):
+        original = getattr(type(database), name)
+
+        def spy(self, *args, __name=name, __original=original, **kwargs):
+            calls.append(__name)
+            return __original(self, *args, **kwargs)
+
+        monkeypatch.setattr(type(database), name, spy)
+    return calls
+
+
+async def track_titles(album: Album) -> list[str]:
+    return sorted(track.title for track in await album.tracks.all())
+
+
+async def test_add_many_uses_one_lookup_and_one_insert(statements):
+    album = await Album.query.create(name="Malibu")
+    tracks = [await Track.query.create(title=f"Track {index}") for index in range(5)]
+    await album.tracks.add(tracks[0])
+
+    statements.clear()
+    added = await album.tracks.add_many(*tracks)
+
+    assert statements == ["fetch_all", "execute_many", "fetch_all"]
+    assert added[0] is None
+    assert [track.pk for track in added[1:]] == [track.pk for track in tracks[1:]]
+    assert all(track.link.pk is not None for track in added[1:])
+    assert len(await album.tracks.all()) == 5
+
+
+async def test_add_many_skips_repeated_children_and_creates_dicts():
+    album = await Album.query.create(name="Malibu")
+    track = await Track.query.create(title="The Bird")
+
+    added = await album.tracks.add_many(track, track, {"title": "The Waters"})
+
+    assert added[0].pk == track.pk
+    assert added[1] is None
+    assert added[2].title == "The Waters"
+    assert await track_titles(album) == ["The Bird", "The Waters"]
+
+
+async def test_add_many_rejects_wrong_types():
+    album = await Album.query.create(name="Malibu")
+
+    with pytest.raises(RelationshipIncompatible):
+        await album.tracks.add_many(album)
+
+
+async def test_remove_many_deletes_in_one_statement(statements):
+    album = await Album.query.create(name="Malibu")
+    tracks = [await Track.query.create(title=f"Track {index}") for index in range(3)]
+    await album.tracks.add_many(*tracks)
+
+    statements.clear()
+    await album.tracks.remove_many(tracks[0], tracks[1])
+
+    assert statements.count("execute") == 1
+    assert await track_titles(album) == ["Track 2"]
+
+
+async def test_remove_many_raises_for_unrelated_children():
+    album = await Album.query.create(name="Malibu")
+    related = await Track.query.create(title="Related")
+    unrelated = await Track.query.create(title="Unrelated")
+    await album.tracks.add(related)
+
+    with pytest.raises(RelationshipNotFound):
+        await album.tracks.remove_many(related, unrelated)
+
+    assert await track_titles(album) == []
+
+
+async def test_set_replaces_related_children():
+    album = await Album.query.create(name="Malibu")
+    other = await Album.query.create(name="Other")
+    first, second, third = [await Track.query.create(title=f"Track {index}") for index in range(3)]
+    await album.tracks.add_many(first, second)
+    await other.tracks.add(first)
+
+    await album.tracks.set([second, third])
+
+    assert await track_titles(album) == ["Track 1", "Track 2"]
+    assert await track_titles(other) == ["Track 0"]
+
+    await album.tracks.set([])
+
+    assert await track_titles(album) == []
+    assert await track_titles(other) == ["Track 0"]
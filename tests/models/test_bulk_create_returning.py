@@ -0,0 +1,148 @@
+import pytest
+
+import saffier
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Product(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+    stock = saffier.IntegerField(default=0)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def statements(monkeypatch):
+    calls = []
+    for name in ("execute", "execute_many", "fetch_all", "fetch_many"):
+        original = getattr(type(database), name)
+
+        def spy(self, *args, __name=name, __original=original, **kwargs):
+            calls.append(__name)
+            return __original(self, *args, **kwargs)
+
+        monkeypatch.setattr(type(database), name, spy)
+    return calls
+
+
+async def test_bulk_create_returns_nothing_by_default():
+    result = await Product.query.bulk_create([{"name": "Pen"}, {"name": "Ink"}])
+
+    assert result is None
+    assert await Product.query.count() == 2
+
+
+async def test_bulk_create_returns_instances_with_primary_keys(statements):
+    products = await Product.query.bulk_create(
+        [{"name": "Pen", "stock": 3}, Product(name="Ink")], return_instances=True
+    )
+
+    assert statements == ["fetch_many"]
+    assert [(product.name, product.stock) for product in products] == [("Pen", 3), ("Ink", 0)]
+    assert all(isinstance(product, Product) for product in products)
+
+    stored = await Product.query.order_by("id")
+    assert [product.pk for product in products] == [product.pk for product in stored]
+
+
+async def test_bulk_create_splits_batches(statements):
+    products = await Product.query.bulk_create(
+        [{"name": f"Product {index}"} for index in range(7)],
+        batch_size=3,
+        return_instances=True,
+    )
+
+    assert statements == ["fetch_many"] * 3
+    assert [product.name for product in products] == [f"Product {index}" for index in range(7)]
+    assert len({product.pk for product in products}) == 7
+
+
+async def test_bulk_create_without_returning_support(monkeypatch):
+    async with database:
+        monkeypatch.setattr(
+            database.engine.dialect, "insert_executemany_returning_sort_by_parameter_order", False
+        )
+        await Product.query.create(name="Existing")
+
+        products = await Product.query.bulk_create(
+            [{"name": "Pen"}, {"id": 100, "name": "Ink"}], batch_size=1, return_instances=True
+        )
+
+    assert [product.name for product in products] == ["Pen", "Ink"]
+    assert products[1].pk == 100
+    assert (await Product.query.get(pk=products[0].pk)).name == "Pen"
+
+
+async def test_bulk_create_fallback_inserts_each_row_once(monkeypatch, statements):
+    async with database:
+        monkeypatch.setattr(
+            database.engine.dialect, "insert_executemany_returning_sort_by_parameter_order", False
+        )
+        products = await Product.query.bulk_create(
+            [{"name": "Pen"}, {"name": "Ink"}], return_instances=True
+        )
+        assert statements == ["execute", "execute"]
+
+        statements.clear()
+        keyed = await Product.query.bulk_create(
+            [{"id": 10, "name": "Cap"}, {"id": 11, "name": "Nib"}], return_instances=True
+        )
+        assert statements == ["execute_many"]
+
+    stored = await Product.query.order_by("id")
+    assert [(product.pk, product.name) for product in stored] == [
+        (products[0].pk, "Pen"),
+        (products[1].pk, "Ink"),
+        (10, "Cap"),
+        (11, "Nib"),
+    ]
+    assert [product.pk for product in keyed] == [10, 11]
+
+
+async def test_bulk_create_sends_signals_per_batch():
+    pre_save, post_save = [], []
+
+    async def on_pre_save(sender, instance, values, **kwargs):
+        pre_save.append(len(values))
+
+    async def on_post_save(sender, instance, values, model_instances, **kwargs):
+        post_save.append([product.name for product in model_instances])
+
+    Product.meta.signals.pre_save.connect(on_pre_save)
+    Product.meta.signals.post_save.connect(on_post_save)
+    try:
+        await Product.query.bulk_create(
+            [{"name": name} for name in ("a", "b", "c")],
+            batch_size=2,
+            return_instances=True,
+            send_signals=True,
+        )
+        await Product.query.bulk_create([{"name": "d"}])
+    finally:
+        Product.meta.signals.pre_save.disconnect(on_pre_save)
+        Product.meta.signals.post_save.disconnect(on_post_save)
+
+    assert pre_save == [2, 1]
+    assert post_save == [["a", "b"], ["c"]]
@@ -1,6 +1,7 @@
 import pytest
 
 import saffier
+from saffier.core.signals import post_save, pre_save
 from saffier.testclient import DatabaseTestClient as Database
 from tests.settings import DATABASE_URL
 
@@ -75,3 +76,32 @@ async def test_bulk_get_or_create_accepts_model_instances():
 
     assert len(users) == 2
     assert {user.name for user in users} == {"Carol", "Dora"}
+
+
+async def test_bulk_get_or_create_sends_save_signals_for_created_rows():
+    existing = await User.query.create(name="Alice", language="English")
+    received = []
+
+    @pre_save(User)
+    async def pre_saving(sender, instance, **kwargs):
+        received.append(("pre_save", instance.name))
+
+    @post_save(User)
+    async def post_saving(sender, instance, **kwargs):
+        received.append(("post_save", instance.name))
+
+    try:
+        users = await User.query.bulk_get_or_create(
+            [
+                {"name": "Alice", "language": "English"},
+                {"name": "Bob", "language": "Portuguese"},
+            ],
+            unique_fields=["name", "language"],
+        )
+    finally:
+        User.signals.pre_save.disconnect(pre_saving)
+        User.signals.post_save.disconnect(post_saving)
+
+    assert [user.name for user in users] == ["Alice", "Bob"]
+    assert users[0].pk == existing.pk
+    assert received == [("pre_save", "Bob"), ("post_save", "Bob")]
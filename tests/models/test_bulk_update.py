@@ -5,6 +5,8 @@ import pytest
 
 import saffier
 from saffier.core.db import fields
+from saffier.core.db.querysets import base as queryset_base
+from saffier.exceptions import QuerySetError
 from saffier.testclient import DatabaseTestClient as Database
 from tests.settings import DATABASE_URL
 
@@ -70,6 +72,20 @@ async def rollback_transactions():
             yield
 
 
+@pytest.fixture()
+def statements(monkeypatch):
+    calls = []
+    for name in ("execute", "execute_many"):
+        original = getattr(type(database), name)
+
+        def spy(self, *args, __name=name, __original=original, **kwargs):
+            calls.append(__name)
+            return __original(self, *args, **kwargs)
+
+        monkeypatch.setattr(type(database), name, spy)
+    return calls
+
+
 async def test_bulk_update():
     await Product.query.bulk_create(
         [
@@ -130,3 +146,73 @@ async def test_bulk_update_with_relation():
     tracks = await Track.query.all()
     assert tracks[0].album.pk == album2.pk
     assert tracks[1].album.pk == album2.pk
+
+
+async def test_bulk_update_uses_one_case_statement_per_batch(statements):
+    album = await Album.query.create(name="foo")
+    await Track.query.bulk_create(
+        [{"album": album, "position": index, "title": f"track {index}"} for index in range(7)]
+    )
+    tracks = await Track.query.order_by("id")
+    for track in tracks:
+        track.position = track.position * 10
+    tracks[0].title = "renamed"
+
+    statements.clear()
+    await Track.query.bulk_update(tracks, fields=["position", "title"], batch_size=3)
+
+    assert statements == ["execute"] * 3
+    tracks = await Track.query.order_by("id")
+    assert [track.position for track in tracks] == [index * 10 for index in range(7)]
+    assert [track.title for track in tracks[:2]] == ["renamed", "track 1"]
+
+
+async def test_bulk_update_case_batches_fit_the_parameter_limit(statements, monkeypatch):
+    album = await Album.query.create(name="foo")
+    await Track.query.bulk_create(
+        [{"album": album, "position": index, "title": "track"} for index in range(7)]
+    )
+    tracks = await Track.query.order_by("id")
+    for track in tracks:
+        track.position += 100
+        track.title = f"title {track.position}"
+
+    # Two columns and one primary key bind five parameters per object.
+    monkeypatch.setitem(queryset_base._BIND_PARAMETER_LIMITS, database.url.dialect, 11)
+    statements.clear()
+    await Track.query.bulk_update(tracks, fields=["position", "title"])
+    assert statements == ["execute"] * 4
+
+    statements.clear()
+    await Track.query.bulk_update(tracks, fields=["position", "title"], batch_size=50)
+    assert statements == ["execute"] * 4
+
+    statements.clear()
+    await Track.query.bulk_update(tracks, fields=["title"], batch_size=3)
+    assert statements == ["execute"] * 3
+
+    tracks = await Track.query.order_by("id")
+    assert [track.position for track in tracks] == [index + 100 for index in range(7)]
+
+
+async def test_bulk_update_executemany_strategy(statements):
+    album = await Album.query.create(name="foo")
+    await Track.query.bulk_create(
+        [{"album": album, "position": index, "title": "track"} for index in range(3)]
+    )
+    tracks = await Track.query.order_by("id")
+    for track in tracks:
+        track.title = f"title {track.position}"
+
+    statements.clear()
+    await Track.query.bulk_update(tracks, fields=["title"], strategy="executemany")
+
+    assert statements == ["execute_many"]
+    assert [track.title for track in await Track.query.order_by("id")] == [
+        "title 0",
+        "title 1",
+        "title 2",
+    ]
+
+    with pytest.raises(QuerySetError):
+        await Track.query.bulk_update(tracks, fields=["title"], strategy="merge")
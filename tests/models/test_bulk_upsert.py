@@ -0,0 +1,134 @@
+import pytest
+
+import saffier
+from saffier.exceptions import QuerySetError
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Product(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    sku = saffier.CharField(max_length=50, unique=True)
+    name = saffier.CharField(max_length=100)
+    stock = saffier.IntegerField(default=0)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def statements(monkeypatch):
+    calls = []
+    for name in ("execute", "execute_many", "fetch_all", "fetch_many"):
+        original = getattr(type(database), name)
+
+        def spy(self, *args, __name=name, __original=original, **kwargs):
+            calls.append(__name)
+            return __original(self, *args, **kwargs)
+
+        monkeypatch.setattr(type(database), name, spy)
+    return calls
+
+
+async def test_bulk_upsert_inserts_and_updates_in_one_statement(statements):
+    existing = await Product.query.create(sku="A-1", name="Old name", stock=1)
+
+    statements.clear()
+    products = await Product.query.bulk_upsert(
+        [
+            {"sku": "A-1", "name": "New name", "stock": 5},
+            {"sku": "B-2", "name": "Second", "stock": 2},
+        ],
+        conflict_fields=["sku"],
+    )
+
+    assert statements == ["fetch_many"]
+    assert [product.sku for product in products] == ["A-1", "B-2"]
+    assert products[0].pk == existing.pk
+    assert products[0].name == "New name"
+    assert products[1].pk is not None
+    assert await Product.query.count() == 2
+
+    refreshed = await Product.query.get(sku="A-1")
+    assert (refreshed.name, refreshed.stock) == ("New name", 5)
+
+
+async def test_bulk_upsert_limits_updated_fields():
+    await Product.query.create(sku="A-1", name="Kept", stock=1)
+
+    products = await Product.query.bulk_upsert(
+        [{"sku": "A-1", "name": "Ignored", "stock": 9}],
+        conflict_fields=["sku"],
+        update_fields=["stock"],
+    )
+
+    assert (products[0].name, products[0].stock) == ("Kept", 9)
+
+
+async def test_bulk_upsert_without_update_fields_keeps_existing_rows():
+    existing = await Product.query.create(sku="A-1", name="Kept", stock=1)
+
+    products = await Product.query.bulk_upsert(
+        [
+            {"sku": "A-1", "name": "Ignored", "stock": 9},
+            {"sku": "C-3", "name": "Created", "stock": 3},
+        ],
+        conflict_fields=["sku"],
+        update_fields=[],
+    )
+
+    assert products[0].pk == existing.pk
+    assert products[0].name == "Kept"
+    assert products[1].name == "Created"
+    assert await Product.query.count() == 2
+
+
+async def test_bulk_upsert_collapses_repeated_keys():
+    products = await Product.query.bulk_upsert(
+        [
+            {"sku": "A-1", "name": "First", "stock": 1},
+            Product(sku="A-1", name="Last", stock=2),
+        ],
+        conflict_fields=["sku"],
+    )
+
+    assert len(products) == 2
+    assert products[0] is products[1]
+    assert products[1].name == "Last"
+    assert await Product.query.count() == 1
+
+
+async def test_bulk_upsert_defaults_to_the_primary_key():
+    first = await Product.query.create(sku="A-1", name="First")
+
+    products = await Product.query.bulk_upsert([{"id": first.pk, "sku": "A-1", "name": "Renamed"}])
+
+    assert products[0].pk == first.pk
+    assert products[0].name == "Renamed"
+
+
+async def test_bulk_upsert_requires_conflict_values():
+    with pytest.raises(QuerySetError):
+        await Product.query.bulk_upsert([{"sku": "A-1", "name": "No id"}])
+
+    with pytest.raises(QuerySetError):
+        await Product.query.bulk_upsert([{"sku": "A-1", "name": "x"}], conflict_fields=["missing"])
@@ -0,0 +1,163 @@
+import pytest
+
+import saffier
+from saffier.conf import override_settings
+from saffier.contrib.lilya import SaffierMiddleware
+from saffier.core.db import get_identity_map, identity_map
+from saffier.core.db.querysets import QuerySet
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = Database(DATABASE_URL)
+models = saffier.Registry(database=database)
+
+
+class Author(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+        table_prefix = "identity"
+
+
+class Book(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    title = saffier.CharField(max_length=100)
+    author = saffier.ForeignKey(Author, on_delete=saffier.CASCADE)
+
+    class Meta:
+        registry = models
+        table_prefix = "identity"
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def fetches(monkeypatch):
+    calls = []
+    fetch_all = type(database).fetch_all
+
+    async def spy(self, *args, **kwargs):
+        calls.append(args[0])
+        return await fetch_all(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(database), "fetch_all", spy)
+    return calls
+
+
+async def test_loaded_rows_resolve_to_one_instance(fetches):
+    author = await Author.query.create(name="Ann")
+    await Book.query.create(title="First", author=author)
+
+    with identity_map() as session:
+        loaded = await Author.query.get(name="Ann")
+        fetches.clear()
+        assert await Author.query.get(id=author.id) is loaded
+        assert await Author.query.get(pk=author.id) is loaded
+        assert fetches == []
+
+        book = await Book.query.get(title="First")
+        assert book.author is loaded
+        assert (await Author.query.all())[0] is loaded
+        assert (await Author.query.only("name").get(id=author.id)) is not loaded
+        assert session.info().hits >= 3
+
+    assert get_identity_map() is None
+    assert await Author.query.get(id=author.id) is not loaded
+
+
+async def test_flush_batches_pending_writes(monkeypatch):
+    await Author.query.bulk_create([{"name": "Ann"}, {"name": "Bob"}])
+    updates = []
+    bulk_update = QuerySet.bulk_update
+
+    async def spy(self, objs, fields, *args, **kwargs):
+        updates.append((len(objs), fields))
+        return await bulk_update(self, objs, fields, *args, **kwargs)
+
+    monkeypatch.setattr(QuerySet, "bulk_update", spy)
+
+    with identity_map() as session:
+        ann, bob = await Author.query.order_by("id")
+        ann.name = "Anna"
+        bob.name = "Bobby"
+        carl = Author(name="Carl")
+        session.add(carl)
+        assert session.dirty() == [ann, bob]
+
+        await session.flush()
+        assert updates == [(2, ["name"])]
+        assert carl.id is not None
+        assert await Author.query.get(id=carl.id) is carl
+        assert session.dirty() == []
+
+        await session.flush()
+        assert updates == [(2, ["name"])]
+
+    names = await Author.query.order_by("id").values_list("name", flat=True)
+    assert names == ["Anna", "Bobby", "Carl"]
+
+
+async def test_clean_instances_are_evicted_first():
+    await Author.query.bulk_create([{"name": name} for name in "abc"])
+
+    with identity_map(maxsize=2) as session:
+        first, second = await Author.query.order_by("id").limit(2)
+        first.name = "changed"
+        third = await Author.query.get(name="c")
+
+        assert len(session) == 2
+        assert first in session
+        assert second not in session
+        assert third in session
+
+
+async def test_rows_are_keyed_on_the_schema_they_were_read_from():
+    first, second = Author(id=1, name="a"), Author(id=1, name="b")
+
+    with identity_map() as session:
+        assert session.merge(first, "tenant_a") is first
+        assert session.merge(second, "tenant_b") is second
+        assert session.get(Author, {"id": 1}, "tenant_a") is first
+        assert session.get(Author, {"id": 1}, "tenant_b") is second
+
+        second.name = "changed"
+        assert session.dirty() == [second]
+        session.discard(first)
+        assert first not in session
+        assert second in session
+
+    with override_settings(use_schema_translate_map=True):
+        queryset = Author.query.using(schema="tenant_a")
+        assert queryset.table.schema is None
+        assert queryset._identity_schema() == "tenant_a"
+
+
+async def test_middleware_scopes_a_map_per_request():
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(get_identity_map())
+
+    middleware = SaffierMiddleware(app, identity_map=5)
+    await middleware({"type": "http"}, None, None)
+    await middleware({"type": "http"}, None, None)
+
+    assert seen[0] is not seen[1]
+    assert seen[0].maxsize == 5
+    assert get_identity_map() is None
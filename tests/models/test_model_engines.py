@@ -1,4 +1,5 @@
 import copy
+import json
 
 import pytest
 from msgspec import ValidationError as MsgspecValidationError
@@ -86,6 +87,20 @@ class MsgspecWidget(saffier.Model):
         model_engine = "msgspec"
 
 
+class MaskedWidget(saffier.Model):
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = dummy_models
+        model_engine = "pydantic"
+
+    def model_dump(self, **kwargs):
+        payload = super().model_dump(**kwargs)
+        if "name" in payload:
+            payload["name"] = payload["name"].upper()
+        return payload
+
+
 class EngineBase(saffier.Model):
     name = saffier.CharField(max_length=100)
 
@@ -221,3 +236,48 @@ def test_registry_copy_preserves_model_engine_configuration() -> None:
 
     assert copied_registry.model_engine == "dummy-test"
     assert copied_model.get_model_engine_name() == "dummy-test"
+
+
+@pytest.mark.parametrize("model", [PydanticWidget, MsgspecWidget, DummyWidget])
+def test_dump_many_matches_per_instance_dumps(model) -> None:
+    widgets = [model(name=name) for name in ("apples", "pears")]
+    if "quantity" in model.fields:
+        widgets[1].quantity = 7
+    engine = model.require_model_engine()
+
+    for kwargs in ({}, {"exclude": {"name"}}, {"include": {"name"}, "exclude_none": True}):
+        assert engine.dump_many(widgets, **kwargs) == [
+            widget.engine_dump(**kwargs) for widget in widgets
+        ]
+        assert json.loads(engine.dump_many_json(widgets, **kwargs)) == [
+            json.loads(widget.engine_dump_json(**kwargs)) for widget in widgets
+        ]
+    assert engine.dump_many([]) == []
+    assert engine.dump_many_json([]) == "[]"
+
+
+def test_dump_many_reads_scalar_values_without_model_dump(monkeypatch) -> None:
+    widgets = [
+        PydanticWidget(name="apples", quantity=3),
+        MsgspecWidget(name="pears", quantity=2, note=None),
+    ]
+
+    def model_dump(self, **kwargs):
+        raise AssertionError("model_dump() should not run for scalar fields")
+
+    monkeypatch.setattr(saffier.Model, "model_dump", model_dump)
+
+    assert PydanticWidget.require_model_engine().dump_many(widgets[:1]) == [
+        {"name": "apples", "quantity": 3}
+    ]
+    assert MsgspecWidget.require_model_engine().dump_many_json(widgets[1:]) == (
+        '[{"name":"pears","quantity":2,"note":null}]'
+    )
+
+
+def test_dump_many_respects_model_dump_overrides() -> None:
+    widgets = [MaskedWidget(name="apples"), MaskedWidget(name="pears")]
+    engine = MaskedWidget.require_model_engine()
+
+    assert engine.dump_many(widgets) == [widget.engine_dump() for widget in widgets]
+    assert engine.dump_many(widgets) == [{"name": "APPLES"}, {"name": "PEARS"}]
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 import saffier
@@ -202,3 +204,29 @@ async def test_msgspec_engine_queryset_and_relations_keep_core_model_behavior()
         "profile": {"id": 1, "name": "msgspec"},
     }
     assert '"email":"msgspec@example.com"' in organisation.user.engine_dump_json()
+
+
+@pytest.mark.parametrize(
+    ("user_model", "profile_model"),
+    [(EngineUser, EngineProfile), (MsgspecUser, MsgspecProfile)],
+)
+async def test_as_engine_json_streams_the_rows_in_batches(user_model, profile_model) -> None:
+    profile = await profile_model.query.create(name="engine")
+    await user_model.query.bulk_create(
+        [{"email": f"user{index}@example.com", "profile": profile} for index in range(5)]
+    )
+    queryset = user_model.query.order_by("id").batch_size(2)
+
+    with pytest.warns(UserWarning):
+        chunks = [chunk async for chunk in queryset.as_engine_json(exclude={"profile"})]
+    users = await queryset
+
+    assert len(chunks) == 5
+    assert "".join(chunks) == user_model.require_model_engine().dump_many_json(
+        users, exclude={"profile"}
+    )
+    assert json.loads("".join(chunks)) == [user.engine_dump(exclude={"profile"}) for user in users]
+
+    with pytest.warns(UserWarning):
+        chunks = [chunk async for chunk in user_model.query.filter(id=0).as_engine_json()]
+    assert chunks == ["[", "]"]
@@ -0,0 +1,158 @@
+import pytest
+
+import saffier
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = Database(DATABASE_URL)
+models = saffier.Registry(database=database)
+
+
+class Country(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class City(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+    country = saffier.ForeignKey(Country, related_name="cities")
+
+    class Meta:
+        registry = models
+
+
+class Person(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+    password = saffier.CharField(max_length=100, secret=True)
+    city = saffier.ForeignKey(City, related_name="people", null=True)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+async def create_people() -> None:
+    country = await Country.query.create(name="Portugal")
+    city = await City.query.create(name="Lisbon", country=country)
+    await Person.query.create(name="Ana", password="secret", city=city)
+    await Person.query.create(name="Rui", password="hidden", city=None)
+
+
+async def assert_matches_from_query_result(queryset) -> None:
+    expression, tables_and_models = queryset._build_select_with_tables()
+    rows = await database.fetch_all(expression)
+    plan = queryset._get_row_loader(tables_and_models)
+
+    for row in rows:
+        expected = Person.from_query_result(
+            row,
+            select_related=queryset._select_related,
+            exclude_secrets=queryset._exclude_secrets,
+            tables_and_models=tables_and_models,
+        )
+        loaded = Person.from_row_loader(row, plan, tables_and_models=tables_and_models)
+
+        assert type(loaded) is type(expected)
+        assert loaded.model_dump() == expected.model_dump()
+        assert loaded.__no_load_trigger_attrs__ == expected.__no_load_trigger_attrs__
+
+
+async def test_plan_matches_plain_rows():
+    await create_people()
+
+    await assert_matches_from_query_result(Person.query.order_by("id"))
+
+
+async def test_plan_matches_nested_select_related():
+    await create_people()
+
+    await assert_matches_from_query_result(
+        Person.query.select_related("city__country").order_by("id")
+    )
+
+
+async def test_plan_matches_exclude_secrets():
+    await create_people()
+
+    await assert_matches_from_query_result(Person.query.exclude_secrets().order_by("id"))
+
+
+async def test_queryset_hydrates_through_plan():
+    await create_people()
+
+    people = await Person.query.order_by("id")
+    joined = await Person.query.select_related("city__country")
+
+    assert [person.name for person in people] == ["Ana", "Rui"]
+    assert people[0].city.pk == joined[0].city.pk
+    assert people[1].city.pk is None
+    assert joined[0].city.name == "Lisbon"
+    assert joined[0].city.country.name == "Portugal"
+
+
+async def test_plan_is_compiled_once_per_execution(monkeypatch):
+    await create_people()
+    calls = []
+    compile_row_loader = Person.compile_row_loader.__func__
+
+    def spy(cls, *args, **kwargs):
+        if kwargs.get("prefix", "") == "":
+            calls.append(args)
+        return compile_row_loader(cls, *args, **kwargs)
+
+    monkeypatch.setattr(Person, "compile_row_loader", classmethod(spy))
+
+    people = [person async for person in Person.query.order_by("id").batch_size(1)]
+
+    assert len(people) == 2
+    assert len(calls) == 1
+
+
+async def test_plan_reads_columns_by_position_and_skips_placeholder_setters(monkeypatch):
+    await create_people()
+    queryset = Person.query.select_related("city").order_by("id")
+    _, tables_and_models = queryset._build_select_with_tables()
+    plan = queryset._get_row_loader(tables_and_models)
+
+    assert all(position is not None for _, position, _ in plan.columns)
+    (_, city_plan), *_ = plan.children
+    (country,) = city_plan.foreign_keys
+    assert country.plain
+    assert all(position is not None for _, position, _, _ in country.lookups)
+
+    calls = []
+    setup = Country.setup_model_fields_from_kwargs
+
+    def spy(self, *args, **kwargs):
+        calls.append(self)
+        return setup(self, *args, **kwargs)
+
+    monkeypatch.setattr(Country, "setup_model_fields_from_kwargs", spy)
+
+    people = await queryset
+    placeholder = people[0].city.country
+
+    assert calls == []
+    assert placeholder.__dict__["id"] == (await Country.query.get()).pk
+    await placeholder.load()
+    assert placeholder.name == "Portugal"
@@ -0,0 +1,128 @@
+import pytest
+
+import saffier
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Author(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+    email = saffier.CharField(max_length=100, secret=True, null=True)
+
+    class Meta:
+        registry = models
+        tablename = "projection_authors"
+
+
+class Post(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    title = saffier.CharField(max_length=100)
+    rating = saffier.IntegerField(null=True)
+    author = saffier.ForeignKey(Author, null=True, on_delete=saffier.SET_NULL)
+
+    class Meta:
+        registry = models
+        tablename = "projection_posts"
+
+
+class MaskedAuthor(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+        tablename = "projection_masked_authors"
+
+    def model_dump(self, **kwargs):
+        payload = super().model_dump(**kwargs)
+        if "name" in payload:
+            payload["name"] = payload["name"].upper()
+        return payload
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+async def test_values_selects_only_requested_columns():
+    author = await Author.query.create(name="Ada")
+    await Post.query.create(title="First", rating=3, author=author)
+
+    queryset = Post.query.filter(title="First")
+    values = await queryset.values(["title", "rating"])
+
+    assert values == [{"title": "First", "rating": 3}]
+
+    projection = queryset._resolve_projection(["title", "rating"], None)
+    expression = str(queryset._build_projection_select(projection))
+    assert "author" not in expression
+    assert "projection_posts.id" not in expression
+
+
+async def test_values_with_related_columns_uses_outer_join():
+    author = await Author.query.create(name="Ada")
+    await Post.query.create(title="First", author=author)
+    await Post.query.create(title="Orphan")
+
+    values = await Post.query.order_by("id").values(["title", "author__name"])
+
+    assert values == [
+        {"title": "First", "author__name": "Ada"},
+        {"title": "Orphan", "author__name": None},
+    ]
+
+
+async def test_values_list_related_column_flat():
+    author = await Author.query.create(name="Ada")
+    await Post.query.create(title="First", author=author)
+    await Post.query.create(title="Second", author=author)
+
+    names = await Post.query.filter(author__name="Ada").values_list("author__name", flat=True)
+
+    assert names == ["Ada", "Ada"]
+
+
+async def test_values_projection_respects_secrets():
+    author = await Author.query.create(name="Ada", email="ada@example.com")
+    await Post.query.create(title="First", author=author)
+
+    values = await Author.query.exclude_secrets().values()
+    assert values == [{"id": author.pk, "name": "Ada"}]
+
+    values = await Post.query.exclude_secrets().values(["title", "author__email"])
+    assert values == [{"title": "First"}]
+
+
+async def test_values_falls_back_to_models_for_foreign_keys():
+    author = await Author.query.create(name="Ada")
+    await Post.query.create(title="First", author=author)
+
+    values = await Post.query.values(["title", "author"])
+
+    assert values == [{"title": "First", "author": {"id": author.pk}}]
+
+
+async def test_values_falls_back_to_models_overriding_model_dump():
+    author = await MaskedAuthor.query.create(name="Ada")
+
+    queryset = MaskedAuthor.query.order_by("id")
+    assert queryset._resolve_projection(["name"], None) is None
+    assert await queryset.values(["name"]) == [{"name": "ADA"}]
+    assert await MaskedAuthor.query.values() == [{"id": author.pk, "name": "ADA"}]
+    assert await MaskedAuthor.query.values_list("name", flat=True) == ["ADA"]
@@ -0,0 +1,160 @@
+import gc
+import pickle
+
+import pytest
+
+import saffier
+from saffier.core.db.querysets import loader
+from saffier.exceptions import QuerySetError
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = Database(DATABASE_URL)
+models = saffier.Registry(database=database)
+
+
+class Country(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Author(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+    country = saffier.ForeignKey(Country, null=True)
+
+    class Meta:
+        registry = models
+
+
+class Post(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    title = saffier.CharField(max_length=100)
+    body = saffier.TextField(default="")
+    author = saffier.ForeignKey(Author, null=True)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def queries(monkeypatch):
+    calls = []
+    for name in ("fetch_all", "fetch_one"):
+        original = getattr(type(database), name)
+
+        def spy(self, *args, __name=name, __original=original, **kwargs):
+            calls.append(__name)
+            return __original(self, *args, **kwargs)
+
+        monkeypatch.setattr(type(database), name, spy)
+    return calls
+
+
+async def create_posts(count: int = 6) -> None:
+    country = await Country.query.create(name="Portugal")
+    authors = [
+        await Author.query.create(name=f"author-{index}", country=country) for index in range(3)
+    ]
+    await Post.query.bulk_create(
+        [
+            {"title": f"post-{index}", "author": authors[index % 3], "body": "text"}
+            for index in range(count)
+        ]
+    )
+    await Post.query.create(title="anonymous", author=None)
+
+
+async def test_lazy_access_loads_all_siblings(queries):
+    await create_posts()
+    queries.clear()
+
+    posts = await Post.query.filter(title__startswith="post").order_by("id")
+    assert queries == ["fetch_all"]
+
+    names = [post.author.name for post in posts]
+    assert names == [f"author-{index % 3}" for index in range(6)]
+    assert queries == ["fetch_all", "fetch_all"]
+
+    assert [post.author.country.name for post in posts] == ["Portugal"] * 6
+    assert queries == ["fetch_all", "fetch_all", "fetch_all"]
+
+
+async def test_deferred_fields_are_loaded_for_all_siblings(queries):
+    await create_posts()
+    queries.clear()
+
+    posts = await Post.query.defer("body").order_by("id")
+
+    assert [post.body for post in posts] == ["text"] * 6 + [""]
+    assert queries == ["fetch_all", "fetch_all"]
+
+
+async def test_load_related_loads_paths_without_blocking(queries):
+    await create_posts()
+    queries.clear()
+
+    posts = await Post.query.order_by("id").load_related("author__country")
+
+    assert queries == ["fetch_all", "fetch_all", "fetch_all"]
+    assert [post.author.name for post in posts[:3]] == ["author-0", "author-1", "author-2"]
+    assert posts[0].author.country.name == "Portugal"
+    assert posts[-1].author.pk is None
+    assert len(queries) == 3
+
+    with pytest.raises(QuerySetError):
+        await Post.query.load_related("title")
+
+
+async def test_aload_many_fills_only_missing_fields(queries):
+    await create_posts()
+    posts = await Post.query.only("id").order_by("id")
+    posts[0].title = "changed"
+
+    queries.clear()
+    await Post.aload_many(posts, fields=["title", "body"])
+
+    assert queries == ["fetch_all"]
+    assert posts[0].title == "changed"
+    assert [post.title for post in posts[1:3]] == ["post-1", "post-2"]
+    assert posts[1].body == "text"
+
+    await Post.aload_many(posts)
+    assert queries == ["fetch_all"]
+
+
+async def test_loaders_stay_out_of_the_instances():
+    await create_posts()
+
+    posts = await Post.query.filter(title__startswith="post").order_by("id")
+    authors = [post.__dict__["author"] for post in posts]
+    assert loader.get_sibling_loader(authors[0]) is not None
+    assert all(not key.startswith("__sibling") for key in authors[0].__dict__)
+
+    restored = pickle.loads(pickle.dumps(posts))
+    assert [post.title for post in restored] == [f"post-{index}" for index in range(6)]
+    assert [post.__dict__["author"].pk for post in restored] == [author.pk for author in authors]
+
+    keys = {id(author) for author in authors}
+    del posts, restored, authors
+    gc.collect()
+    assert not keys & set(loader._LOADERS)
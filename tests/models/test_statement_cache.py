@@ -0,0 +1,146 @@
+import pytest
+
+import saffier
+from saffier.conf import settings
+from saffier.core.db.querysets import Q, QuerySet
+from saffier.core.db.querysets.compiler import StatementCache
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = Database(DATABASE_URL)
+models = saffier.Registry(database=database)
+
+
+class City(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class User(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+    age = saffier.IntegerField(default=0)
+    city = saffier.ForeignKey(City, null=True)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture(autouse=True)
+def statement_cache():
+    QuerySet.statement_cache.clear()
+    yield QuerySet.statement_cache
+    QuerySet.statement_cache.clear()
+
+
+async def create_users() -> list[User]:
+    city = await City.query.create(name="Lisbon")
+    return [
+        await User.query.create(name=f"user-{index}", age=index * 10, city=city)
+        for index in range(4)
+    ]
+
+
+async def test_repeated_shapes_reuse_the_statement(statement_cache):
+    users = await create_users()
+
+    for user in users:
+        assert (await User.query.get(pk=user.pk)).name == user.name
+    adults = await User.query.filter(age__gte=20).order_by("id")
+    older = await User.query.filter(age__gte=30).order_by("id")
+
+    assert [user.name for user in adults] == ["user-2", "user-3"]
+    assert [user.name for user in older] == ["user-3"]
+    info = statement_cache.info()
+    assert info.currsize == 2
+    assert info.hits == 4
+    assert info.misses == 2
+
+
+async def test_shape_includes_operators_and_related(statement_cache):
+    await create_users()
+
+    await User.query.filter(age__gte=20)
+    await User.query.filter(age__lt=20)
+    await User.query.filter(age__gte=20).select_related("city")
+    await User.query.exclude(age__gte=20)
+    joined = await User.query.filter(age=10).select_related("city")
+
+    assert joined[0].city.name == "Lisbon"
+    assert statement_cache.info().currsize == 5
+    assert statement_cache.info().hits == 0
+
+
+async def test_complex_lookups_skip_the_cache(statement_cache):
+    await create_users()
+
+    assert await User.query.filter(name__icontains="USER-1").count() == 1
+    assert await User.query.filter(city__name="Lisbon").count() == 4
+    assert await User.query.filter(Q(age=0) | Q(age=10)).count() == 2
+    assert await User.query.filter(User.table.c.age > 10).count() == 2
+    assert await User.query.filter(age=10).filter(User.table.c.age > 10).count() == 0
+
+    assert statement_cache.info().currsize == 0
+
+
+async def test_combined_querysets_with_the_same_shape(statement_cache):
+    await create_users()
+
+    first = User.query.filter(age=0)
+    second = User.query.filter(age=10)
+    names = sorted(user.name for user in await first.union(second))
+
+    assert names == ["user-0", "user-1"]
+
+
+async def test_statement_cache_can_be_disabled(statement_cache, monkeypatch):
+    monkeypatch.setattr(settings, "statement_cache_size", 0)
+    users = await create_users()
+
+    assert (await User.query.get(pk=users[0].pk)).pk == users[0].pk
+    assert (await User.query.get(pk=users[1].pk)).pk == users[1].pk
+
+    assert statement_cache.info().currsize == 0
+    assert statement_cache.info().hits == 0
+
+
+async def test_statement_cache_evicts_least_recently_used():
+    cache = StatementCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.info() == (2, 1, 2, 2)
+
+
+async def test_cached_statement_keeps_its_own_values():
+    first = User.query.filter(age=10)
+    second = User.query.filter(age=20)
+
+    first_sql = first.sql
+    second_sql = second.sql
+
+    assert "10" in first_sql and "20" not in first_sql
+    assert "20" in second_sql and "10" not in second_sql
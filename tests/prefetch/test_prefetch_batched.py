@@ -0,0 +1,170 @@
+import pytest
+
+import saffier
+from saffier.core.db.querysets import Prefetch
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = Database(DATABASE_URL)
+models = saffier.Registry(database=database)
+
+
+class Album(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Track(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    album = saffier.ForeignKey(Album, on_delete=saffier.CASCADE, related_name="tracks")
+    title = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Studio(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    album = saffier.ForeignKey(Album, related_name="studios")
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Tag(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+    albums = saffier.ManyToManyField(Album, related_name="tags")
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def query_counter(monkeypatch):
+    calls = []
+    fetch_all = type(database).fetch_all
+
+    async def counting_fetch_all(self, *args, **kwargs):
+        calls.append(args)
+        return await fetch_all(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(database), "fetch_all", counting_fetch_all)
+    return calls
+
+
+async def create_albums(total: int) -> list[Album]:
+    albums = []
+    for index in range(total):
+        album = await Album.query.create(name=f"Album {index}")
+        for position in range(index + 1):
+            await Track.query.create(album=album, title=f"Track {index}.{position}")
+        albums.append(album)
+    return albums
+
+
+async def test_prefetch_reverse_relation_uses_constant_queries(query_counter):
+    await create_albums(5)
+
+    query_counter.clear()
+    albums = await Album.query.order_by("id").prefetch_related(
+        Prefetch(related_name="tracks", to_attr="to_tracks")
+    )
+
+    assert len(query_counter) == 3
+    assert [len(album.to_tracks) for album in albums] == [1, 2, 3, 4, 5]
+    for album in albums:
+        assert all(track.album.pk == album.pk for track in album.to_tracks)
+
+
+async def test_prefetch_with_queryset_is_applied_per_parent():
+    await create_albums(3)
+
+    albums = await Album.query.order_by("id").prefetch_related(
+        Prefetch(
+            related_name="tracks",
+            to_attr="to_tracks",
+            queryset=Track.query.filter(title__endswith=".0").order_by("-id"),
+        )
+    )
+
+    assert [[track.title for track in album.to_tracks] for album in albums] == [
+        ["Track 0.0"],
+        ["Track 1.0"],
+        ["Track 2.0"],
+    ]
+
+
+async def test_prefetch_many_to_many_groups_by_parent(query_counter):
+    first, second = await create_albums(2)
+    rock = await Tag.query.create(name="rock")
+    jazz = await Tag.query.create(name="jazz")
+    await rock.albums.add(first)
+    await rock.albums.add(second)
+    await jazz.albums.add(second)
+
+    query_counter.clear()
+    tags = await Tag.query.order_by("id").prefetch_related(
+        Prefetch(related_name="albums", to_attr="to_albums")
+    )
+
+    assert len(query_counter) == 3
+    assert sorted(album.name for album in tags[0].to_albums) == ["Album 0", "Album 1"]
+    assert [album.name for album in tags[1].to_albums] == ["Album 1"]
+
+
+async def test_prefetch_nested_path_groups_by_parent(query_counter):
+    first, second = await create_albums(2)
+    await Studio.query.create(album=first, name="North")
+    await Studio.query.create(album=second, name="South")
+
+    query_counter.clear()
+    studios = await Studio.query.order_by("id").prefetch_related(
+        Prefetch(related_name="studios__tracks", to_attr="to_tracks")
+    )
+
+    assert len(query_counter) == 3
+    assert [len(studio.to_tracks) for studio in studios] == [1, 2]
+
+
+async def test_prefetch_parents_without_related_rows_get_empty_lists():
+    await Album.query.create(name="Empty")
+
+    albums = await Album.query.prefetch_related(
+        Prefetch(related_name="tracks", to_attr="to_tracks")
+    )
+
+    assert albums[0].to_tracks == []
+
+
+async def test_prefetch_chunks_large_key_sets(monkeypatch):
+    from saffier.conf import settings
+
+    await create_albums(4)
+    monkeypatch.setattr(settings, "prefetch_chunk_size", 3)
+
+    albums = await Album.query.order_by("id").prefetch_related(
+        Prefetch(related_name="tracks", to_attr="to_tracks")
+    )
+
+    assert [len(album.to_tracks) for album in albums] == [1, 2, 3, 4]
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import itertools
+
 import pytest
 import sqlalchemy
 
 import saffier
+from saffier.core.signals import migrate_progress
 from saffier.core.utils.db import with_force_fields_nullable
 from saffier.testclient import DatabaseTestClient as Database
 from tests.settings import DATABASE_URL
@@ -32,6 +35,33 @@ class NullableMigrationUser(saffier.Model):
         registry = models
 
 
+counter = itertools.count(1)
+
+
+class NullableMigrationTicket(saffier.Model):
+    """Model whose forced-nullable field uses a callable default.
+
+    Callable defaults must be evaluated once per row, so the backfill cannot
+    collapse them into a single ``UPDATE`` statement.
+    """
+
+    id = saffier.IntegerField(primary_key=True)
+    code = saffier.IntegerField(default=lambda: next(counter))
+
+    class Meta:
+        registry = models
+
+
+class NullableMigrationCoupon(saffier.Model):
+    """Model keyed by a string so backfill pages cannot be integer ranges."""
+
+    code = saffier.CharField(max_length=20, primary_key=True)
+    serial = saffier.IntegerField(default=lambda: next(counter))
+
+    class Meta:
+        registry = models
+
+
 @pytest.fixture(autouse=True, scope="function")
 async def create_test_database():
     """Create a nullable migration fixture table and drop it afterwards.
@@ -40,7 +70,13 @@ async def create_test_database():
     is emitted. That mirrors migration autogeneration, where Saffier temporarily
     relaxes generated columns without changing the model declaration itself.
     """
-    with with_force_fields_nullable((("NullableMigrationUser", "nickname"),)):
+    with with_force_fields_nullable(
+        (
+            ("NullableMigrationUser", "nickname"),
+            ("NullableMigrationTicket", "code"),
+            ("NullableMigrationCoupon", "serial"),
+        )
+    ):
         await models.create_all()
     yield
     await models.drop_all()
@@ -83,3 +119,118 @@ async def test_registry_backfills_forced_nullable_field_defaults() -> None:
 
     user = await NullableMigrationUser.query.get(id=1)
     assert user.nickname == "anonymous"
+
+
+@pytest.fixture()
+def progress_events():
+    """Collect ``migrate_progress`` payloads sent by the backfill."""
+    events = []
+
+    def receiver(sender, **kwargs):
+        events.append((sender, kwargs))
+
+    migrate_progress.connect(receiver)
+    yield events
+    migrate_progress.disconnect(receiver)
+
+
+async def insert_null_users(total: int, step: int = 1) -> None:
+    async with database as db:
+        await db.execute_many(
+            sqlalchemy.insert(NullableMigrationUser.table),
+            [
+                {"id": index, "name": f"user-{index}", "nickname": None}
+                for index in range(1, total * step + 1, step)
+            ],
+        )
+
+
+async def test_registry_backfills_static_defaults_in_one_statement(progress_events) -> None:
+    """Verify static defaults are written by one set-based update.
+
+    The per-row path would send one ``post_update`` signal per instance; the
+    set-based path updates every matching row with a single statement and
+    reports the affected row count through ``migrate_progress``.
+    """
+    await insert_null_users(5)
+    await NullableMigrationUser.query.filter(id=5).update(nickname="kept")
+
+    await models.apply_default_force_nullable_fields(
+        force_fields_nullable=(("NullableMigrationUser", "nickname"),),
+    )
+
+    nicknames = await NullableMigrationUser.query.order_by("id").values_list(
+        ["nickname"], flat=True
+    )
+    assert nicknames == ["anonymous"] * 4 + ["kept"]
+    assert progress_events == [
+        (
+            "backfill",
+            {"model": "NullableMigrationUser", "fields": ("nickname",), "rows": 4, "total": 4},
+        )
+    ]
+
+
+async def test_registry_backfills_static_defaults_in_primary_key_ranges(progress_events) -> None:
+    """Verify ``batch_size`` splits the update into primary-key pages."""
+    await insert_null_users(7)
+
+    await models.apply_default_force_nullable_fields(
+        force_fields_nullable=(("NullableMigrationUser", "nickname"),),
+        batch_size=3,
+    )
+
+    assert await NullableMigrationUser.query.filter(nickname="anonymous").count() == 7
+    assert [event["rows"] for _, event in progress_events] == [3, 3, 1]
+    assert progress_events[-1][1]["total"] == 7
+
+
+async def test_registry_backfills_callable_defaults_per_row(progress_events) -> None:
+    """Verify callable defaults are evaluated for every backfilled row."""
+    async with database as db:
+        await db.execute_many(
+            sqlalchemy.insert(NullableMigrationTicket.table),
+            [{"id": index, "code": None} for index in range(1, 6)],
+        )
+
+    await models.apply_default_force_nullable_fields(
+        force_fields_nullable=(("NullableMigrationTicket", "code"),),
+        batch_size=2,
+    )
+
+    codes = await NullableMigrationTicket.query.values_list(["code"], flat=True)
+    assert None not in codes
+    assert len(set(codes)) == 5
+    assert [event["rows"] for _, event in progress_events] == [2, 2, 1]
+
+
+async def test_registry_backfills_sparse_primary_keys_per_page(progress_events) -> None:
+    """Verify widely spaced keys still cost one update per ``batch_size`` rows."""
+    await insert_null_users(5, step=1_000_000)
+
+    await models.apply_default_force_nullable_fields(
+        force_fields_nullable=(("NullableMigrationUser", "nickname"),),
+        batch_size=2,
+    )
+
+    assert await NullableMigrationUser.query.filter(nickname="anonymous").count() == 5
+    assert [event["rows"] for _, event in progress_events] == [2, 2, 1]
+
+
+async def test_registry_backfills_string_primary_keys_per_page(progress_events) -> None:
+    """Verify callable defaults page through non-integer primary keys."""
+    async with database as db:
+        await db.execute_many(
+            sqlalchemy.insert(NullableMigrationCoupon.table),
+            [{"code": f"coupon-{letter}", "serial": None} for letter in "edcba"],
+        )
+
+    await models.apply_default_force_nullable_fields(
+        force_fields_nullable=(("NullableMigrationCoupon", "serial"),),
+        batch_size=2,
+    )
+
+    serials = await NullableMigrationCoupon.query.values_list(["serial"], flat=True)
+    assert None not in serials
+    assert len(set(serials)) == 5
+    assert [event["rows"] for _, event in progress_events] == [2, 2, 1]
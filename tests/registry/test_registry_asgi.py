@@ -141,3 +141,92 @@ async def test_registry_asgi_can_return_decorator_factory() -> None:
     await wrapped({"type": "http", "method": "GET", "path": "/"}, receive, send)
 
     assert sent[0]["status"] == 204
+
+
+async def test_saffier_middleware_lifespan_mode_enters_registry_once() -> None:
+    """Verify lifespan mode connects on startup and not per request.
+
+    Requests handled between lifespan startup and shutdown must reuse the
+    registry entered at startup, and the registry must be left once when the
+    server shuts the application down.
+    """
+    from saffier.contrib.lilya import SaffierMiddleware
+
+    registry = TrackingRegistry()
+    seen: list[tuple[str, int]] = []
+
+    async def app(scope, receive, send) -> None:
+        """Echo lifespan messages and record the registry state per request.
+
+        Args:
+            scope: ASGI scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
+        """
+        if scope["type"] != "lifespan":
+            seen.append((scope["type"], registry.entered))
+            return
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            else:
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    middleware = SaffierMiddleware(app, registry=registry, lifespan=True)
+    messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+    sent: list[dict[str, str]] = []
+
+    async def receive() -> dict[str, str]:
+        """Return the next lifespan message, serving requests after startup.
+
+        Returns:
+            dict[str, str]: ASGI lifespan message.
+        """
+        message = next(messages)
+        if message["type"] == "lifespan.shutdown":
+            for _ in range(3):
+                await middleware({"type": "http"}, None, None)
+        return message
+
+    async def send(message: dict[str, str]) -> None:
+        """Collect lifespan messages emitted by the app.
+
+        Args:
+            message: ASGI message emitted by the app.
+        """
+        sent.append(message)
+
+    await middleware({"type": "lifespan"}, receive, send)
+
+    assert seen == [("http", 1)] * 3
+    assert (registry.entered, registry.exited) == (1, 1)
+    assert [message["type"] for message in sent] == [
+        "lifespan.startup.complete",
+        "lifespan.shutdown.complete",
+    ]
+
+
+async def test_saffier_middleware_lifespan_mode_connects_on_first_request() -> None:
+    """Verify lifespan mode still connects when no lifespan events arrive."""
+    from saffier.contrib.lilya import SaffierMiddleware
+
+    registry = TrackingRegistry()
+
+    async def app(scope, receive, send) -> None:
+        """Minimal downstream ASGI app.
+
+        Args:
+            scope: ASGI scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
+        """
+
+    middleware = SaffierMiddleware(app, registry=registry, lifespan=True)
+    for _ in range(2):
+        await middleware({"type": "http"}, None, None)
+    assert (registry.entered, registry.exited) == (1, 0)
+
+    await middleware.shutdown()
+    assert registry.exited == 1
@@ -0,0 +1,97 @@
+import pytest
+
+from saffier.conf import settings
+from saffier.contrib.multi_tenancy import TenantModel, TenantRegistry
+from saffier.contrib.multi_tenancy.utils import table_schema
+from saffier.core.db import fields
+from saffier.core.db.querysets.mixins import with_schema
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = Database(url=DATABASE_URL)
+models = TenantRegistry(database=database)
+
+
+class User(TenantModel):
+    id = fields.IntegerField(primary_key=True)
+    name = fields.CharField(max_length=255)
+
+    class Meta:
+        registry = models
+        is_tenant = True
+        table_prefix = "cache"
+
+
+class Product(TenantModel):
+    id = fields.IntegerField(primary_key=True)
+    name = fields.CharField(max_length=255)
+    user = fields.ForeignKey(User, null=True)
+
+    class Meta:
+        registry = models
+        is_tenant = True
+        table_prefix = "cache"
+
+
+@pytest.fixture(autouse=True)
+def clear_schema_tables():
+    models.schema_table_cache.clear()
+    yield
+    models.schema_table_cache.clear()
+
+
+def test_schema_tables_are_shared_and_counted():
+    user_table = User.table_schema("tenant_a")
+    assert User.table_schema("tenant_a") is user_table
+    assert User._db_schemas["tenant_a"] is user_table
+    assert table_schema(Product, "tenant_a") is Product.table_schema("tenant_a")
+
+    info = models.schema_table_cache.info()
+    assert (info.hits, info.misses) == (2, 2)
+    assert (info.schemas, info.tables) == (1, 2)
+    assert info.columns == len(User.table.columns) + len(Product.table.columns)
+
+
+def test_least_recently_used_schemas_are_evicted(monkeypatch):
+    monkeypatch.setattr(settings, "schema_table_cache_size", 4)
+
+    first = User.table_schema("tenant_a")
+    for schema in ("tenant_a", "tenant_b"):
+        User.table_schema(schema)
+        Product.table_schema(schema)
+    User.table_schema("tenant_a")
+    User.table_schema("tenant_c")
+
+    cache = models.schema_table_cache
+    assert "tenant_b" not in cache
+    assert cache.info().evictions == 1
+    assert cache.info().tables == 3
+    assert User.table_schema("tenant_a") is first
+
+    Product.table_schema("tenant_c")
+    Product.table_schema("tenant_d")
+    assert "tenant_a" not in cache
+    assert User.table_schema("tenant_a") is not first
+
+
+async def test_translate_map_keeps_the_base_table(monkeypatch):
+    monkeypatch.setattr(settings, "use_schema_translate_map", True)
+
+    with with_schema("tenant_a"):
+        assert User.table_schema("tenant_a") is User.table
+        assert User.table_schema("tenant_b") is User.table
+        assert User.table_schema("tenant_b", translate=False).schema == "tenant_b"
+        assert User.query.all().table is User.table
+
+        with database.force_rollback():
+            async with database:
+                async with database._execution_connection() as connection:
+                    options = connection.sync_connection.get_execution_options()
+                    assert options["schema_translate_map"] == {None: "tenant_a"}
+                options = connection.sync_connection.get_execution_options()
+                assert options.get("schema_translate_map") is None
+
+    assert "tenant_a" not in models.schema_table_cache
+    assert "tenant_b" in models.schema_table_cache
@@ -0,0 +1,110 @@
+import pytest
+
+import saffier
+from saffier.conf import settings
+from saffier.core.connection import database as database_module
+from saffier.core.db import with_tenant
+from saffier.core.db.querysets.mixins import with_schema
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+
+class Item(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+        table_prefix = "translate"
+
+
+class Label(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    item = saffier.ForeignKey(Item, on_delete=saffier.CASCADE)
+
+    class Meta:
+        registry = models
+        table_prefix = "translate"
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def translated(monkeypatch):
+    """Record the schema each execution would translate to, and run it untranslated."""
+    monkeypatch.setattr(settings, "use_schema_translate_map", True)
+    schemas = []
+    original = database_module._translated_schema
+
+    def spy():
+        schemas.append(original())
+        return None
+
+    monkeypatch.setattr(database_module, "_translated_schema", spy)
+    return schemas
+
+
+async def test_querysets_keep_the_base_table(translated):
+    tenant_a = Item.query.using(schema="tenant_a").filter(name="a")
+    tenant_b = Item.query.using(schema="tenant_b").filter(name="b")
+
+    assert tenant_a.table is Item.table
+    assert tenant_b.table is Item.table
+    assert tenant_a._statement_cache_key() == tenant_b._statement_cache_key()
+    assert "tenant_a" not in models.schema_table_cache
+
+    with with_tenant("tenant_c"):
+        assert Item.query.filter(name="c").table is Item.table
+
+
+async def test_executions_translate_to_the_queryset_schema(translated):
+    await Item.query.create(name="default")
+    assert translated[-1] is None
+
+    translated.clear()
+    await Item.query.using(schema="tenant_a").filter(name="default").count()
+    assert translated == ["tenant_a"]
+
+    translated.clear()
+    with with_schema("tenant_b"):
+        items = await Item.query.all()
+        assert await Item.query.using(schema="tenant_a").exists()
+    assert [item.name for item in items] == ["default"]
+    assert translated == ["tenant_b", "tenant_a"]
+
+
+async def test_loaded_instances_only_record_their_schema(translated):
+    item = await Item.query.create(name="a")
+    await Label.query.create(item=item)
+
+    queryset = Label.query.using(schema="tenant_a")
+    label = await queryset.get()
+    joined = await queryset.select_related("item").get()
+    partial = await Item.query.using(schema="tenant_a").only("name").get()
+
+    assert "tenant_a" not in models.schema_table_cache
+    for instance in (label, label.item, joined, joined.item, partial):
+        assert instance.__dict__.get("_table") is None
+        assert instance.get_active_instance_schema() == "tenant_a"
+    assert label.table.schema == "tenant_a"
+
+
+async def test_translate_map_is_off_by_default():
+    assert Item.query.using(schema="tenant_a").table.schema == "tenant_a"
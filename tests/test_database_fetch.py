@@ -0,0 +1,100 @@
+import pytest
+import sqlalchemy
+from sqlalchemy.dialects import postgresql
+
+import saffier
+from saffier.core.connection.database import _reverse_ordering
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = Database(DATABASE_URL)
+models = saffier.Registry(database=database)
+
+
+class Note(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    text = saffier.CharField(max_length=100)
+    rank = saffier.IntegerField(null=True)
+
+    class Meta:
+        registry = models
+        table_prefix = "fetch"
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            await Note.query.bulk_create(
+                [{"text": text, "rank": rank} for text, rank in (("a", 3), ("b", 1), ("c", 2))]
+            )
+            yield
+
+
+@pytest.fixture()
+def fetch_all_calls(monkeypatch):
+    calls = []
+    fetch_all = type(database).fetch_all
+
+    async def spy(self, *args, **kwargs):
+        calls.append(args[0])
+        return await fetch_all(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(database), "fetch_all", spy)
+    return calls
+
+
+async def test_single_row_reads_skip_fetch_all(fetch_all_calls):
+    table = Note.table
+    select = sqlalchemy.select(table.c.text)
+
+    assert (await database.fetch_one(select.order_by(table.c.id)))[0] == "a"
+    assert (await database.fetch_one(select.order_by(table.c.id), pos=1))[0] == "b"
+    assert await database.fetch_val(select.order_by(table.c.rank)) == "b"
+    assert await database.fetch_val(select.where(table.c.text == "z")) is None
+    assert await database.fetch_val(select.order_by(table.c.id), column="text", pos=2) == "c"
+
+    assert await Note.query.exists(text="a")
+    assert await Note.query.count() == 3
+    assert (await Note.query.first()).text == "a"
+    assert (await Note.query.order_by("rank").last()).text == "a"
+    assert fetch_all_calls == []
+
+
+async def test_last_row_reverses_the_ordering():
+    table = Note.table
+    select = sqlalchemy.select(table.c.text)
+
+    assert (await database.fetch_one(select.order_by(table.c.id), pos=-1))[0] == "c"
+    assert (await database.fetch_one(select.order_by(table.c.rank.desc()), pos=-1))[0] == "b"
+    assert await database.fetch_val(select.order_by(table.c.rank, table.c.id), pos=-1) == "a"
+
+    reversed_select = _reverse_ordering(select.order_by(table.c.rank.desc(), table.c.id))
+    assert "ORDER BY fetch_notes.rank ASC, fetch_notes.id DESC" in str(reversed_select)
+    assert _reverse_ordering(select) is None
+    assert _reverse_ordering(select.order_by(table.c.id).limit(2)) is None
+    assert _reverse_ordering(select.order_by(table.c.rank.desc().nulls_last())) is None
+    assert _reverse_ordering(select.order_by(sqlalchemy.text("id"))) is None
+    assert _reverse_ordering(select.order_by(table.c.id).distinct()) is None
+    assert (
+        _reverse_ordering(
+            select.order_by(table.c.rank, table.c.id).ext(postgresql.distinct_on(table.c.rank))
+        )
+        is None
+    )
+    assert await database.fetch_val(select.order_by(table.c.text).distinct(), pos=-1) == "c"
+
+    text = "SELECT text FROM fetch_notes ORDER BY id"
+    assert (await database.fetch_one(text, pos=-1))[0] == "c"
+    assert await database.fetch_one(select.where(table.c.text == "z"), pos=-1) is None
+    with pytest.raises(NotImplementedError):
+        await database.fetch_one(select, pos=-2)
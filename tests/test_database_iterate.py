@@ -0,0 +1,108 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+import saffier
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(DATABASE_URL, force_rollback=False)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class User(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    async with models:
+        await User.query.bulk_create([{"name": f"user-{index}"} for index in range(25)])
+        yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+def stream_iterations(monkeypatch):
+    # SQLite only streams outside transactions once opted in.
+    monkeypatch.setattr(database, "stream_iterations", True)
+
+
+@pytest.fixture()
+def stream_calls(monkeypatch):
+    calls = []
+    stream = AsyncConnection.stream
+
+    def spy(self, *args, **kwargs):
+        calls.append(self.in_transaction())
+        return stream(self, *args, **kwargs)
+
+    monkeypatch.setattr(AsyncConnection, "stream", spy)
+    return calls
+
+
+async def test_iterate_streams_outside_transactions(stream_calls):
+    rows = [
+        row async for row in database.iterate(User.table.select().order_by("id"), chunk_size=10)
+    ]
+
+    assert len(rows) == 25
+    assert rows[0].name == "user-0"
+    assert stream_calls == [True]
+
+
+async def test_batched_iterate_streams_partitions(stream_calls):
+    batches = [
+        batch async for batch in database.batched_iterate(User.table.select(), batch_size=10)
+    ]
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert stream_calls == [True]
+
+
+async def test_queryset_iteration_streams(stream_calls):
+    names = [user.name async for user in User.query.order_by("id").batch_size(7)]
+
+    assert names == [f"user-{index}" for index in range(25)]
+    assert len(stream_calls) == 1
+
+
+async def test_iterate_inside_transaction_uses_bound_connection(stream_calls):
+    async with database.transaction():
+        await User.query.create(name="in-transaction")
+        names = [row.name async for row in database.iterate(User.table.select())]
+
+    assert "in-transaction" in names
+    assert stream_calls == [True]
+
+
+async def test_interrupted_iteration_releases_the_connection():
+    async for _ in database.iterate(User.table.select(), chunk_size=5):
+        break
+
+    await User.query.create(name="after")
+    assert await User.query.filter(name="after").exists()
+
+
+async def test_iterate_streams_by_default_except_on_sqlite(stream_calls, monkeypatch):
+    monkeypatch.setattr(database, "stream_iterations", None)
+
+    rows = [row async for row in database.iterate(User.table.select(), chunk_size=10)]
+
+    assert len(rows) == 25
+    assert stream_calls == ([] if database.url.dialect == "sqlite" else [True])
+
+
+async def test_iterate_can_materialize_outside_transactions(stream_calls, monkeypatch):
+    monkeypatch.setattr(database, "stream_iterations", False)
+
+    rows = [row async for row in database.iterate(User.table.select(), chunk_size=10)]
+
+    assert len(rows) == 25
+    assert stream_calls == []
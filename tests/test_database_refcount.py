@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from saffier import Database
+
+pytestmark = pytest.mark.anyio
+
+
+class FailingLock:
+    async def __aenter__(self):
+        raise AssertionError("ref_lock taken while connected")
+
+    async def __aexit__(self, *args):
+        return None
+
+
+async def test_connected_database_skips_the_ref_lock():
+    database = Database("sqlite+aiosqlite:///refcount.db")
+    assert await database.connect() is True
+    lock, database.ref_lock = database.ref_lock, FailingLock()
+
+    for _ in range(3):
+        async with database:
+            assert database.ref_counter == 2
+    assert database.ref_counter == 1
+    assert database.is_connected
+
+    database.ref_lock = lock
+    assert await database.disconnect() is True
+    assert not database.is_connected
+    assert database.ref_counter == 0
+
+
+async def test_concurrent_connects_wait_for_the_setup(monkeypatch):
+    database = Database(
+        "sqlite+aiosqlite:///refcount.db",
+        force_rollback=True,
+        replicas=["sqlite+aiosqlite:///refcount.db"],
+    )
+    replica = database.replicas[0]
+    opened = []
+    original = type(database)._ensure_global_force_rollback
+
+    async def ensure_global_force_rollback(self):
+        await asyncio.sleep(0)
+        if self._global_connection is None:
+            opened.append(self)
+        return await original(self)
+
+    monkeypatch.setattr(
+        type(database), "_ensure_global_force_rollback", ensure_global_force_rollback
+    )
+
+    async def connect_and_check():
+        await database.connect()
+        assert replica.is_connected
+
+    await asyncio.gather(*(connect_and_check() for _ in range(3)))
+    assert database.ref_counter == 3
+    assert opened == [database]
+
+    for _ in range(3):
+        await database.disconnect()
+    assert not database.is_connected
+    assert not replica.is_connected
+
+
+async def test_failed_connect_keeps_waiting_references(monkeypatch):
+    database = Database(
+        "sqlite+aiosqlite:///refcount.db",
+        replicas=["sqlite+aiosqlite:///refcount.db"],
+    )
+    replica = database.replicas[0]
+    failures = []
+
+    async def connect_hook(self):
+        if self is not replica:
+            return
+        await asyncio.sleep(0)
+        if not failures:
+            failures.append(self)
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(type(database), "connect_hook", connect_hook)
+
+    results = await asyncio.gather(database.connect(), database.connect(), return_exceptions=True)
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] is True
+    assert database.ref_counter == 1
+    assert replica.is_connected
+
+    assert await database.disconnect() is True
+    assert database.ref_counter == 0
+    assert not replica.is_connected
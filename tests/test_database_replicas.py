@@ -0,0 +1,140 @@
+import asyncio
+import types
+
+import pytest
+
+import saffier
+from saffier import Database as BaseDatabase
+from saffier.core.connection import replicas as replicas_module
+from saffier.core.connection import track_writes
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_ALTERNATIVE_URL, DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = Database(DATABASE_URL, replicas=[Database(DATABASE_ALTERNATIVE_URL)])
+replica = database.replicas[0]
+models = saffier.Registry(database=database)
+
+
+class Note(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    text = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+        table_prefix = "replicas"
+
+
+@pytest.fixture(autouse=True)
+async def create_test_database():
+    async with database:
+        await models.create_all()
+        await replica.create_all(models.metadata)
+        yield
+        await replica.drop_all(models.metadata)
+        await models.drop_all()
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    now = types.SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(
+        replicas_module, "time", types.SimpleNamespace(monotonic=lambda: now.value)
+    )
+    return now
+
+
+async def texts() -> list[str]:
+    return [note.text for note in await Note.query.order_by("id")]
+
+
+async def test_reads_go_to_the_replica_and_writes_to_the_primary(clock):
+    await Note.query.create(text="primary")
+    await replica.execute(Note.table.insert().values(text="replica"))
+
+    assert await texts() == ["primary"]
+
+    clock.value += 2
+    assert await texts() == ["replica"]
+    assert await Note.query.count() == 1
+    assert (await Note.query.get()).text == "replica"
+    assert await Note.query.values_list("text", flat=True) == ["replica"]
+
+    async with database.transaction():
+        assert await texts() == ["primary"]
+    assert await Note.query.select_for_update().exists()
+
+
+async def test_read_your_writes_window(clock):
+    await Note.query.create(text="primary")
+    clock.value += 0.5
+    assert await texts() == ["primary"]
+
+    database.router.read_your_writes = None
+    try:
+        await Note.query.create(text="again")
+        assert await texts() == []
+    finally:
+        database.router.read_your_writes = 1.0
+
+
+async def test_track_writes_shares_the_window_with_child_tasks(clock):
+    await asyncio.create_task(Note.query.create(text="primary"))
+    assert await texts() == []
+
+    with track_writes():
+        await asyncio.gather(Note.query.create(text="again"))
+        assert await texts() == ["primary", "again"]
+
+    clock.value += 2
+    assert await texts() == []
+
+
+async def test_strategies_spread_reads():
+    primary = BaseDatabase(
+        "sqlite+aiosqlite:///primary.db",
+        replicas=["sqlite+aiosqlite:///one.db", "sqlite+aiosqlite:///two.db"],
+    )
+    one, two = primary.replicas
+    router = primary.router
+
+    assert [await router.choose() for _ in range(3)] == [one, two, one]
+
+    router.strategy = "least_outstanding"
+    async with router.route() as first, router.route() as second:
+        assert {first, second} == {one, two}
+        assert router.outstanding == {id(one): 1, id(two): 1}
+    assert router.outstanding == {id(one): 0, id(two): 0}
+
+    with pytest.raises(ValueError):
+        BaseDatabase("sqlite+aiosqlite:///primary.db", replicas=[one], replica_strategy="random")
+
+
+async def test_lagging_replicas_leave_the_rotation(monkeypatch):
+    primary = BaseDatabase(
+        "sqlite+aiosqlite:///primary.db",
+        replicas=["sqlite+aiosqlite:///one.db", "sqlite+aiosqlite:///two.db"],
+        replica_max_lag=5,
+        replica_lag_probe_interval=0,
+    )
+    one, two = primary.replicas
+    lags = {id(one): 10.0, id(two): 1.0}
+
+    async def fake_lag(replica):
+        lag = lags[id(replica)]
+        if lag is None:
+            raise ConnectionError("replica is down")
+        return lag
+
+    for item in (one, two):
+        monkeypatch.setattr(item, "replica_lag", fake_lag.__get__(item))
+
+    assert [await primary.router.choose() for _ in range(3)] == [two, two, two]
+
+    lags[id(two)] = None
+    assert await primary.router.choose() is primary
+    assert await primary.probe_replicas() == {id(one): 10.0, id(two): float("inf")}
+
+    lags[id(one)] = 0.0
+    assert await primary.router.choose() is one
@@ -0,0 +1,118 @@
+import time
+
+import pytest
+import sqlalchemy
+
+import saffier
+from saffier.core.connection import database as database_module
+from saffier.core.connection import query_deadline
+from saffier.core.connection.timeouts import remaining_time
+from saffier.exceptions import QueryTimeoutError
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = Database(DATABASE_URL, query_timeout=30)
+models = saffier.Registry(database=database)
+
+SLOW = sqlalchemy.text(
+    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 100000000) "
+    "SELECT count(*) FROM c"
+)
+
+
+class Note(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    text = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+        table_prefix = "timeouts"
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    async with database:
+        await models.create_all()
+        yield
+        await models.drop_all()
+
+
+@pytest.fixture()
+def timeouts(monkeypatch):
+    """Record the timeout every execution resolves to."""
+    seen = []
+    limit_statement = database_module.limit_statement
+
+    def spy(connection, timeout, **kwargs):
+        seen.append(timeout)
+        return limit_statement(connection, timeout, **kwargs)
+
+    monkeypatch.setattr(database_module, "limit_statement", spy)
+    return seen
+
+
+async def test_slow_statements_are_cancelled():
+    started = time.monotonic()
+    with pytest.raises(QueryTimeoutError):
+        await database.fetch_all(SLOW, timeout=0.05)
+    assert time.monotonic() - started < 5
+
+    assert await database.fetch_val(sqlalchemy.text("SELECT 1")) == 1
+
+    with pytest.raises(QueryTimeoutError):
+        async for _ in database.iterate(SLOW, timeout=0.05):
+            pass
+
+
+async def test_queryset_timeouts_override_the_database_default(timeouts):
+    await Note.query.create(text="a")
+
+    await Note.query.all()
+    await Note.query.timeout(2).filter(text="a").count()
+    assert timeouts == [30, 30, 2]
+
+    timeouts.clear()
+    await database.fetch_all(Note.table.select(), timeout=1)
+    assert timeouts == [1]
+
+
+async def test_query_deadline_is_shared_by_the_block(timeouts):
+    with query_deadline(1):
+        await Note.query.timeout(2).all()
+        with query_deadline(10):
+            await Note.query.all()
+    assert all(timeout <= 1 for timeout in timeouts)
+    assert remaining_time() is None
+
+    with query_deadline(0), pytest.raises(QueryTimeoutError):
+        await Note.query.all()
+
+
+async def test_middleware_binds_a_deadline_per_request():
+    from saffier.contrib.lilya import SaffierMiddleware
+
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(remaining_time())
+
+    await SaffierMiddleware(app, query_deadline=5)({"type": "http"}, None, None)
+    assert 0 < seen[0] <= 5
+    assert remaining_time() is None
+
+
+async def test_iterations_stream_under_a_timeout(timeouts, monkeypatch):
+    monkeypatch.setattr(database, "stream_iterations", True)
+    await Note.query.bulk_create([{"text": text} for text in ("a", "b", "c")])
+    timeouts.clear()
+
+    texts = [note.text async for note in Note.query.order_by("id").batch_size(2)]
+    assert texts == ["a", "b", "c"]
+    assert [note.text async for note in Note.query.timeout(5).filter(text="b")] == ["b"]
+    with query_deadline(5):
+        assert len([note async for note in Note.query.all()]) == 3
+    assert timeouts[:2] == [30, 5]
+
+    assert await database.fetch_val(sqlalchemy.text("SELECT 1")) == 1